@@ -10,6 +10,7 @@ from ttkbootstrap import Window
 import sys
 import os
 import locale
+import multiprocessing
 
 # 한글 인코딩 설정 - WSL 환경 고려
 try:
@@ -32,6 +33,8 @@ except locale.Error as e:
 sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
 
 if __name__ == "__main__":
+    # PyInstaller exe 에서 spawn 으로 띄운 작업 프로세스가 앱을 다시 실행하지 않도록 가장 먼저 호출
+    multiprocessing.freeze_support()
 
     # Ttkbootstrap Window 명시적 사용
     root = ttk.Window(themename="flatly")
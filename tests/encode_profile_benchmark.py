@@ -0,0 +1,67 @@
+import os
+import sys
+import time
+import argparse
+import tempfile
+import contextlib
+import io
+
+# 저장소 루트에서 `python tests/encode_profile_benchmark.py <video>` 로 실행할 수 있도록 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.extract.image_extractor import ImageExtractor  # noqa: E402
+from utils.extract.encode_profile import EncodeProfile  # noqa: E402
+
+
+def run_benchmark(video_path, start=0.0, length=5.0, presets=None, ffmpeg_executable='ffmpeg'):
+    """프리셋별로 같은 구간을 이미지로 추출해 인코딩 시간/크기 비교
+
+    OpenCV 경로는 FramePipeline 통계(인코딩 ms/장, 바이트/장)를, ffmpeg 폴백은
+    전체 시간과 파일 크기를 측정한다.
+    """
+    presets = presets or list(EncodeProfile.PRESETS)
+    print(f"=== 인코딩 프로파일 벤치마크: {os.path.basename(video_path)} "
+          f"({start:.1f}~{start + length:.1f}초) ===")
+    print(f"{'프로파일':<16}{'형식':<20}{'장수':>6}{'ms/장':>9}{'KB/장':>9}"
+          f"{'전체(s)':>9}{'ffmpeg KB/장':>14}")
+
+    results = {}
+    for name in presets:
+        profile = EncodeProfile.preset(name)
+        with tempfile.TemporaryDirectory() as work_dir:
+            started = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                result = ImageExtractor.extract_frames_from_video(
+                    video_path, work_dir, start, start + length,
+                    decoder='opencv', encode_profile=profile)
+            total = time.perf_counter() - started
+            stats = result['encode_stats']
+
+        ffmpeg_kb = None
+        with tempfile.TemporaryDirectory() as work_dir:
+            with contextlib.redirect_stdout(io.StringIO()):
+                ff_result = ImageExtractor.extract_frames_with_ffmpeg(
+                    video_path, work_dir, start, start + length,
+                    ffmpeg_executable=ffmpeg_executable, encode_profile=profile)
+            if ff_result.get('success') and ff_result.get('extracted_count'):
+                size = sum(os.path.getsize(os.path.join(work_dir, f))
+                           for f in os.listdir(work_dir))
+                ffmpeg_kb = size / ff_result['extracted_count'] / 1024
+
+        results[name] = (stats, total, ffmpeg_kb)
+        ffmpeg_text = f"{ffmpeg_kb:>14.1f}" if ffmpeg_kb is not None else f"{'실패':>14}"
+        print(f"{name:<16}{profile.describe():<20}{stats['frames']:>6}"
+              f"{stats['encode_ms_per_frame']:>9.2f}{stats['bytes_per_frame'] / 1024:>9.1f}"
+              f"{total:>9.2f}{ffmpeg_text}")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="이미지 인코딩 프로파일 벤치마크")
+    parser.add_argument('video', help="테스트 비디오 경로")
+    parser.add_argument('--start', type=float, default=0.0, help="구간 시작(초)")
+    parser.add_argument('--length', type=float, default=5.0, help="구간 길이(초)")
+    parser.add_argument('--ffmpeg', default='ffmpeg', help="ffmpeg 실행 경로")
+    parser.add_argument('--presets', nargs='*', help="비교할 프리셋 (기본: 전체)")
+    args = parser.parse_args()
+    run_benchmark(args.video, args.start, args.length, args.presets, args.ffmpeg)
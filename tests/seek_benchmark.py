@@ -0,0 +1,84 @@
+import os
+import sys
+import time
+import argparse
+import subprocess
+import tempfile
+
+# 저장소 루트에서 `python tests/seek_benchmark.py <video>` 로 실행할 수 있도록 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.utils import VideoUtils  # noqa: E402
+from utils.extract.video_extractor import VideoExtractor  # noqa: E402
+
+
+def measure(command):
+    """ffmpeg 실행 후 (첫 출력까지 걸린 시간, 전체 시간) 반환
+
+    첫 출력 시점은 -progress 출력의 out_time_us 가 처음 0보다 커진 순간으로 본다.
+    """
+    command = [command[0], '-progress', 'pipe:1', '-nostats'] + command[1:]
+    started = time.perf_counter()
+    first_output = None
+
+    process = subprocess.Popen(
+        command, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+        text=True, encoding='utf-8', errors='ignore')
+    for line in process.stdout:
+        if first_output is None and line.startswith('out_time_us='):
+            try:
+                if int(line.split('=', 1)[1]) > 0:
+                    first_output = time.perf_counter() - started
+            except ValueError:
+                pass
+    process.wait()
+    total = time.perf_counter() - started
+
+    if process.returncode != 0:
+        raise RuntimeError(f"ffmpeg 실패 (코드 {process.returncode})")
+    return first_output if first_output is not None else total, total
+
+
+def run_benchmark(video_path, ffmpeg_executable='ffmpeg', segment_length=5.0,
+                  positions=(0.1, 0.5, 0.9)):
+    """영상의 여러 위치에서 같은 길이 구간을 탐색 방식별로 추출해 시간 비교"""
+    info = VideoUtils.get_opencv_video_info(video_path)
+    if not info:
+        raise IOError(f"비디오 정보를 읽을 수 없습니다: {video_path}")
+    duration = info['duration']
+
+    print(f"=== 탐색 방식 벤치마크: {os.path.basename(video_path)} "
+          f"({duration:.1f}초, 구간 {segment_length:.1f}초) ===")
+    print(f"{'방식':<8}{'위치':>10}{'첫 출력(s)':>14}{'전체(s)':>12}")
+
+    results = {}
+    with tempfile.TemporaryDirectory() as work_dir:
+        output_path = os.path.join(work_dir, 'segment.mp4')
+        for seek_mode in VideoExtractor.SEEK_MODES:
+            for ratio in positions:
+                start = max(0.0, min(duration - segment_length,
+                                     duration * ratio))
+                command = VideoExtractor.build_ffmpeg_command(
+                    video_path, output_path, f"{start:.3f}",
+                    f"{start + segment_length:.3f}",
+                    ffmpeg_executable=ffmpeg_executable, seek_mode=seek_mode)
+                first, total = measure(command)
+                results[(seek_mode, ratio)] = (first, total)
+                print(f"{seek_mode:<8}{start:>9.1f}s{first:>14.2f}{total:>12.2f}")
+
+    # 입력측 탐색은 위치와 무관하게 첫 출력 시간이 거의 일정해야 함
+    for seek_mode in VideoExtractor.SEEK_MODES:
+        firsts = [results[(seek_mode, r)][0] for r in positions]
+        print(f"{seek_mode}: 첫 출력 시간 편차 (최대-최소) = "
+              f"{max(firsts) - min(firsts):.2f}s")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="비디오 구간 추출 탐색 방식 벤치마크")
+    parser.add_argument('video', help="긴 테스트 비디오 경로")
+    parser.add_argument('--ffmpeg', default='ffmpeg', help="ffmpeg 실행 경로")
+    parser.add_argument('--length', type=float, default=5.0,
+                        help="추출 구간 길이(초)")
+    args = parser.parse_args()
+    run_benchmark(args.video, args.ffmpeg, args.length)
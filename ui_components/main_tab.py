@@ -1,4 +1,6 @@
 import os
+import threading
+import numpy as np
 import tkinter as tk
 import ttkbootstrap as ttk  # ttkbootstrap으로 변경
 from ttkbootstrap.constants import *  # Bootstrap 스타일 상수들
@@ -12,6 +14,9 @@ from utils.utils import VideoUtils
 from utils.styles import AppStyles
 from utils.vlc_utils import VLCPlayer
 from utils.event_system import event_system, Events
+from utils.waveform import WaveformEnvelope
+from utils.activity_detector import ActivityDetector
+from utils.ffmpeg_manager import FFmpegManager
 
 
 class MainTab(BaseTab):
@@ -49,6 +54,11 @@ class MainTab(BaseTab):
         # 슬라이더 드래그 상태 변수
         self.is_slider_dragging = False
 
+        # 오디오 파형 (WaveformEnvelope) 과 불러오는 중인 파일/취소 이벤트
+        self.waveform = None
+        self._waveform_path = None
+        self._waveform_cancel = None
+
         # 참조 위젯 변수들
         self.videofile_label = None
         self.videofile_entry = None
@@ -56,6 +66,7 @@ class MainTab(BaseTab):
         self.video_info_label = None
         self.video_label = None
         self.position_slider = None
+        self.waveform_canvas = None
         self.slider_label = None
         self.play_button = None
         self.stop_button = None
@@ -204,6 +215,12 @@ class MainTab(BaseTab):
 
     def create_slider_section(self):
         """슬라이더 섹션 생성 (slider_frame 내에 배치)"""
+        # 오디오 파형 - 슬라이더와 같은 시간축으로 바로 위에 그려 소리가 있는 위치를 표시
+        self.waveform_canvas = tk.Canvas(
+            self.slider_frame, height=36, bg="#1f2430", highlightthickness=0)
+        self.waveform_canvas.pack(fill=tk.X, pady=(0, 2))
+        self.waveform_canvas.bind('<Configure>', lambda event: self._draw_waveform())
+
         # 비디오 전체구간 슬라이더 생성
         self.progress_variable = tk.DoubleVar()
         self.position_slider = ttk.Scale(self.slider_frame,
@@ -234,6 +251,63 @@ class MainTab(BaseTab):
             self.position_slider.config(to=duration)
             self.progress_variable.set(0)
 
+    def _load_waveform(self, video_path):
+        """오디오 파형 요약을 백그라운드에서 불러와 그림 (캐시가 없으면 ffmpeg 로 한 번 디코딩)"""
+        if not video_path or video_path == self._waveform_path:
+            return
+        if self._waveform_cancel is not None:
+            self._waveform_cancel.set()  # 이전 파일 디코딩 중단
+        cancel_event = threading.Event()
+        self._waveform_cancel = cancel_event
+        self._waveform_path = video_path
+        self.waveform = None
+        self._draw_waveform()
+
+        def load():
+            ffmpeg_executable = FFmpegManager().ffmpeg_path or 'ffmpeg'
+            envelope = WaveformEnvelope.load(video_path, ffmpeg_executable, cancel_event)
+            if not cancel_event.is_set():
+                self.root.after(0, lambda: self._on_waveform_loaded(video_path, envelope))
+
+        threading.Thread(target=load, daemon=True).start()
+
+    def _on_waveform_loaded(self, video_path, envelope):
+        """(메인 스레드) 파형 로드 완료 - 그 사이 다른 파일을 열었으면 무시"""
+        if video_path != self._waveform_path:
+            return
+        self.waveform = envelope
+        self._draw_waveform()
+
+    def _draw_waveform(self):
+        """캐시된 파형 요약을 캔버스 폭에 맞춰 그림 - 계산량은 픽셀 수에 비례"""
+        canvas = self.waveform_canvas
+        if canvas is None:
+            return
+        canvas.delete('waveform')
+        width, height = canvas.winfo_width(), canvas.winfo_height()
+        if self.waveform is None or width <= 1:
+            return
+
+        duration = self.waveform.duration
+        if hasattr(self.app, 'vlc_player') and self.app.vlc_player and \
+                self.app.vlc_player.duration > 0:
+            duration = self.app.vlc_player.duration  # 슬라이더와 같은 시간축
+        mins, maxs, rms = self.waveform.columns(width, 0.0, duration)
+        # 가장 큰 소리가 높이를 채우도록 정규화
+        peak = max(float(maxs.max()), float(-mins.min()), 1e-3)
+        middle, half = height / 2, (height - 2) / 2
+        xs = np.arange(width)
+
+        def band(upper, lower):
+            # 위쪽 경계는 왼→오, 아래쪽 경계는 오→왼으로 이어 다각형 하나로 그림
+            points = np.concatenate([
+                np.column_stack([xs, middle - upper / peak * half]).ravel(),
+                np.column_stack([xs[::-1], middle - lower[::-1] / peak * half]).ravel()])
+            return points.tolist()
+
+        canvas.create_polygon(band(maxs, mins), fill="#4f6d8f", outline="", tags='waveform')
+        canvas.create_polygon(band(rms, -rms), fill="#9cc3e6", outline="", tags='waveform')
+
     def _on_slider_click(self, event):
         """슬라이더 클릭 시 - 드래그 시작 - VLC 기반"""
         self.is_slider_dragging = True
@@ -411,6 +485,75 @@ class MainTab(BaseTab):
         )
         self.preview_button.pack(pady=5, padx=5, fill=tk.X, expand=True)
 
+        # 소리가 있는 구간을 찾아 구간 후보로 제안
+        self.detect_activity_button = ttk.Button(
+            self.save_action_frame,
+            text="자동 구간 찾기",
+            style='3Pastel.TButton',
+            command=self.on_detect_activity_click
+        )
+        self.detect_activity_button.pack(pady=5, padx=5, fill=tk.X, expand=True)
+
+    def on_detect_activity_click(self):
+        """자동 구간 찾기 버튼 클릭 시 - 백그라운드에서 활동 구간 분석"""
+        video_path = getattr(self.app, 'video_path', None)
+        if not video_path:
+            messagebox.showwarning("경고", "먼저 비디오 파일을 선택해주세요.")
+            return
+
+        self.detect_activity_button.config(state=tk.DISABLED, text="구간 찾는 중...")
+        detector = ActivityDetector()
+
+        def detect():
+            try:
+                proposals = detector.detect(video_path, FFmpegManager().ffmpeg_path or 'ffmpeg')
+            except Exception as e:
+                print(f"MainTab: 활동 구간 분석 실패 - {e}")
+                proposals = None
+            self.root.after(
+                0, lambda: self._on_activity_detected(video_path, proposals, detector.stats))
+
+        threading.Thread(target=detect, daemon=True).start()
+
+    def _on_activity_detected(self, video_path, proposals, stats):
+        """(메인 스레드) 분석 결과를 보여 주고 확인하면 구간 목록에 추가"""
+        self.detect_activity_button.config(state=tk.NORMAL, text="자동 구간 찾기")
+        if proposals is None:
+            messagebox.showerror("오류", "활동 구간 분석에 실패했습니다.")
+            return
+        if not proposals:
+            messagebox.showinfo("💡알림", "소리가 있는 구간을 찾지 못했습니다.")
+            return
+
+        lines = [f"{VideoUtils.format_time(start)} ~ {VideoUtils.format_time(end)}"
+                 for start, end in proposals[:10]]
+        if len(proposals) > 10:
+            lines.append(f"... 외 {len(proposals) - 10}개")
+        if not messagebox.askyesno(
+                "자동 구간 제안",
+                f"{len(proposals)}개 구간을 찾았습니다 "
+                f"({stats.get('realtime', 0):.0f}배속 분석).\n\n" + "\n".join(lines) +
+                "\n\n구간 목록에 추가할까요?"):
+            return
+
+        added = 0
+        for start, end in proposals:
+            segment_data = self.app.create_segment_data(video_path, start, end, end - start)
+            # save_segment 와 같은 기준(0.1초)으로 이미 저장된 구간은 건너뜀
+            if any(existing['file'] == segment_data['file'] and
+                   abs(existing['start'] - start) < 0.1 and abs(existing['end'] - end) < 0.1
+                   for existing in self.app.saved_segments):
+                continue
+            self.app.saved_segments.append(segment_data)
+            event_system.emit(Events.SEGMENT_SAVED, **segment_data)
+            added += 1
+        if added < len(proposals):
+            print(f"자동 구간 {len(proposals) - added}개는 이미 저장되어 있어 건너뜀")
+        if not added:
+            messagebox.showinfo("💡알림", "이미 동일한 구간이 저장되어 있습니다.")
+            return
+        self.app.update_all_tables()
+
     def on_preview_click(self):
         """선택구간 미리보기 버튼 클릭 시"""
         # 구간 유효성 검사 후 미리보기 실행
@@ -460,6 +603,9 @@ class MainTab(BaseTab):
                     int(self.app.vlc_player.duration))
                 self.slider_label.config(text=f"00:00:00 / {total_time}")
 
+        # 오디오 파형 (파일이 바뀐 경우에만 다시 불러옴)
+        self._load_waveform(getattr(self.app, 'video_path', None))
+
         # 비디오가 새로 로드된 경우에만 플레이어 상태 이벤트 발생
         # (슬라이더 등에서 emit한 상태를 덮어쓰지 않도록 조건부 처리)
         if not hasattr(self, '_video_info_updated') or not self._video_info_updated:
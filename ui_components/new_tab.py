@@ -4,6 +4,7 @@ from ttkbootstrap.constants import *
 from tkinter import messagebox, filedialog
 import os
 import cv2
+from PIL import Image, ImageTk
 from datetime import datetime
 import threading
 from .base_tab import BaseTab
@@ -55,6 +56,8 @@ class NewTab(BaseTab):
 
         # 취소 이벤트 (백그라운드 작업 중단용)
         self.cancel_event = threading.Event()
+        # 마지막으로 시작한 추출의 작업 목록 ('작업 취소' 대상)
+        self._current_jobs = []
 
         # 성능 최적화 관련 속성
         self.target_fps = 30
@@ -254,6 +257,16 @@ class NewTab(BaseTab):
         self.video_extract_button.pack(
             pady=5, padx=5, fill=ttk.X, expand=True)
 
+        # 전체 구간 비디오 일괄 추출 버튼 (3Pastel 스타일)
+        self.batch_video_extract_button = ttk.Button(
+            button_frame,
+            text="전체 구간 비디오 추출",
+            style='3Pastel.TButton',
+            command=self.on_extract_all_videos
+        )
+        self.batch_video_extract_button.pack(
+            pady=5, padx=5, fill=ttk.X, expand=True)
+
         # 이미지 추출 버튼 (3Pastel 스타일)
         self.image_extract_button = ttk.Button(
             button_frame,
@@ -263,6 +276,16 @@ class NewTab(BaseTab):
         )
         self.image_extract_button.pack(pady=5, padx=5, fill=ttk.X, expand=True)
 
+        # 전체 구간 이미지 일괄 추출 버튼 (3Pastel 스타일)
+        self.batch_image_extract_button = ttk.Button(
+            button_frame,
+            text="전체 구간 이미지 추출",
+            style='3Pastel.TButton',
+            command=self.on_extract_all_images
+        )
+        self.batch_image_extract_button.pack(
+            pady=5, padx=5, fill=ttk.X, expand=True)
+
         # 오디오 추출 버튼 (3Pastel 스타일)
         self.audio_extract_button = ttk.Button(
             button_frame,
@@ -272,6 +295,16 @@ class NewTab(BaseTab):
         )
         self.audio_extract_button.pack(pady=5, padx=5, fill=ttk.X, expand=True)
 
+        # 전체 구간 오디오 일괄 추출 버튼 (3Pastel 스타일)
+        self.batch_audio_extract_button = ttk.Button(
+            button_frame,
+            text="전체 구간 오디오 추출",
+            style='3Pastel.TButton',
+            command=self.on_extract_all_audio
+        )
+        self.batch_audio_extract_button.pack(
+            pady=5, padx=5, fill=ttk.X, expand=True)
+
         # 취소 버튼 (3Pastel 스타일) - 초기 상태: 비활성화
         self.cancel_button = ttk.Button(
             button_frame,
@@ -282,6 +315,16 @@ class NewTab(BaseTab):
         )
         self.cancel_button.pack(pady=5, padx=5, fill=ttk.X, expand=True)
 
+        # 모든 작업 취소 버튼 (3Pastel 스타일) - 대기/실행 중인 작업 전체 취소
+        self.cancel_all_button = ttk.Button(
+            button_frame,
+            text="모든 작업 취소",
+            style='3Pastel.TButton',
+            command=self.on_extraction_cancel_all,
+            state=tk.DISABLED
+        )
+        self.cancel_all_button.pack(pady=5, padx=5, fill=ttk.X, expand=True)
+
     def create_progress_controls(self):
         """가장 아래에 작업 진행률 생성"""
         # 진행률 영역 컨테이너 (가변 높이)
@@ -416,6 +459,28 @@ class NewTab(BaseTab):
                                  )
         example_text.pack(fill=ttk.X, pady=(10, 5), anchor="w")
 
+        # 비디오 컷 모드 선택
+        cut_mode_row = ttk.Frame(mp4_frame)
+        cut_mode_row.pack(fill=ttk.X, pady=(10, 5))
+        cut_mode_label = ttk.Label(cut_mode_row,
+                                   text="추출 방식:",
+                                   font=("Arial", 9)
+                                   )
+        cut_mode_label.pack(side=ttk.LEFT)
+
+        self.cut_mode_var = tk.StringVar(
+            value=self._cut_mode_labels()[self.extraction_manager.extract_config.cut_mode])
+        self.cut_mode_combo = ttk.Combobox(cut_mode_row,
+                                           textvariable=self.cut_mode_var,
+                                           values=list(
+                                               self._cut_mode_labels().values()),
+                                           state="readonly",
+                                           width=28
+                                           )
+        self.cut_mode_combo.pack(side=ttk.LEFT, padx=(5, 0))
+        self.cut_mode_combo.bind(
+            "<<ComboboxSelected>>", self.on_cut_mode_selected)
+
         # 구분선
         separator2 = ttk.Separator(
             self.setting_help_freme, orient="horizontal")
@@ -473,20 +538,49 @@ class NewTab(BaseTab):
                                   )
         save_location.pack(fill=ttk.X, pady=(10, 5), anchor="w")
 
+    @staticmethod
+    def _cut_mode_labels():
+        """컷 모드 → 콤보박스 표시 문자열"""
+        return {
+            'reencode': "재인코딩 (정확, 느림)",
+            'copy': "빠른 자르기 (키프레임 기준)",
+            'auto': "자동 (키프레임 맞으면 빠른 자르기)",
+            'smart': "스마트 컷 (경계만 재인코딩, 정확)",
+        }
+
+    def on_cut_mode_selected(self, event=None):
+        """콤보박스에서 선택한 컷 모드를 추출 설정에 반영"""
+        selected = self.cut_mode_var.get()
+        for mode, label in self._cut_mode_labels().items():
+            if label == selected:
+                self.extraction_manager.extract_config.set_cut_mode(mode)
+                print(f"비디오 컷 모드 변경: {mode}")
+                break
+
 # ===== 추출 시작 메서드 =====
 
     def on_extract_video(self):
         """구간 추출 시작"""
         segments = self.app.get_saved_segments()
         if segments:
-            # 취소 버튼 비활성화 -> 비디오는 취소 불가
-            self._disable_cancel_button()
+            # 취소 버튼 활성화
+            self._enable_cancel_button()
             # 이벤트 발행 없이 직접 추출 시작
-            self.extraction_manager.extract_video_segment(segments[0])
+            self._current_jobs = self.extraction_manager.extract_video_segment(segments[0]) or []
         else:
             messagebox.showwarning(
                 "경고", "추출할 구간이 없습니다.\n먼저 구간을 저장해주세요.", "warning")
 
+    def on_extract_all_videos(self):
+        """저장된 모든 구간 비디오 일괄 추출 시작"""
+        segments = self.app.get_saved_segments()
+        if segments:
+            # 일괄 추출은 파일 단위로 취소 가능
+            self._enable_cancel_button()
+            self._current_jobs = self.extraction_manager.extract_all_video_segments(segments) or []
+        else:
+            messagebox.showwarning("경고", "추출할 구간이 없습니다.\n먼저 구간을 저장해주세요.")
+
     def on_extract_images(self):
         """이미지 추출 시작"""
         segments = self.app.get_saved_segments()
@@ -494,7 +588,16 @@ class NewTab(BaseTab):
             # 취소 버튼 활성화
             self._enable_cancel_button()
             # 이벤트 발행 없이 직접 추출 시작
-            self.extraction_manager.extract_images()
+            self._current_jobs = self.extraction_manager.extract_images() or []
+        else:
+            messagebox.showwarning("경고", "추출할 구간이 없습니다.\n먼저 구간을 저장해주세요.")
+
+    def on_extract_all_images(self):
+        """저장된 모든 구간 이미지 일괄 추출 시작"""
+        segments = self.app.get_saved_segments()
+        if segments:
+            self._enable_cancel_button()
+            self._current_jobs = self.extraction_manager.extract_all_images(segments) or []
         else:
             messagebox.showwarning("경고", "추출할 구간이 없습니다.\n먼저 구간을 저장해주세요.")
 
@@ -505,18 +608,50 @@ class NewTab(BaseTab):
             # 취소 버튼 활성화
             self._enable_cancel_button()
             # 이벤트 발행 없이 직접 추출 시작
-            self.extraction_manager.extract_audio()
+            self._current_jobs = self.extraction_manager.extract_audio() or []
+        else:
+            messagebox.showwarning("경고", "추출할 구간이 없습니다.\n먼저 구간을 저장해주세요.")
+
+    def on_extract_all_audio(self):
+        """저장된 모든 구간 오디오 일괄 추출 시작"""
+        segments = self.app.get_saved_segments()
+        if segments:
+            self._enable_cancel_button()
+            self._current_jobs = self.extraction_manager.extract_all_audio(segments) or []
         else:
             messagebox.showwarning("경고", "추출할 구간이 없습니다.\n먼저 구간을 저장해주세요.")
 
     # ===== 취소 처리 메서드 =====
 
     def on_extraction_cancel(self, **kwargs):
-        """추출 취소 처리 - 통합된 취소 로직"""
+        """마지막으로 시작한 추출 작업만 취소 (다른 대기/실행 중 작업은 계속 진행)"""
         try:
             # 취소 버튼 비활성화
             self._disable_cancel_button()
 
+            # 아직 끝나지 않은 작업만 하나씩 취소 요청
+            cancelled = [job for job in self._current_jobs
+                         if not job.is_finished()
+                         and self.extraction_manager.cancel_job(job.job_id)]
+            self._current_jobs = []
+            print(f"추출 작업 {len(cancelled)}개 취소 요청")
+
+            # 취소 완료 다이얼로그 표시
+            messagebox.showinfo("작업 취소", "추출 작업이 취소되었습니다.")
+
+            # UI 업데이트 - 프로그레스바 초기화
+            self._update_video_audio_progress(0, "작업이 취소되었습니다.")
+
+        except Exception as e:
+            print(f"추출 취소 이벤트 발행 중 오류: {e}")
+
+    def on_extraction_cancel_all(self, **kwargs):
+        """대기/실행 중인 모든 추출 작업 취소"""
+        try:
+            # 취소 버튼 비활성화
+            self._disable_cancel_button()
+            self._current_jobs = []
+
             # 실제 취소 요청 전달
             if hasattr(self.extraction_manager, '_cancel_all_extractions'):
                 self.extraction_manager._cancel_all_extractions()
@@ -602,6 +737,8 @@ class NewTab(BaseTab):
             messagebox.showinfo("성공", f"이미지 추출이 완료되었습니다!\n"
                                 f"총 {extracted_count}개 이미지 저장.\n"
                                 f"저장 위치: {output_folder}")
+            if kwargs.get('sheet_path'):
+                self._show_contact_sheet(kwargs['sheet_path'])
         else:
             # 진행률을 100%로 설정
             self._update_video_audio_progress(100, "추출 완료!")
@@ -616,6 +753,24 @@ class NewTab(BaseTab):
             # 취소 버튼 비활성화
             self._disable_cancel_button()
 
+    def _show_contact_sheet(self, sheet_path):
+        """contact sheet 미리보기 창 - 화면보다 크면 축소해 표시"""
+        try:
+            image = Image.open(sheet_path)
+            image.load()
+        except OSError as e:
+            print(f"contact sheet 열기 실패: {e}")
+            return
+
+        window = tk.Toplevel(self.root)
+        window.title(os.path.basename(sheet_path))
+        image.thumbnail((int(window.winfo_screenwidth() * 0.9),
+                         int(window.winfo_screenheight() * 0.85)), Image.LANCZOS)
+        photo = ImageTk.PhotoImage(image)
+        label = ttk.Label(window, image=photo)
+        label.image = photo  # 참조 유지 (없으면 가비지 컬렉션으로 이미지가 사라짐)
+        label.pack()
+
     # ===== 이벤트 리스너 설정 =====
 
     def _setup_event_listeners(self):
@@ -650,8 +805,12 @@ class NewTab(BaseTab):
         """취소 버튼 활성화"""
         if hasattr(self, 'cancel_button'):
             self.cancel_button.config(state=tk.NORMAL)
+        if hasattr(self, 'cancel_all_button'):
+            self.cancel_all_button.config(state=tk.NORMAL)
 
     def _disable_cancel_button(self, **kwargs):
         """취소 버튼 비활성화"""
         if hasattr(self, 'cancel_button'):
             self.cancel_button.config(state=tk.DISABLED)
+        if hasattr(self, 'cancel_all_button'):
+            self.cancel_all_button.config(state=tk.DISABLED)
@@ -0,0 +1,223 @@
+import time
+import numpy as np
+from utils.waveform import WaveformEnvelope
+from utils.extract.ffmpeg_frame_source import FFmpegFrameSource
+
+
+class _HysteresisTracker:
+    """묶음 단위로 들어오는 수준 값에서 활성 구간 [시작, 끝) 을 찾는 상태 기계
+
+    high 이상이면 활성, low 미만이면 비활성, 그 사이는 이전 상태를 유지한다 (히스테리시스).
+    묶음 사이에는 현재 상태와 진행 중인 구간 시작만 넘기므로 메모리 사용량이 일정하다.
+    """
+
+    def __init__(self, high, low, step_seconds):
+        self.high = high
+        self.low = low
+        self.step = step_seconds
+        self.position = 0  # 지금까지 받은 값 개수
+        self.active = False
+        self.region_start = None
+        self.regions = []
+
+    def feed(self, levels):
+        count = len(levels)
+        if not count:
+            return
+        # 확실한 값(1/0)만 표시한 뒤 앞으로 채움 - 첫 확실한 값 전까지는 이전 묶음 상태
+        decided = np.full(count, -1, dtype=np.int8)
+        decided[levels >= self.high] = 1
+        decided[levels < self.low] = 0
+        index = np.where(decided >= 0, np.arange(count), -1)
+        np.maximum.accumulate(index, out=index)
+        state = np.where(index >= 0, decided[np.maximum(index, 0)], int(self.active)).astype(bool)
+
+        # 상태가 바뀌는 위치 (이전 묶음 마지막 상태 기준)
+        changes = np.flatnonzero(np.diff(state.astype(np.int8), prepend=np.int8(self.active)))
+        for i in changes:
+            t = float((self.position + i) * self.step)
+            if state[i]:
+                self.region_start = t
+            else:
+                self.regions.append((self.region_start, t))
+                self.region_start = None
+        self.active = bool(state[-1])
+        self.position += count
+
+    def finish(self):
+        """남은 활성 구간을 마지막 값 위치에서 닫고 전체 구간 목록 반환"""
+        if self.active and self.region_start is not None:
+            self.regions.append((self.region_start, self.position * self.step))
+            self.active = False
+            self.region_start = None
+        return self.regions
+
+
+class ActivityDetector:
+    """오디오 음량(선택적으로 화면 움직임)으로 활동 구간을 찾아 구간 후보 제안
+
+    오디오는 WaveformEnvelope 와 같은 25ms 구간 RMS 를 dBFS 로 바꿔, 움직임은 작게 줄인
+    회색조 프레임의 평균 차이로 판정한다. 둘 다 디코딩 결과를 고정 크기 묶음으로 받아
+    처리하므로 2시간짜리 파일도 전체를 메모리에 올리지 않는다 (파형 캐시가 있으면 디코딩 생략).
+    찾은 구간은 가까운 것끼리 합치고, 너무 짧은 것은 버린 뒤 앞뒤 여유를 붙인다.
+    """
+
+    # 움직임 분석용 프레임 크기와 초당 프레임 수
+    MOTION_SIZE = (64, 36)
+    MOTION_FPS = 5
+
+    def __init__(self, threshold_db=-35.0, hysteresis_db=6.0, min_duration=1.0,
+                 merge_gap=0.5, padding=0.25, motion_threshold=None):
+        """
+        Args:
+            threshold_db: 활성 시작 음량 기준 (dBFS)
+            hysteresis_db: 활성 종료 기준 = threshold_db - hysteresis_db
+            min_duration: 이보다 짧은 구간은 버림 (초)
+            merge_gap: 이보다 가까운 구간은 하나로 합침 (초)
+            padding: 구간 앞뒤로 붙일 여유 (초)
+            motion_threshold: 화면 움직임 기준 (프레임 간 평균 밝기 차이 0~255, None이면 사용 안 함)
+        """
+        if hysteresis_db < 0:
+            raise ValueError(f"hysteresis_db 는 0 이상이어야 합니다: {hysteresis_db}")
+        if min_duration < 0 or merge_gap < 0 or padding < 0:
+            raise ValueError("min_duration, merge_gap, padding 은 0 이상이어야 합니다.")
+        if motion_threshold is not None and motion_threshold <= 0:
+            raise ValueError(f"motion_threshold 는 0보다 커야 합니다: {motion_threshold}")
+        self.threshold_db = float(threshold_db)
+        self.hysteresis_db = float(hysteresis_db)
+        self.min_duration = float(min_duration)
+        self.merge_gap = float(merge_gap)
+        self.padding = float(padding)
+        self.motion_threshold = motion_threshold
+        self.stats = {}
+
+    def detect(self, input_path, ffmpeg_executable='ffmpeg', cancel_event=None,
+               progress_callback=None):
+        """활동 구간 목록 [(시작 초, 끝 초), ...] - 취소되면 빈 목록
+
+        progress_callback(처리한 초, 배속) 은 묶음마다 호출된다.
+        처리 결과는 self.stats = {'duration', 'elapsed', 'realtime', 'audio', 'motion'}.
+        """
+        started = time.perf_counter()
+        regions, duration = [], 0.0
+        audio_regions, audio_duration = self._detect_audio(
+            input_path, ffmpeg_executable, cancel_event, progress_callback, started)
+        regions += audio_regions
+        duration = max(duration, audio_duration)
+
+        motion_regions = []
+        if self.motion_threshold is not None and not (cancel_event and cancel_event.is_set()):
+            motion_regions, motion_duration = self._detect_motion(
+                input_path, ffmpeg_executable, cancel_event, progress_callback, started)
+            regions += motion_regions
+            duration = max(duration, motion_duration)
+
+        if cancel_event and cancel_event.is_set():
+            return []
+
+        proposals = self._finalize(regions, duration)
+        elapsed = time.perf_counter() - started
+        self.stats = {
+            'duration': duration,
+            'elapsed': elapsed,
+            'realtime': duration / elapsed if elapsed > 0 else 0.0,
+            'audio': len(audio_regions),
+            'motion': len(motion_regions),
+        }
+        print(f"[ActivityDetector] {len(proposals)}개 구간 제안 (오디오 {len(audio_regions)}, "
+              f"움직임 {len(motion_regions)}) - {duration:.1f}초를 {elapsed:.2f}초에 분석 "
+              f"({self.stats['realtime']:.0f}x 실시간)")
+        return proposals
+
+    def _detect_audio(self, input_path, ffmpeg_executable, cancel_event, progress_callback,
+                      started):
+        """오디오 RMS 구간에서 활성 구간 찾기 - (구간 목록, 분석한 길이)"""
+        tracker = _HysteresisTracker(
+            self.threshold_db, self.threshold_db - self.hysteresis_db,
+            WaveformEnvelope.WINDOW_SECONDS)
+
+        envelope = WaveformEnvelope.cached(input_path)
+        if envelope is not None:
+            # 이미 파형 캐시가 있으면 디코딩 없이 그대로 사용
+            chunks = (envelope.windows[i:i + WaveformEnvelope.CHUNK_WINDOWS]
+                      for i in range(0, len(envelope.windows), WaveformEnvelope.CHUNK_WINDOWS))
+        else:
+            chunks = WaveformEnvelope.iter_windows(input_path, ffmpeg_executable, cancel_event)
+
+        for chunk in chunks:
+            if cancel_event and cancel_event.is_set():
+                break
+            rms = np.maximum(chunk['rms'].astype(np.float32), 1.0) / 32768.0
+            tracker.feed(20.0 * np.log10(rms))
+            self._report(progress_callback, tracker.position * tracker.step, started)
+        return tracker.finish(), tracker.position * tracker.step
+
+    def _detect_motion(self, input_path, ffmpeg_executable, cancel_event, progress_callback,
+                       started):
+        """작게 줄인 회색조 프레임 간 평균 차이로 움직임 구간 찾기 - (구간 목록, 분석한 길이)"""
+        info = FFmpegFrameSource.probe(input_path, ffmpeg_executable)
+        if info is None:
+            print("[ActivityDetector] 비디오 정보를 읽지 못해 움직임 분석을 건너뜁니다.")
+            return [], 0.0
+        source = FFmpegFrameSource(
+            input_path, info['width'], info['height'], scale=ActivityDetector.MOTION_SIZE,
+            fps=ActivityDetector.MOTION_FPS, ffmpeg_executable=ffmpeg_executable)
+        tracker = _HysteresisTracker(
+            self.motion_threshold, self.motion_threshold / 2, 1.0 / ActivityDetector.MOTION_FPS)
+
+        # 1초 분량씩 모아 한 번에 계산 (첫 값은 비교할 이전 프레임이 없어 0)
+        batch = ActivityDetector.MOTION_FPS
+        gray = np.zeros((batch + 1,) + ActivityDetector.MOTION_SIZE[::-1], dtype=np.float32)
+        filled, have_previous = 1, False
+        reader = source.read(cancel_event)
+        try:
+            for frame in reader:
+                gray[filled] = frame.mean(axis=2)
+                filled += 1
+                if filled == batch + 1:
+                    tracker.feed(self._motion_levels(gray, filled, have_previous))
+                    gray[0] = gray[-1]
+                    filled, have_previous = 1, True
+                    self._report(progress_callback, tracker.position * tracker.step, started)
+        except OSError as e:
+            print(f"[ActivityDetector] 움직임 분석 중 디코딩 실패: {e}")
+        finally:
+            reader.close()
+        if filled > 1:
+            tracker.feed(self._motion_levels(gray, filled, have_previous))
+        return tracker.finish(), tracker.position * tracker.step
+
+    @staticmethod
+    def _motion_levels(gray, filled, have_previous):
+        """gray[1:filled] 각 프레임과 바로 앞 프레임의 평균 밝기 차이"""
+        levels = np.abs(np.diff(gray[:filled], axis=0)).mean(axis=(1, 2))
+        if not have_previous:
+            levels[0] = 0.0
+        return levels
+
+    def _finalize(self, regions, duration):
+        """가까운 구간 합치기 → 짧은 구간 버리기 → 앞뒤 여유 붙이기"""
+        merged = []
+        for start, end in sorted(regions):
+            if merged and start - merged[-1][1] <= self.merge_gap:
+                merged[-1][1] = max(merged[-1][1], end)
+            else:
+                merged.append([start, end])
+        proposals = []
+        for start, end in merged:
+            if end - start < self.min_duration:
+                continue
+            start = max(0.0, start - self.padding)
+            end = min(duration, end + self.padding) if duration else end + self.padding
+            if proposals and start <= proposals[-1][1]:
+                # 여유를 붙이면서 겹친 구간은 하나로
+                proposals[-1] = (proposals[-1][0], end)
+            else:
+                proposals.append((start, end))
+        return [(round(float(start), 3), round(float(end), 3)) for start, end in proposals]
+
+    @staticmethod
+    def _report(progress_callback, processed, started):
+        if progress_callback:
+            elapsed = time.perf_counter() - started
+            progress_callback(processed, processed / elapsed if elapsed > 0 else 0.0)
@@ -1,10 +1,44 @@
 from .video_extractor import VideoExtractor, ExtractConfig
 from .image_extractor import ImageExtractor
 from .audio_extractor import AudioExtractor
+from .smart_cutter import SmartCutter
+from .ffmpeg_progress import FFmpegProgress
+from .frame_pipeline import FramePipeline
+from .frame_sharder import FrameSharder
+from .frame_sampler import FrameSampler
+from .scene_detector import SceneDetector
+from .frame_dedup import FrameDeduplicator
+from .frame_sinks import FrameSinks, DirectorySink, ZipSink, TarSink
+from .frame_stack import FrameStack
+from .ffmpeg_frame_source import FFmpegFrameSource
+from .media_index import MediaIndex
+from .frame_transform import FrameTransform
+from .encode_profile import EncodeProfile
+from .contact_sheet import ContactSheet
+from .media_probe import MediaProbe, MediaInfo
 
 __all__ = [
     "VideoExtractor",
     "ExtractConfig",
     "ImageExtractor",
     "AudioExtractor",
+    "SmartCutter",
+    "FFmpegProgress",
+    "FramePipeline",
+    "FrameSharder",
+    "FrameSampler",
+    "SceneDetector",
+    "FrameDeduplicator",
+    "FrameSinks",
+    "DirectorySink",
+    "ZipSink",
+    "TarSink",
+    "FrameStack",
+    "FFmpegFrameSource",
+    "MediaIndex",
+    "FrameTransform",
+    "EncodeProfile",
+    "ContactSheet",
+    "MediaProbe",
+    "MediaInfo",
 ]
@@ -1,8 +1,53 @@
+import os
+import subprocess
 from .video_extractor import VideoExtractor
+from .media_probe import MediaProbe
 
 
 class AudioExtractor:
-    """오디오 추출 전용 유틸리티 (ffmpeg 사용)"""
+    """오디오 추출 전용 유틸리티 (ffmpeg 사용)
+
+    출력 형식:
+    - 'mp3': libmp3lame 으로 재인코딩 (기본)
+    - 'wav': PCM 16bit 로 변환
+    - 'native': 원본 오디오 스트림을 그대로 복사 (-c:a copy) - 디코딩/인코딩이 없어
+      구간당 수 ms. 확장자는 원본 코덱에 맞춰 정한다 (AAC → .m4a, Opus → .opus ...)
+    """
+
+    AUDIO_FORMATS = ('mp3', 'wav', 'native')
+    # 원본 코덱 → 스트림 복사 시 담을 컨테이너 확장자 (없으면 거의 모든 코덱을 담는 .mka)
+    NATIVE_EXTENSIONS = {
+        'aac': '.m4a',
+        'alac': '.m4a',
+        'mp3': '.mp3',
+        'opus': '.opus',
+        'vorbis': '.ogg',
+        'flac': '.flac',
+        'ac3': '.ac3',
+        'pcm_s16le': '.wav',
+    }
+
+    @staticmethod
+    def probe_audio_stream(input_path, ffmpeg_executable='ffmpeg'):
+        """첫 오디오 스트림 정보 조회 (MediaProbe 캐시 사용)
+
+        Returns:
+            dict | None: {'codec', 'sample_rate', 'channels'} (오디오가 없거나 실패하면 None)
+        """
+        info = MediaProbe.probe(input_path, ffmpeg_executable)
+        if info is None or info.audio is None:
+            return None
+        return {
+            'codec': info.audio.codec,
+            'sample_rate': info.audio.sample_rate,
+            'channels': info.audio.channels,
+        }
+
+    @staticmethod
+    def native_output_path(output_audio_path, codec):
+        """스트림 복사용 출력 경로 - 확장자를 원본 코덱에 맞게 바꿈"""
+        ext = AudioExtractor.NATIVE_EXTENSIONS.get(codec, '.mka')
+        return os.path.splitext(output_audio_path)[0] + ext
 
     @staticmethod
     def build_audio_command(input_video_path, output_audio_path, start_time, end_time,
@@ -18,22 +63,156 @@ class AudioExtractor:
             '-t', str(duration),    # 길이 (duration) 사용
         ]
 
-        if audio_format == 'mp3':
-            command += ['-vn', '-acodec', 'libmp3lame', '-ab', audio_quality]
-        elif audio_format == 'wav':
-            command += ['-vn', '-acodec', 'pcm_s16le']
-        else:
-            command += ['-vn', '-acodec', 'libmp3lame', '-ab', audio_quality]
+        if audio_format == 'native':
+            # 첫 오디오 스트림만 그대로 복사 (출력 확장자가 코덱에 맞아야 함 - native_output_path)
+            command += ['-vn', '-sn', '-map', '0:a:0']
+        command += AudioExtractor._codec_args(audio_format, audio_quality)
 
         command.append(output_audio_path)
         return command
 
+    @staticmethod
+    def _codec_args(audio_format, audio_quality='192k'):
+        """출력 형식별 오디오 코덱 옵션"""
+        if audio_format == 'native':
+            return ['-c:a', 'copy']
+        if audio_format == 'wav':
+            return ['-vn', '-acodec', 'pcm_s16le']
+        return ['-vn', '-acodec', 'libmp3lame', '-ab', audio_quality]
+
+    @staticmethod
+    def build_batch_audio_command(input_video_path, segments, audio_format='mp3',
+                                  audio_quality='192k', ffmpeg_executable='ffmpeg'):
+        """같은 파일의 여러 구간 오디오를 FFmpeg 프로세스 하나로 추출하는 커맨드 생성
+
+        재인코딩 형식은 서로 가까운 구간을 하나의 입력(-ss/-t)으로 묶어 한 번만 읽고
+        asplit + atrim 으로 나눈다 (VideoExtractor._cluster_segments 와 같은 묶음 기준).
+        'native' 는 필터를 쓸 수 없으므로 구간마다 입력 탐색(-ss/-t)한 입력을 스트림 복사한다.
+
+        Args:
+            segments: [{'start': 초, 'end': 초, 'output_path': 경로}, ...]
+        """
+        if not segments:
+            raise ValueError("추출할 구간이 없습니다.")
+
+        command = [ffmpeg_executable, '-y']
+        if audio_format == 'native':
+            for seg in segments:
+                start = VideoExtractor.to_seconds(seg['start'])
+                end = VideoExtractor.to_seconds(seg['end'])
+                command += ['-ss', f"{start:.3f}", '-t', f"{end - start:.3f}",
+                            '-i', input_video_path]
+            for i, seg in enumerate(segments):
+                command += ['-map', f"{i}:a:0"] + AudioExtractor._codec_args(audio_format)
+                command.append(seg['output_path'])
+            return command
+
+        graph = []
+        for k, (base, span, members) in enumerate(VideoExtractor._cluster_segments(segments)):
+            command += ['-ss', f"{base:.3f}", '-t', f"{span:.3f}", '-i', input_video_path]
+            graph.append(f"[{k}:a:0]asplit={len(members)}" +
+                         ''.join(f"[a{i}]" for i, _, _ in members))
+            for i, start, end in members:
+                graph.append(f"[a{i}]atrim=start={start - base:.3f}:end={end - base:.3f},"
+                             f"asetpts=PTS-STARTPTS[ao{i}]")
+
+        command += ['-filter_complex', ';'.join(graph)]
+        for i, seg in enumerate(segments):
+            command += ['-map', f"[ao{i}]"] + AudioExtractor._codec_args(audio_format, audio_quality)
+            command.append(seg['output_path'])
+        return command
+
+    @staticmethod
+    def extract_audio_segments_batch(input_video_path, segments, progress_callback=None,
+                                     audio_format='mp3', audio_quality='192k',
+                                     ffmpeg_executable='ffmpeg', cancel_event=None):
+        """같은 파일의 여러 구간 오디오를 FFmpeg 프로세스 하나로 추출
+
+        오디오 스트림 확인(ffprobe)도 파일당 한 번만 한다. 'native' 면 각 출력 경로의
+        확장자를 원본 코덱에 맞게 바꾸고, 복사가 실패하면 같은 이름의 mp3 로 재인코딩한다.
+
+        Returns:
+            dict: {'success', 'message', 'output_paths'}
+        """
+        try:
+            stream = AudioExtractor.probe_audio_stream(input_video_path, ffmpeg_executable)
+            if stream is None:
+                return {
+                    'success': False,
+                    'message': f"오디오 스트림이 없는 파일입니다: {input_video_path}",
+                    'output_paths': []
+                }
+
+            segments = [dict(seg) for seg in segments]
+            for seg in segments:
+                if audio_format == 'native':
+                    seg['output_path'] = AudioExtractor.native_output_path(
+                        seg['output_path'], stream['codec'])
+                output_dir = os.path.dirname(seg['output_path'])
+                if output_dir and not os.path.exists(output_dir):
+                    os.makedirs(output_dir)
+
+            command = AudioExtractor.build_batch_audio_command(
+                input_video_path, segments, audio_format, audio_quality, ffmpeg_executable)
+            print(f"AudioExtractor: {len(segments)}개 구간 일괄 추출 ({audio_format})")
+
+            if progress_callback:
+                progress_callback(f"{len(segments)}개 구간 오디오 일괄 추출 중...")
+
+            # 출력 위치(out_time)는 가장 긴 출력 파일 기준으로 진행
+            longest = max(VideoExtractor.to_seconds(seg['end']) - VideoExtractor.to_seconds(seg['start'])
+                          for seg in segments)
+            result = VideoExtractor.execute_command(
+                command, cancel_event=cancel_event, progress_callback=progress_callback,
+                duration=longest, label=f"{len(segments)}개 구간 오디오 일괄 추출 중")
+            if audio_format == 'native' and not result.get('success') and \
+                    not (cancel_event and cancel_event.is_set()):
+                # 컨테이너가 코덱을 받지 못하는 경우 등 - 재인코딩으로 다시 시도
+                print("AudioExtractor: 일괄 스트림 복사 실패 - mp3 로 재인코딩합니다.")
+                for seg in segments:
+                    if os.path.exists(seg['output_path']):
+                        os.remove(seg['output_path'])
+                    seg['output_path'] = os.path.splitext(seg['output_path'])[0] + '.mp3'
+                return AudioExtractor.extract_audio_segments_batch(
+                    input_video_path, segments, progress_callback, 'mp3', audio_quality,
+                    ffmpeg_executable, cancel_event)
+            result['output_paths'] = [seg['output_path'] for seg in segments] \
+                if result.get('success') else []
+            if result.get('success'):
+                result['message'] = f"{len(segments)}개 구간 오디오 일괄 추출 성공"
+            return result
+
+        except Exception as e:
+            return {
+                'success': False,
+                'message': f"오디오 일괄 추출 중 오류 발생: {e}",
+                'output_paths': []
+            }
+
     @staticmethod
     def extract_audio_segment(input_video_path, output_audio_path, start_time, end_time,
                               progress_callback=None, audio_format='mp3', audio_quality='192k',
                               ffmpeg_executable='ffmpeg', cancel_event=None):
-        """오디오 세그먼트 추출 - 정확한 시간 처리"""
+        """오디오 세그먼트 추출 - 정확한 시간 처리
+
+        audio_format 'native' 는 원본 스트림을 복사하고 출력 확장자를 코덱에 맞게 바꾼다
+        (실제 경로는 결과의 'output_path'). 오디오 스트림이 없으면 실패, 복사가 실패하면
+        같은 이름의 mp3 로 재인코딩한다.
+        """
         try:
+            if audio_format == 'native':
+                stream = AudioExtractor.probe_audio_stream(input_video_path, ffmpeg_executable)
+                if stream is None:
+                    return {
+                        'success': False,
+                        'message': "오디오 스트림이 없는 파일입니다.",
+                        'output_path': None
+                    }
+                output_audio_path = AudioExtractor.native_output_path(
+                    output_audio_path, stream['codec'])
+                print(f"AudioExtractor: 원본 스트림 복사 ({stream['codec']}, "
+                      f"{stream['sample_rate']}Hz, {stream['channels']}ch)")
+
             # 디버깅 정보 출력
             duration = end_time - start_time
             print(f"AudioExtractor: 오디오 추출 시작")
@@ -53,7 +232,18 @@ class AudioExtractor:
                 progress_callback("오디오 추출 중...")
 
             result = VideoExtractor.execute_command(
-                command, cancel_event=cancel_event)
+                command, cancel_event=cancel_event, progress_callback=progress_callback,
+                duration=duration, label="오디오 추출 중")
+            if audio_format == 'native' and not result.get('success') and \
+                    not (cancel_event and cancel_event.is_set()):
+                # 컨테이너가 코덱을 받지 못하는 경우 등 - 재인코딩으로 다시 시도
+                print("AudioExtractor: 스트림 복사 실패 - mp3 로 재인코딩합니다.")
+                if os.path.exists(output_audio_path):
+                    os.remove(output_audio_path)
+                return AudioExtractor.extract_audio_segment(
+                    input_video_path, os.path.splitext(output_audio_path)[0] + '.mp3',
+                    start_time, end_time, progress_callback, 'mp3', audio_quality,
+                    ffmpeg_executable, cancel_event)
             if result.get('success'):
                 result['output_path'] = output_audio_path
                 result['message'] = "오디오 세그먼트 추출 성공"
@@ -61,12 +251,10 @@ class AudioExtractor:
 
                 # 실제 추출된 파일의 길이 확인
                 try:
-                    import subprocess
-                    import os
                     if os.path.exists(output_audio_path):
                         # ffprobe로 실제 파일 길이 확인
-                        ffprobe_path = ffmpeg_executable.replace(
-                            'ffmpeg', 'ffprobe').replace('ffmpeg.EXE', 'ffprobe.EXE')
+                        ffprobe_path = VideoExtractor.get_ffprobe_executable(
+                            ffmpeg_executable)
                         probe_cmd = [
                             ffprobe_path,
                             '-v', 'quiet',
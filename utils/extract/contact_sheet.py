@@ -0,0 +1,96 @@
+import math
+import cv2
+import numpy as np
+from utils.utils import VideoUtils
+
+
+class ContactSheet:
+    """구간에서 K장을 골라 시각을 적은 격자 한 장(contact sheet)으로 합침
+
+    선택 방식:
+    - 'even': 구간을 K등분한 각 칸의 가운데 프레임
+    - 'scene': 장면 전환 프레임 (K장보다 많으면 고르게 추림, 2장 미만이면 'even')
+
+    타일은 디코딩 즉시 축소해 보관하고, 미리 할당한 NumPy 캔버스에 배치한 뒤 한 번만 인코딩한다.
+    """
+
+    SELECTIONS = ('even', 'scene')
+    DEFAULT_COUNT = 16
+    DEFAULT_TILE_WIDTH = 320
+    # 타일 사이 간격, 위쪽 제목 줄 높이(px)
+    GAP = 4
+    HEADER_HEIGHT = 32
+    BACKGROUND = (32, 32, 32)
+
+    def __init__(self, count=None, columns=None, tile_width=None, selection='even',
+                 scene_threshold=None):
+        if selection not in ContactSheet.SELECTIONS:
+            raise ValueError(f"지원하지 않는 선택 방식: {selection}")
+        self.count = int(count or ContactSheet.DEFAULT_COUNT)
+        if self.count < 1:
+            raise ValueError(f"count 는 1 이상이어야 합니다: {count}")
+        self.columns = int(columns) if columns else math.ceil(math.sqrt(self.count))
+        self.tile_width = int(tile_width or ContactSheet.DEFAULT_TILE_WIDTH)
+        self.selection = selection
+        self.scene_threshold = scene_threshold
+
+    def plan(self, start_frame, end_frame):
+        """'even' 선택 시 저장할 프레임 번호 (K등분 칸의 가운데, 오름차순 중복 없음)"""
+        length = end_frame - start_frame + 1
+        if length <= 0:
+            return []
+        frames = [start_frame + int((i + 0.5) * length / self.count) for i in range(self.count)]
+        return sorted(set(frames))
+
+    def tile_size(self, width, height):
+        """원본 비율을 유지한 타일 크기 (가로, 세로)"""
+        return self.tile_width, max(1, round(self.tile_width * height / max(1, width)))
+
+    def make_tile(self, frame, tile_size):
+        """프레임을 타일 크기로 축소 (디코딩 직후 호출 - 원본 프레임을 보관하지 않음)"""
+        if (frame.shape[1], frame.shape[0]) == tuple(tile_size):
+            # 이미 축소된 프레임 (ffmpeg scale) - 디코더 버퍼를 재사용하므로 복사해 보관
+            return frame.copy()
+        return cv2.resize(frame, tile_size, interpolation=cv2.INTER_AREA)
+
+    def pick(self, tiles):
+        """(frame_number, tile) 목록에서 최대 count 장을 고르게 추림"""
+        if len(tiles) <= self.count:
+            return tiles
+        step = len(tiles) / self.count
+        return [tiles[int(i * step)] for i in range(self.count)]
+
+    def compose(self, tiles, fps, title=''):
+        """(frame_number, tile) 목록을 시각 라벨과 함께 캔버스 한 장으로 배치"""
+        if not tiles:
+            raise ValueError("contact sheet 에 넣을 프레임이 없습니다.")
+        tile_h, tile_w = tiles[0][1].shape[:2]
+        columns = min(self.columns, len(tiles))
+        rows = math.ceil(len(tiles) / columns)
+        gap = ContactSheet.GAP
+        header = ContactSheet.HEADER_HEIGHT if title else 0
+
+        canvas = np.empty(
+            (header + rows * (tile_h + gap) + gap, columns * (tile_w + gap) + gap, 3), np.uint8)
+        canvas[:] = ContactSheet.BACKGROUND
+        if title:
+            cv2.putText(canvas, title, (gap * 2, header - 10), cv2.FONT_HERSHEY_SIMPLEX,
+                        0.6, (255, 255, 255), 1, cv2.LINE_AA)
+
+        font_scale = max(0.35, tile_w / 640)
+        for i, (frame_number, tile) in enumerate(tiles):
+            row, col = divmod(i, columns)
+            y = header + gap + row * (tile_h + gap)
+            x = gap + col * (tile_w + gap)
+            canvas[y:y + tile_h, x:x + tile_w] = tile
+
+            seconds = frame_number / fps
+            label = f"{VideoUtils.format_time(seconds)}.{int(seconds * 1000) % 1000:03d}"
+            (text_w, text_h), baseline = cv2.getTextSize(
+                label, cv2.FONT_HERSHEY_SIMPLEX, font_scale, 1)
+            # 글자 뒤 검은 띠로 밝은 장면에서도 읽히게
+            cv2.rectangle(canvas, (x, y + tile_h - text_h - baseline - 6),
+                          (x + text_w + 8, y + tile_h), (0, 0, 0), cv2.FILLED)
+            cv2.putText(canvas, label, (x + 4, y + tile_h - baseline - 3),
+                        cv2.FONT_HERSHEY_SIMPLEX, font_scale, (255, 255, 255), 1, cv2.LINE_AA)
+        return canvas
@@ -0,0 +1,95 @@
+import cv2
+
+
+class EncodeProfile:
+    """이미지 저장 형식과 품질 설정 (JPEG / PNG / WebP)
+
+    OpenCV 경로(cv2.imencode 파라미터)와 ffmpeg 경로(인코더 옵션)에 같은 설정을 적용한다.
+    ffmpeg mjpeg 인코더는 품질(%)이 아니라 qscale(2~31)을 쓰므로 품질을 qscale 로 환산하고,
+    progressive JPEG 은 OpenCV 경로에서만 적용된다.
+    """
+
+    FORMATS = {'jpeg': '.jpg', 'png': '.png', 'webp': '.webp'}
+    # 이름으로 고르는 기본 프로파일
+    PRESETS = {
+        # OpenCV 기본값 (JPEG 95) / ffmpeg -qscale:v 2 와 같은 기존 동작
+        'default': {'fmt': 'jpeg', 'quality': 95},
+        # 파일 크기와 쓰기 시간을 줄인 JPEG
+        'fast': {'fmt': 'jpeg', 'quality': 85},
+        'high': {'fmt': 'jpeg', 'quality': 98, 'optimize': True},
+        # 무손실 - 압축 레벨 1은 기본(3)보다 훨씬 빠르고 크기 차이는 작음
+        'png': {'fmt': 'png', 'png_level': 1},
+        'webp': {'fmt': 'webp', 'quality': 80},
+        'webp_lossless': {'fmt': 'webp', 'lossless': True},
+    }
+
+    def __init__(self, fmt='jpeg', quality=None, optimize=False, progressive=False,
+                 png_level=None, lossless=False):
+        """
+        Args:
+            fmt: 'jpeg' | 'png' | 'webp'
+            quality: JPEG/WebP 품질 (1~100, 기본 JPEG 95, WebP 80)
+            optimize: JPEG 허프만 테이블 최적화 (조금 느리고 조금 작음)
+            progressive: progressive JPEG (OpenCV 경로만)
+            png_level: PNG 압축 레벨 (0~9, 기본 1)
+            lossless: 무손실 WebP
+        """
+        if fmt not in EncodeProfile.FORMATS:
+            raise ValueError(f"지원하지 않는 이미지 형식: {fmt}")
+        if quality is not None and not 1 <= int(quality) <= 100:
+            raise ValueError(f"quality 는 1~100 사이여야 합니다: {quality}")
+        if png_level is not None and not 0 <= int(png_level) <= 9:
+            raise ValueError(f"PNG 압축 레벨은 0~9 사이여야 합니다: {png_level}")
+        self.fmt = fmt
+        self.quality = int(quality) if quality is not None else (80 if fmt == 'webp' else 95)
+        self.optimize = bool(optimize)
+        self.progressive = bool(progressive)
+        self.png_level = 1 if png_level is None else int(png_level)
+        self.lossless = bool(lossless)
+
+    @classmethod
+    def preset(cls, name):
+        if name not in cls.PRESETS:
+            raise ValueError(f"알 수 없는 인코딩 프로파일: {name}")
+        return cls(**cls.PRESETS[name])
+
+    @property
+    def ext(self):
+        return EncodeProfile.FORMATS[self.fmt]
+
+    def describe(self):
+        """로그용 설명 문구"""
+        if self.fmt == 'png':
+            return f"PNG level {self.png_level}"
+        if self.fmt == 'webp':
+            return "WebP lossless" if self.lossless else f"WebP q{self.quality}"
+        flags = ''.join([' optimize' if self.optimize else '',
+                         ' progressive' if self.progressive else ''])
+        return f"JPEG q{self.quality}{flags}"
+
+    def cv2_params(self):
+        """cv2.imencode 파라미터 목록"""
+        if self.fmt == 'png':
+            return [cv2.IMWRITE_PNG_COMPRESSION, self.png_level]
+        if self.fmt == 'webp':
+            # OpenCV WebP 는 품질 100 초과면 무손실
+            return [cv2.IMWRITE_WEBP_QUALITY, 101 if self.lossless else self.quality]
+        return [cv2.IMWRITE_JPEG_QUALITY, self.quality,
+                cv2.IMWRITE_JPEG_OPTIMIZE, int(self.optimize),
+                cv2.IMWRITE_JPEG_PROGRESSIVE, int(self.progressive)]
+
+    def jpeg_qscale(self):
+        """JPEG 품질을 ffmpeg mjpeg qscale(2~31, 낮을수록 고품질)로 환산 - 95 → 2"""
+        return max(2, min(31, round((100 - self.quality) / 5) + 1))
+
+    def ffmpeg_args(self):
+        """ffmpeg 이미지 출력 인코더 옵션"""
+        if self.fmt == 'png':
+            return ['-c:v', 'png', '-compression_level', str(self.png_level)]
+        if self.fmt == 'webp':
+            args = ['-c:v', 'libwebp']
+            return args + (['-lossless', '1'] if self.lossless else ['-quality', str(self.quality)])
+        args = ['-c:v', 'mjpeg', '-qscale:v', str(self.jpeg_qscale())]
+        if self.optimize:
+            args += ['-huffman', 'optimal']
+        return args
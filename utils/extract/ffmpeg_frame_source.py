@@ -0,0 +1,172 @@
+import subprocess
+import numpy as np
+from .media_probe import MediaProbe
+
+
+class FFmpegFrameSource:
+    """ffmpeg -f rawvideo -pix_fmt bgr24 파이프로 프레임을 읽는 디코더 백엔드
+
+    stdout 에서 고정 크기 프레임을 미리 만들어 둔 NumPy 버퍼에 readinto 로 바로 읽어
+    프레임마다 새 배열을 만들지 않는다. 버퍼는 buffers 개를 돌려 쓰므로, 받은 프레임은
+    이후 buffers - 1 장을 더 받기 전까지만 유효하다 (오래 보관하려면 복사).
+    건너뛰는 프레임은 별도 버퍼에 읽어 버리므로 버퍼 순환에 포함되지 않는다 - 단, 받은 뒤
+    소비 측에서 걸러내는 프레임(장면 검출, 중복 제거)은 순환에 포함된다.
+    입력 탐색(-ss)과 ffmpeg 내부 crop/scale/fps 필터, 키프레임만 디코딩(-skip_frame)을 지원한다.
+    """
+
+    # 기본 버퍼 개수 - 소비 측 대기열에 머무는 프레임 수보다 커야 함
+    DEFAULT_BUFFERS = 4
+
+    def __init__(self, input_path, width, height, start_time=None, end_time=None,
+                 scale=None, fps=None, skip_frame=None, ffmpeg_executable='ffmpeg',
+                 buffers=None, crop=None):
+        """
+        Args:
+            input_path: 입력 비디오 경로
+            width, height: 디코딩된 원본 프레임 크기 (scale 이 없을 때 출력 크기)
+            start_time: 입력 탐색 시작 초 (-ss, 입력 앞)
+            end_time: 종료 초 (-to)
+            scale: (가로, 세로) - ffmpeg scale 필터로 축소/확대
+            fps: ffmpeg fps 필터로 출력 프레임레이트 변환
+            skip_frame: 디코더 -skip_frame 값 (예: 'nokey' 면 키프레임만)
+            buffers: 돌려 쓸 프레임 버퍼 개수
+            crop: (x, y, 가로, 세로) - ffmpeg crop 필터로 관심 영역만 출력 (scale 보다 먼저)
+        """
+        self.input_path = input_path
+        if scale:
+            self.width, self.height = int(scale[0]), int(scale[1])
+        elif crop:
+            self.width, self.height = int(crop[2]), int(crop[3])
+        else:
+            self.width, self.height = int(width), int(height)
+        if self.width <= 0 or self.height <= 0:
+            raise ValueError(f"프레임 크기를 알 수 없습니다: {self.width}x{self.height}")
+        self.start_time = start_time
+        self.end_time = end_time
+        self.scale = scale
+        self.crop = crop
+        self.fps = fps
+        self.skip_frame = skip_frame
+        self.ffmpeg_executable = ffmpeg_executable
+        self.buffers = max(2, int(buffers or FFmpegFrameSource.DEFAULT_BUFFERS))
+        # 정상 종료되지 않았을 때 원인 확인용
+        self.returncode = None
+
+    @property
+    def frame_size(self):
+        return self.width * self.height * 3
+
+    def build_command(self):
+        command = [self.ffmpeg_executable, '-v', 'error', '-nostdin']
+        if self.skip_frame:
+            command += ['-skip_frame', self.skip_frame]
+        if self.start_time:
+            command += ['-ss', f"{float(self.start_time):.6f}"]
+        if self.end_time is not None:
+            command += ['-to', f"{float(self.end_time):.6f}"]
+        command += ['-i', self.input_path, '-map', '0:v:0', '-an', '-sn']
+
+        filters = []
+        if self.crop:
+            x, y, w, h = self.crop
+            filters.append(f"crop={w}:{h}:{x}:{y}")
+        if self.fps:
+            filters.append(f"fps={self.fps}")
+        if self.scale:
+            filters.append(f"scale={self.width}:{self.height}:flags=area")
+        if filters:
+            command += ['-vf', ','.join(filters)]
+        else:
+            command += ['-vsync', 'passthrough']
+        command += ['-f', 'rawvideo', '-pix_fmt', 'bgr24', 'pipe:1']
+        return command
+
+    def read(self, cancel_event=None, limit=None):
+        """(H, W, 3) uint8 프레임을 출력 순서대로 생성 (버퍼 재사용)
+
+        Args:
+            cancel_event: 취소 이벤트 (attach_process 가 있으면 ffmpeg 즉시 종료)
+            limit: 최대 프레임 수 - 채우면 ffmpeg 를 종료
+        """
+        reader = self.read_selected(None, cancel_event, limit)
+        try:
+            for _, frame in reader:
+                yield frame
+        finally:
+            reader.close()  # ffmpeg 종료
+
+    def read_selected(self, keep, cancel_event=None, limit=None):
+        """keep(출력 순번) 이 참인 프레임만 (출력 순번, frame) 으로 생성
+
+        버퍼는 생성한 프레임에만 돌려 쓰고, 버리는 프레임은 전용 버퍼 하나에 읽는다.
+        keep 이 None 이면 모든 프레임을 생성한다.
+        """
+        pool = [np.empty((self.height, self.width, 3), np.uint8) for _ in range(self.buffers)]
+        views = [memoryview(buf).cast('B') for buf in pool]
+        scratch = memoryview(np.empty(self.frame_size, np.uint8)) if keep else None
+        frame_size = self.frame_size
+        count = 0
+        yielded = 0
+
+        process = subprocess.Popen(
+            self.build_command(), stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            stdin=subprocess.DEVNULL)
+        if hasattr(cancel_event, 'attach_process'):
+            cancel_event.attach_process(process)
+        try:
+            while limit is None or count < limit:
+                if cancel_event and cancel_event.is_set():
+                    return
+                wanted = keep is None or keep(count)
+                view = views[yielded % self.buffers] if wanted else scratch
+                filled = 0
+                while filled < frame_size:
+                    n = process.stdout.readinto(view[filled:])
+                    if not n:
+                        return  # EOF - 남은 조각은 버림
+                    filled += n
+                if wanted:
+                    yield count, pool[yielded % self.buffers]
+                    yielded += 1
+                count += 1
+        finally:
+            if process.poll() is None:
+                process.kill()
+            self.returncode = process.wait()
+            process.stdout.close()
+            if hasattr(cancel_event, 'detach_process'):
+                cancel_event.detach_process(process)
+
+    def iter_frames(self, first_frame, frame_numbers, cancel_event=None):
+        """first_frame 부터 순차 디코딩하며 frame_numbers 에 해당하는 (frame_number, frame) 생성
+
+        start_time 이 first_frame 의 시각이어야 하며, 사이 프레임은 파이프에서 읽고 버린다.
+        """
+        if not frame_numbers:
+            return
+        wanted = {frame_number - first_frame for frame_number in frame_numbers}
+        limit = frame_numbers[-1] - first_frame + 1
+        reader = self.read_selected(wanted.__contains__, cancel_event, limit=limit)
+        try:
+            for index, frame in reader:
+                yield first_frame + index, frame
+        finally:
+            reader.close()  # ffmpeg 종료
+
+    @staticmethod
+    def probe(input_path, ffmpeg_executable='ffmpeg'):
+        """첫 비디오 스트림의 크기/FPS/프레임 수 조회 (MediaProbe 캐시 사용, 실패 시 None)
+
+        Returns:
+            dict: {'width', 'height', 'fps', 'frame_count', 'duration'}
+        """
+        info = MediaProbe.probe(input_path, ffmpeg_executable)
+        if info is None or info.width <= 0 or info.height <= 0:
+            return None
+        return {
+            'width': info.width,
+            'height': info.height,
+            'fps': info.fps,
+            'frame_count': info.frame_count,
+            'duration': info.video.duration or info.duration,
+        }
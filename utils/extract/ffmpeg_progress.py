@@ -0,0 +1,140 @@
+import time
+
+
+class FFmpegProgress:
+    """ffmpeg `-progress pipe:1` 출력(key=value 줄)을 누적 파싱해 진행률 계산
+
+    ffmpeg는 progress=continue/end 줄로 한 블록을 끝내며, 블록마다 out_time_ms
+    (이름과 달리 마이크로초), speed(예: '2.35x'), fps 등을 출력한다.
+    """
+
+    # ffmpeg 커맨드에 추가하는 인자 (실행 파일 바로 뒤에 삽입)
+    ARGS = ['-progress', 'pipe:1', '-nostats']
+
+    def __init__(self, duration=None):
+        # 출력 예상 길이(초) - 없으면 퍼센트/ETA 계산 불가
+        self.duration = duration if duration and duration > 0 else None
+        self.out_time = 0.0
+        self.speed = None
+        self.fps = None
+        self.finished = False
+        # 수신한 진행 블록 수 (새 블록이 있을 때만 UI 갱신)
+        self.updates = 0
+        self.started_at = time.monotonic()
+        # 마지막 진행 블록 수신 시각 (멈춤 감지용)
+        self.last_update = self.started_at
+        self._values = {}
+
+    @staticmethod
+    def with_progress_args(command):
+        """커맨드에 -progress pipe:1 -nostats 추가 (이미 있으면 그대로)"""
+        if '-progress' in command:
+            return list(command)
+        return [command[0]] + FFmpegProgress.ARGS + list(command[1:])
+
+    def feed_line(self, line):
+        """출력 한 줄 처리. 블록이 끝났으면 True 반환"""
+        key, sep, value = line.strip().partition('=')
+        if not sep:
+            return False
+        key, value = key.strip(), value.strip()
+
+        if key != 'progress':
+            self._values[key] = value
+            return False
+
+        self._apply_block()
+        if value == 'end':
+            self.finished = True
+        return True
+
+    def _apply_block(self):
+        """한 블록의 값으로 상태 갱신"""
+        values, self._values = self._values, {}
+        self.updates += 1
+        # 출력측 -ss 로 앞부분을 버리는 동안에도 ffmpeg는 블록을 계속 출력하므로
+        # 출력 위치가 아닌 블록 수신 여부로 멈춤을 판단
+        self.last_update = time.monotonic()
+
+        out_time = None
+        for key in ('out_time_us', 'out_time_ms'):
+            # out_time_ms 도 실제로는 마이크로초 단위
+            try:
+                out_time = int(values[key]) / 1_000_000
+                break
+            except (KeyError, ValueError):
+                continue
+        if out_time is not None and out_time > self.out_time:
+            self.out_time = out_time
+
+        speed = values.get('speed', '').rstrip('x').strip()
+        try:
+            self.speed = float(speed)
+        except ValueError:
+            pass
+        try:
+            self.fps = float(values.get('fps', ''))
+        except ValueError:
+            pass
+
+    @property
+    def percent(self):
+        """진행률(0-100) - 길이를 모르면 None"""
+        if self.finished:
+            return 100.0
+        if not self.duration:
+            return None
+        return max(0.0, min(100.0, self.out_time / self.duration * 100))
+
+    @property
+    def eta(self):
+        """남은 예상 시간(초) - 계산 불가면 None"""
+        if self.finished:
+            return 0.0
+        if not self.duration or self.out_time <= 0:
+            return None
+        elapsed = time.monotonic() - self.started_at
+        remaining = max(0.0, self.duration - self.out_time)
+        if self.speed:
+            return remaining / self.speed
+        # speed 값이 N/A 인 경우 경과 시간 비율로 추정
+        return elapsed * remaining / self.out_time
+
+    def stalled_for(self):
+        """마지막 진행 블록 수신 후 지난 시간(초)"""
+        return time.monotonic() - self.last_update
+
+    def snapshot(self):
+        """UI/로그용 현재 상태 dict"""
+        return {
+            'percent': self.percent,
+            'out_time': self.out_time,
+            'duration': self.duration,
+            'speed': self.speed,
+            'fps': self.fps,
+            'eta': self.eta,
+        }
+
+    def format_status(self, label="추출 중"):
+        """'추출 중 42% · 3.1x · 12fps · 남은 시간 0:15' 형태의 상태 문구"""
+        parts = [label]
+        if self.percent is not None:
+            parts[0] += f" {self.percent:.0f}%"
+        if self.speed:
+            parts.append(f"{self.speed:.1f}x")
+        if self.fps:
+            parts.append(f"{self.fps:.0f}fps")
+        eta = self.eta
+        if eta is not None and not self.finished:
+            parts.append(f"남은 시간 {FFmpegProgress.format_eta(eta)}")
+        return " · ".join(parts)
+
+    @staticmethod
+    def format_eta(seconds):
+        """초 → 'M:SS' 또는 'H:MM:SS'"""
+        seconds = int(round(seconds))
+        hours, rest = divmod(seconds, 3600)
+        minutes, secs = divmod(rest, 60)
+        if hours:
+            return f"{hours}:{minutes:02d}:{secs:02d}"
+        return f"{minutes}:{secs:02d}"
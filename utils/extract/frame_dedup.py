@@ -0,0 +1,97 @@
+import os
+import json
+import cv2
+import numpy as np
+
+
+class FrameDeduplicator:
+    """지각 해시(dHash/aHash)로 거의 같은 연속 프레임을 JPEG 인코딩 전에 걸러냄
+
+    마지막으로 저장한 프레임과의 해시 해밍 거리가 threshold 이하이면 건너뛰고,
+    저장한 프레임마다 자신이 대표하는 프레임 범위를 기록해 manifest 로 남긴다.
+    """
+
+    METHODS = ('dhash', 'ahash')
+    # 해시 한 변의 크기 (8이면 64비트 해시)
+    DEFAULT_HASH_SIZE = 8
+    # 64비트 해시 기준 기본 허용 거리 - 압축 노이즈 수준의 차이만 같은 프레임으로 봄
+    DEFAULT_THRESHOLD = 4
+
+    def __init__(self, threshold=None, method='dhash', hash_size=None):
+        if method not in FrameDeduplicator.METHODS:
+            raise ValueError(f"지원하지 않는 해시 방식: {method}")
+        self.threshold = (FrameDeduplicator.DEFAULT_THRESHOLD
+                          if threshold is None else int(threshold))
+        if self.threshold < 0:
+            raise ValueError(f"threshold 는 0 이상이어야 합니다: {threshold}")
+        self.method = method
+        self.hash_size = hash_size or FrameDeduplicator.DEFAULT_HASH_SIZE
+        # 저장한 프레임 번호 → [대표 시작 프레임, 대표 끝 프레임]
+        self.ranges = {}
+        self.skipped = 0
+
+    def compute_hash(self, frame):
+        """프레임의 지각 해시 (bool 배열, hash_size * hash_size 비트)"""
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY) if frame.ndim == 3 else frame
+        size = self.hash_size
+        if self.method == 'dhash':
+            # 가로로 한 칸 더 줄여 이웃 픽셀 밝기 비교
+            thumb = cv2.resize(gray, (size + 1, size), interpolation=cv2.INTER_AREA)
+            return (thumb[:, 1:] > thumb[:, :-1]).ravel()
+        thumb = cv2.resize(gray, (size, size), interpolation=cv2.INTER_AREA)
+        return (thumb > thumb.mean()).ravel()
+
+    @staticmethod
+    def hamming(hash_a, hash_b):
+        return int(np.count_nonzero(hash_a != hash_b))
+
+    def filter(self, frames):
+        """(frame_number, frame) iterable 에서 중복이 아닌 프레임만 생성"""
+        self.ranges = {}
+        self.skipped = 0
+        last_hash = None
+        last_kept = None
+
+        for frame_number, frame in frames:
+            frame_hash = self.compute_hash(frame)
+            if last_hash is not None and \
+                    FrameDeduplicator.hamming(last_hash, frame_hash) <= self.threshold:
+                self.ranges[last_kept][1] = frame_number
+                self.skipped += 1
+                continue
+
+            last_hash = frame_hash
+            last_kept = frame_number
+            self.ranges[frame_number] = [frame_number, frame_number]
+            yield frame_number, frame
+
+    def write_manifest(self, manifest_path, path_for, fps):
+        """저장 프레임과 대표 프레임 범위를 JSON 으로 기록
+
+        Args:
+            path_for: frame_number → 이미지 경로 함수 (파일명 기록용)
+            fps: 시각(초) 계산용
+        """
+        entries = []
+        for frame_number, (first, last) in sorted(self.ranges.items()):
+            entries.append({
+                'file': os.path.basename(path_for(frame_number)),
+                'frame': frame_number,
+                'first_frame': first,
+                'last_frame': last,
+                'start_time': round(first / fps, 3),
+                'end_time': round((last + 1) / fps, 3),
+            })
+
+        manifest = {
+            'method': self.method,
+            'hash_bits': self.hash_size * self.hash_size,
+            'threshold': self.threshold,
+            'fps': fps,
+            'kept': len(entries),
+            'skipped': self.skipped,
+            'frames': entries,
+        }
+        with open(manifest_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        return manifest_path
@@ -0,0 +1,196 @@
+import os
+import queue
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import cv2
+
+
+class FramePipeline:
+    """디코딩 → JPEG 인코딩 → 파일 쓰기를 겹쳐 실행하는 프레임 저장 파이프라인
+
+    디코더 스레드 1개가 프레임을 읽어 대기열에 넣고, 인코더 스레드 풀이
+    cv2.imencode 로 병렬 인코딩하며(인코딩 중 GIL 해제), 쓰기 스레드 1개가
+    제출 순서대로 결과를 파일에 기록한다. 대기열 크기(queue_depth)로 메모리에
+    올라가는 프레임 수를 제한한다.
+    """
+
+    # 디코딩/인코딩 대기열 기본 크기 (각 대기열에 최대 이만큼의 프레임이 머무름)
+    DEFAULT_QUEUE_DEPTH = 16
+    # 인코더 스레드 기본 최대 개수
+    MAX_DEFAULT_WORKERS = 8
+
+    # 대기열 종료 표시
+    _DONE = object()
+
+    def __init__(self, encode_workers=None, queue_depth=None, ext='.jpg', encode_params=None,
+                 transform=None):
+        """
+        Args:
+            transform: 인코딩 직전 인코더 스레드에서 적용할 frame → frame 함수 (예: 크기 변경)
+        """
+        self.encode_workers = max(1, encode_workers or FramePipeline.default_worker_count())
+        self.queue_depth = max(1, queue_depth or FramePipeline.DEFAULT_QUEUE_DEPTH)
+        self.ext = ext
+        self.encode_params = list(encode_params or [])
+        self.transform = transform
+        # 마지막 run() 의 인코딩 통계 (프로파일 비교용)
+        self.stats = {}
+
+    def encode(self, frame):
+        """(인코더 스레드) transform 적용 후 이미지 인코딩 - cv2.imencode 결과 반환"""
+        if self.transform is not None:
+            frame = self.transform(frame)
+        return cv2.imencode(self.ext, frame, self.encode_params)
+
+    def _timed_encode(self, frame):
+        started = time.perf_counter()
+        ok, buf = self.encode(frame)
+        return ok, buf, time.perf_counter() - started
+
+    @property
+    def frames_in_flight(self):
+        """동시에 메모리에 머물 수 있는 최대 프레임 수 (두 대기열 + 대기열에 넣는 중인 프레임)"""
+        return self.queue_depth * 2 + self.encode_workers + 3
+
+    @staticmethod
+    def link_or_copy(source_path, target_path):
+        """같은 이미지를 여러 폴더에 둘 때 하드링크 (지원하지 않는 파일시스템이면 복사)"""
+        if os.path.exists(target_path):
+            os.remove(target_path)
+        try:
+            os.link(source_path, target_path)
+        except OSError:
+            shutil.copyfile(source_path, target_path)
+
+    @staticmethod
+    def default_worker_count():
+        """CPU 코어 수 기준 인코더 스레드 수 (디코더/쓰기 스레드 몫 1개 제외)"""
+        cpu_count = os.cpu_count() or 1
+        return max(1, min(cpu_count - 1, FramePipeline.MAX_DEFAULT_WORKERS))
+
+    def run(self, frames, path_for, progress_callback=None, cancel_event=None, total=0,
+            progress_fn=None, sink=None):
+        """프레임을 인코딩해 파일로 저장
+
+        Args:
+            frames: (frame_number, frame) 를 내는 iterable - 디코더 스레드에서 소비
+            path_for: frame_number → 저장 경로 함수 (경로 목록이면 한 번 인코딩해
+                      첫 경로에 쓰고 나머지는 하드링크)
+            progress_callback: progress_callback(progress, extracted_count, total)
+            cancel_event: 취소 이벤트 (설정되면 디코딩/쓰기 중단)
+            total: 진행률 계산용 전체 저장 예정 개수
+            progress_fn: 진행률(0-100)을 직접 계산하는 함수 - 저장 개수를 미리 알 수 없을 때
+            sink: 출력 싱크 (frame_sinks) - 주어지면 path_for 의 파일명으로 sink.write,
+                  없으면 path_for 경로에 파일로 저장
+        Returns:
+            int: 저장된 이미지 개수
+        """
+        decoded = queue.Queue(maxsize=self.queue_depth)
+        encoded = queue.Queue(maxsize=self.queue_depth)
+        errors = []
+        state = {'extracted_count': 0, 'encode_seconds': 0.0, 'encoded_bytes': 0}
+
+        def is_cancelled():
+            return cancel_event is not None and cancel_event.is_set()
+
+        def put(target, item):
+            # 하류가 멈춘 경우(오류/취소) 영원히 막히지 않도록 주기적으로 취소 확인
+            while True:
+                try:
+                    target.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    if is_cancelled() or errors:
+                        return False
+
+        def decode_loop():
+            try:
+                for frame_number, frame in frames:
+                    if is_cancelled() or errors:
+                        break
+                    if not put(decoded, (frame_number, frame)):
+                        break
+            except Exception as e:
+                errors.append(e)
+            finally:
+                decoded.put(FramePipeline._DONE)
+
+        def write_loop():
+            while True:
+                item = encoded.get()
+                if item is FramePipeline._DONE:
+                    return
+                frame_number, future = item
+                filepaths = path_for(frame_number)
+                if isinstance(filepaths, str):
+                    filepaths = [filepaths]
+                filepath = filepaths[0]
+                try:
+                    ok, buf, seconds = future.result()
+                    if is_cancelled():
+                        continue  # 취소 후에는 남은 결과를 버림
+                    if not ok:
+                        raise IOError('imencode 실패')
+                    state['encode_seconds'] += seconds
+                    state['encoded_bytes'] += buf.nbytes
+                    if sink is not None:
+                        for path in filepaths:
+                            sink.write(os.path.basename(path), buf)
+                    else:
+                        # 파일저장 (유니코드 경로 안전)
+                        buf.tofile(filepath)
+                        for path in filepaths[1:]:
+                            FramePipeline.link_or_copy(filepath, path)
+                except Exception as e:
+                    print(f"저장 실패: {filepath} - {e}")
+                    continue
+                print(f"저장됨: {filepath}")
+                state['extracted_count'] += 1
+
+                # 진행률 콜백
+                try:
+                    if progress_callback:
+                        progress = (progress_fn() if progress_fn else
+                                    state['extracted_count'] / max(1, total) * 100.0)
+                        progress_callback(progress, state['extracted_count'], total)
+                except Exception:
+                    pass
+
+        decoder = threading.Thread(target=decode_loop, name="frame-decoder", daemon=True)
+        writer = threading.Thread(target=write_loop, name="frame-writer", daemon=True)
+        decoder.start()
+        writer.start()
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.encode_workers,
+                                    thread_name_prefix="frame-encoder") as pool:
+                while True:
+                    item = decoded.get()
+                    if item is FramePipeline._DONE:
+                        break
+                    frame_number, frame = item
+                    future = pool.submit(self._timed_encode, frame)
+                    # encoded 대기열이 가득 차면 인코딩 중인 프레임 수도 queue_depth 로 제한됨
+                    if not put(encoded, (frame_number, future)):
+                        break
+        finally:
+            # 디코더가 put 에서 막혀 있으면 풀어준 뒤 종료 대기
+            while decoder.is_alive():
+                try:
+                    decoded.get(timeout=0.1)
+                except queue.Empty:
+                    pass
+            encoded.put(FramePipeline._DONE)
+            writer.join()
+
+        count = state['extracted_count']
+        self.stats = {
+            'frames': count,
+            'encode_ms_per_frame': state['encode_seconds'] * 1000.0 / count if count else 0.0,
+            'bytes_per_frame': state['encoded_bytes'] / count if count else 0.0,
+        }
+        if errors:
+            raise errors[0]
+        return count
@@ -0,0 +1,155 @@
+import bisect
+import cv2
+import numpy as np
+
+
+class FrameSampler:
+    """이미지 추출 시 저장할 프레임을 고르는 샘플링 전략
+
+    전략:
+    - 'every_nth': 구간 시작부터 N 프레임마다 1장
+    - 'target_fps': 초당 target_fps 장 (프레임별 PTS 를 주면 실제 타임스탬프 기준,
+      없으면 원본이 고정 fps 라고 가정하고 프레임 번호로 계산)
+    - 'timestamps': 지정한 시각(초) 목록에 가장 가까운 프레임
+
+    iter_frames() 는 저장하지 않을 프레임을 cap.grab() 으로 건너뛰고(색변환 생략)
+    저장할 프레임만 cap.retrieve() 하며, 간격이 크면 cap.set() 으로 바로 탐색한다.
+    """
+
+    STRATEGIES = ('every_nth', 'target_fps', 'timestamps')
+    # 다음 프레임까지 이 시간(초) 이상 떨어져 있으면 grab 대신 탐색으로 이동
+    SEEK_GAP_SECONDS = 10.0
+    # 키프레임 위치를 알 때, 탐색으로 건너뛰는 구간이 이 시간(초)보다 짧으면 grab 으로 진행
+    # (탐색 1회 비용이 대략 수십 프레임 디코딩과 비슷함)
+    MIN_SEEK_SECONDS = 2.0
+
+    def __init__(self, strategy='every_nth', every_n=1, target_fps=None, timestamps=None):
+        if strategy not in FrameSampler.STRATEGIES:
+            raise ValueError(f"지원하지 않는 샘플링 전략: {strategy}")
+        if strategy == 'every_nth' and int(every_n) < 1:
+            raise ValueError(f"every_n 은 1 이상이어야 합니다: {every_n}")
+        if strategy == 'target_fps' and not (target_fps and target_fps > 0):
+            raise ValueError(f"target_fps 는 0보다 커야 합니다: {target_fps}")
+        if strategy == 'timestamps' and not timestamps:
+            raise ValueError("timestamps 전략에는 시각 목록이 필요합니다.")
+
+        self.strategy = strategy
+        self.every_n = int(every_n)
+        self.target_fps = target_fps
+        self.timestamps = sorted(float(t) for t in (timestamps or []))
+
+    @classmethod
+    def every_nth(cls, n):
+        return cls('every_nth', every_n=n)
+
+    @classmethod
+    def at_fps(cls, target_fps):
+        return cls('target_fps', target_fps=float(target_fps))
+
+    @classmethod
+    def at_timestamps(cls, timestamps):
+        return cls('timestamps', timestamps=timestamps)
+
+    def plan(self, start_frame, end_frame, fps, pts=None):
+        """[start_frame, end_frame] 에서 저장할 프레임 번호 목록(오름차순, 중복 없음)
+
+        pts 는 프레임 번호별 표시 시각(초) 배열 (MediaIndex.pts). 주어지면 'target_fps' 는
+        목표 시각마다 그때 표시 중인 프레임을 골라 가변 프레임레이트(VFR)에서도 간격이 맞는다.
+        """
+        if end_frame < start_frame:
+            return []
+
+        if self.strategy == 'every_nth':
+            return list(range(start_frame, end_frame + 1, self.every_n))
+
+        if self.strategy == 'target_fps' and pts is not None and start_frame < len(pts):
+            end_frame = min(end_frame, len(pts) - 1)
+            times = np.arange(pts[start_frame], pts[end_frame] + 1e-6, 1.0 / self.target_fps)
+            frames = np.searchsorted(pts, times + 1e-6, 'right') - 1
+            return np.unique(frames[frames >= start_frame]).tolist()
+
+        if self.strategy == 'target_fps':
+            # 고정 fps 가정 - k 번째 목표 시각을 프레임 번호로 환산
+            if self.target_fps >= fps:
+                return list(range(start_frame, end_frame + 1))
+            start_sec = start_frame / fps
+            step = 1.0 / self.target_fps
+            frames, k = [], 0
+            while True:
+                frame_number = int(round((start_sec + k * step) * fps))
+                if frame_number > end_frame:
+                    break
+                if not frames or frame_number > frames[-1]:
+                    frames.append(frame_number)
+                k += 1
+            return frames
+
+        # timestamps
+        frames = sorted({int(round(t * fps)) for t in self.timestamps})
+        return [f for f in frames if start_frame <= f <= end_frame]
+
+    def describe(self):
+        """로그용 설명 문구"""
+        if self.strategy == 'every_nth':
+            return f"{self.every_n}프레임마다 1장"
+        if self.strategy == 'target_fps':
+            return f"초당 {self.target_fps:g}장"
+        return f"지정 시각 {len(self.timestamps)}개"
+
+    @staticmethod
+    def iter_frames(cap, frame_numbers, fps=30.0, cancel_event=None, seek_gap_seconds=None,
+                    keyframes=None):
+        """frame_numbers 에 해당하는 (frame_number, frame) 을 순서대로 생성
+
+        Args:
+            cap: 열린 cv2.VideoCapture
+            frame_numbers: 오름차순 프레임 번호 목록 (plan() 결과)
+            fps: 탐색 여부 판단용 FPS
+            cancel_event: 취소 이벤트
+            seek_gap_seconds: 이 간격(초)을 넘으면 탐색 (기본 SEEK_GAP_SECONDS, 0이면 항상 탐색)
+            keyframes: 키프레임 번호 정렬 배열 (MediaIndex) - 주어지면 간격 대신
+                       건너뛸 수 있는 키프레임이 있을 때만 탐색
+        """
+        if not frame_numbers:
+            return
+
+        if seek_gap_seconds is None:
+            seek_gap_seconds = FrameSampler.SEEK_GAP_SECONDS
+        seek_gap = int(seek_gap_seconds * fps)
+        min_seek = int(FrameSampler.MIN_SEEK_SECONDS * fps)
+        # 첫 프레임 위치로 이동
+        cap.set(cv2.CAP_PROP_POS_FRAMES, frame_numbers[0])
+        position = frame_numbers[0]  # 다음에 grab 될 프레임 번호
+
+        for frame_number in frame_numbers:
+            if cancel_event and cancel_event.is_set():
+                print("[ImageExtractor] 취소 요청 감지 - 추출 중단")
+                return
+
+            if keyframes is not None:
+                # 탐색은 직전 키프레임부터 디코딩하므로 그 키프레임이 현재 위치보다
+                # 충분히 앞에 있을 때만 이득
+                i = bisect.bisect_right(keyframes, frame_number) - 1
+                seek = frame_number < position or (
+                    i >= 0 and keyframes[i] - position > min_seek)
+            else:
+                seek = frame_number - position > seek_gap or frame_number < position
+            if seek:
+                # 멀리 떨어진 프레임은 탐색으로 이동 (사이 구간 디코딩 생략)
+                cap.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
+                position = frame_number
+
+            # 저장하지 않을 프레임은 grab 만 해서 색변환 비용 절약
+            while position < frame_number:
+                if not cap.grab():
+                    return
+                position += 1
+
+            if not cap.grab():
+                return
+            position += 1
+            ret, frame = cap.retrieve()
+            if not ret:
+                return
+            yield frame_number, frame
+
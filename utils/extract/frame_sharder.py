@@ -0,0 +1,165 @@
+import os
+import queue
+import bisect
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_EXCEPTION
+from utils.image_utils import ImageUtils
+from .video_extractor import VideoExtractor
+from .media_probe import MediaProbe
+from .frame_pipeline import FramePipeline
+from .frame_sampler import FrameSampler
+
+
+class FrameSharder:
+    """긴 구간을 키프레임 경계로 나눠 여러 프로세스에서 동시에 디코딩하는 프레임 추출
+
+    각 샤드는 자기 프로세스에서 VideoCapture 를 따로 열고, 전체 구간 기준으로
+    샘플링한 프레임 번호를 그대로 쓰므로 결과 파일은 단일 프로세스
+    추출(ImageExtractor.extract_frames_from_video)과 같다.
+    """
+
+    # 샤드 하나의 최소 길이(초) - 이보다 짧으면 프로세스 생성 비용이 더 큼
+    MIN_SHARD_SECONDS = 5.0
+
+    # 워커 프로세스 전역 (initializer 에서 설정)
+    _progress_queue = None
+    _cancel_flag = None
+
+    @staticmethod
+    def plan_shards(input_path, start_frame, end_frame, fps, shards,
+                    ffmpeg_executable='ffmpeg'):
+        """[start_frame, end_frame] 을 최대 shards 개의 (시작, 끝) 프레임 구간으로 분할
+
+        분할 지점은 균등 분할 위치에서 가장 가까운 키프레임으로 맞춘다 (키프레임에서
+        시작해야 각 프로세스의 탐색이 정확하고 빠름). 키프레임을 못 읽으면 균등 분할.
+        """
+        length = (end_frame - start_frame + 1) / fps
+        shards = max(1, min(shards, int(length // FrameSharder.MIN_SHARD_SECONDS)))
+        if shards <= 1:
+            return [(start_frame, end_frame)]
+
+        # 키프레임 시각(pts_time)은 절대값 - 0번 프레임 시각을 빼서 프레임 번호 기준으로 맞춤
+        info = MediaProbe.probe(input_path, ffmpeg_executable)
+        origin = info.frame_origin if info is not None else 0.0
+        keyframes = VideoExtractor.probe_keyframes(
+            input_path, start_frame / fps + origin, end_frame / fps + origin, window=0.0,
+            ffmpeg_executable=ffmpeg_executable) or []
+        key_frames = sorted({int(round((t - origin) * fps)) for t in keyframes
+                             if start_frame < round((t - origin) * fps) <= end_frame})
+
+        bounds = []
+        step = (end_frame - start_frame + 1) / shards
+        for i in range(1, shards):
+            target = start_frame + int(step * i)
+            if key_frames:
+                target = min(key_frames, key=lambda k: abs(k - target))
+            if (not bounds or target > bounds[-1]) and start_frame < target <= end_frame:
+                bounds.append(target)
+
+        starts = [start_frame] + bounds
+        ends = [b - 1 for b in bounds] + [end_frame]
+        return list(zip(starts, ends))
+
+    @staticmethod
+    def extract(input_path, output_folder, frame_numbers, fps, shards,
+                progress_callback=None, cancel_event=None, ffmpeg_executable='ffmpeg',
+                transform=None, encode_profile=None):
+        """샤드별 프로세스로 frame_numbers(FrameSampler.plan 결과) 추출. 저장 개수 반환"""
+        if not frame_numbers:
+            return 0
+        ranges = FrameSharder.plan_shards(
+            input_path, frame_numbers[0], frame_numbers[-1], fps, shards, ffmpeg_executable)
+        print(f"[FrameSharder] 샤드 {len(ranges)}개: {ranges}")
+
+        # 샤드 구간별 저장할 프레임 번호 (번호는 전체 구간 기준 그대로)
+        shard_frames = [
+            frame_numbers[bisect.bisect_left(frame_numbers, shard_start):
+                          bisect.bisect_right(frame_numbers, shard_end)]
+            for shard_start, shard_end in ranges]
+        total_exports = len(frame_numbers)
+
+        base_filename = ImageUtils.basename_of_videofile(input_path)
+        # 프로세스당 인코더 스레드 수 (전체 코어를 샤드끼리 나눠 씀)
+        encode_workers = max(1, (os.cpu_count() or 1) // len(ranges))
+
+        # Windows 와 동일하게 spawn 사용 (Tk 스레드가 있는 부모를 fork 하지 않음)
+        context = multiprocessing.get_context('spawn')
+        progress_queue = context.Queue()
+        cancel_flag = context.Event()
+        counts = [0] * len(ranges)
+
+        with ProcessPoolExecutor(max_workers=len(ranges), mp_context=context,
+                                 initializer=FrameSharder._init_worker,
+                                 initargs=(progress_queue, cancel_flag)) as pool:
+            futures = [
+                pool.submit(FrameSharder._run_shard, index, input_path, output_folder,
+                            base_filename, numbers, fps, encode_workers, transform,
+                            encode_profile)
+                for index, numbers in enumerate(shard_frames)]
+
+            pending = set(futures)
+            while pending:
+                if cancel_event and cancel_event.is_set():
+                    cancel_flag.set()
+                _, pending = wait(pending, timeout=0.1, return_when=FIRST_EXCEPTION)
+
+                # 샤드 진행률을 모아 기존 콜백 형식으로 전달
+                updated = False
+                while True:
+                    try:
+                        index, count = progress_queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    counts[index] = max(counts[index], count)
+                    updated = True
+                if updated and progress_callback:
+                    extracted_count = sum(counts)
+                    try:
+                        progress_callback(extracted_count / max(1, total_exports) * 100.0,
+                                          extracted_count, total_exports)
+                    except Exception:
+                        pass
+
+                if any(f.done() and f.exception() for f in futures):
+                    cancel_flag.set()  # 한 샤드가 실패하면 나머지도 중단
+
+            for future in futures:
+                if future.exception():
+                    raise future.exception()
+            return sum(future.result() for future in futures)
+
+    @staticmethod
+    def _init_worker(progress_queue, cancel_flag):
+        """워커 프로세스 초기화 - 진행률 큐와 취소 플래그 보관"""
+        FrameSharder._progress_queue = progress_queue
+        FrameSharder._cancel_flag = cancel_flag
+
+    @staticmethod
+    def _run_shard(index, input_path, output_folder, base_filename, frame_numbers, fps,
+                   encode_workers, transform=None, encode_profile=None):
+        """(워커 프로세스) 샤드 하나를 디코딩해 저장하고 저장 개수 반환"""
+        from .image_extractor import ImageExtractor
+
+        def path_for(frame_number):
+            filename = ImageUtils.generate_image_filename(
+                base_filename, frame_number, encode_profile.ext if encode_profile else '.jpg')
+            return os.path.join(output_folder, filename)
+
+        def on_progress(progress, extracted_count, total):
+            FrameSharder._progress_queue.put((index, extracted_count))
+
+        cap = ImageExtractor._open_capture(input_path)
+        try:
+            frames = FrameSampler.iter_frames(
+                cap, frame_numbers, fps, FrameSharder._cancel_flag)
+            if transform is not None:
+                frames = transform.crop_frames(frames)
+            return FramePipeline(
+                encode_workers=encode_workers,
+                ext=encode_profile.ext if encode_profile else '.jpg',
+                encode_params=encode_profile.cv2_params() if encode_profile else None,
+                transform=transform.resize if transform is not None else None).run(
+                frames, path_for, progress_callback=on_progress,
+                cancel_event=FrameSharder._cancel_flag)
+        finally:
+            cap.release()
@@ -0,0 +1,106 @@
+import io
+import os
+import time
+import tarfile
+import zipfile
+
+
+class DirectorySink:
+    """프레임 이미지를 폴더에 개별 파일로 저장 (기본)"""
+
+    kind = 'dir'
+
+    def __init__(self, output_folder):
+        self.output_folder = output_folder
+        self.path = output_folder
+
+    def open(self):
+        os.makedirs(self.output_folder, exist_ok=True)
+        return self
+
+    def write(self, name, buf):
+        # 파일저장 (유니코드 경로 안전)
+        buf.tofile(os.path.join(self.output_folder, name))
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self.open()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class ZipSink(DirectorySink):
+    """프레임을 ZIP 하나에 무압축(stored)으로 순차 기록
+
+    JPEG 은 이미 압축돼 있으므로 재압축하지 않고, 핸들 하나로 이어 쓰기만 해서
+    파일 수천 개를 만들 때의 생성/닫기 비용(NTFS, SMB, 백신 검사)을 피한다.
+    """
+
+    kind = 'zip'
+
+    def __init__(self, archive_path):
+        self.path = archive_path
+        self.output_folder = os.path.dirname(archive_path)
+        self._archive = None
+
+    def open(self):
+        if self.output_folder:
+            os.makedirs(self.output_folder, exist_ok=True)
+        self._archive = zipfile.ZipFile(
+            self.path, 'w', compression=zipfile.ZIP_STORED, allowZip64=True)
+        return self
+
+    def write(self, name, buf):
+        info = zipfile.ZipInfo(name, date_time=time.localtime()[:6])
+        info.compress_type = zipfile.ZIP_STORED
+        self._archive.writestr(info, buf.tobytes())
+
+    def close(self):
+        if self._archive is not None:
+            self._archive.close()
+            self._archive = None
+
+
+class TarSink(ZipSink):
+    """프레임을 tar 하나에 순차 기록 (무압축)"""
+
+    kind = 'tar'
+
+    def open(self):
+        if self.output_folder:
+            os.makedirs(self.output_folder, exist_ok=True)
+        self._archive = tarfile.open(self.path, 'w')
+        return self
+
+    def write(self, name, buf):
+        data = buf.tobytes()
+        info = tarfile.TarInfo(name)
+        info.size = len(data)
+        info.mtime = time.time()
+        self._archive.addfile(info, io.BytesIO(data))
+
+
+class FrameSinks:
+    """출력 방식 이름으로 싱크 생성"""
+
+    KINDS = ('dir', 'zip', 'tar')
+
+    @staticmethod
+    def create(kind, output_folder, archive_name=None):
+        """kind 에 맞는 싱크 생성
+
+        Args:
+            kind: 'dir' | 'zip' | 'tar'
+            output_folder: 저장 폴더 (아카이브는 이 폴더 안에 생성)
+            archive_name: 확장자를 뺀 아카이브 파일명
+        """
+        if kind not in FrameSinks.KINDS:
+            raise ValueError(f"지원하지 않는 출력 방식: {kind}")
+        if kind == 'dir':
+            return DirectorySink(output_folder)
+        archive_name = archive_name or 'frames'
+        archive_path = os.path.join(output_folder, f"{archive_name}.{kind}")
+        return ZipSink(archive_path) if kind == 'zip' else TarSink(archive_path)
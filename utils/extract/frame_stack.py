@@ -0,0 +1,120 @@
+import os
+import json
+import struct
+import cv2
+import numpy as np
+
+
+class FrameStack:
+    """디코딩한 프레임을 (N, H, W, C) uint8 .npy 메모리맵에 그대로 기록
+
+    JPEG 저장과 같은 디코딩 패스에서 프레임을 받아(tap) 미리 할당한 배열에 복사하고,
+    프레임 번호/시각은 같은 이름의 .json 사이드카에 남긴다.
+    분석 도구는 np.load(path, mmap_mode='r') 로 복사 없이 읽을 수 있다.
+    """
+
+    def __init__(self, size=None, grayscale=False):
+        """
+        Args:
+            size: (가로, 세로) 로 축소 저장 (None이면 원본 크기)
+            grayscale: True면 회색조 1채널로 저장 (C=1)
+        """
+        if size is not None:
+            size = (int(size[0]), int(size[1]))
+            if size[0] <= 0 or size[1] <= 0:
+                raise ValueError(f"size 는 0보다 커야 합니다: {size}")
+        self.size = size
+        self.grayscale = bool(grayscale)
+        self.path = None
+        self.sidecar_path = None
+        self.frame_numbers = []
+        self._array = None
+
+    def frame_shape(self, width, height):
+        """원본 크기 기준 저장될 한 프레임의 (H, W, C)"""
+        w, h = self.size or (width, height)
+        return (h, w, 1 if self.grayscale else 3)
+
+    def open(self, path, capacity, width, height):
+        """capacity 장 크기의 .npy 메모리맵을 미리 할당
+
+        capacity 는 저장할 수 있는 최대 장수 - 실제로 덜 저장되면 close() 에서 줄인다.
+        """
+        self.path = path
+        self.sidecar_path = os.path.splitext(path)[0] + '.json'
+        self.frame_numbers = []
+        shape = (max(0, int(capacity)),) + self.frame_shape(width, height)
+        self._array = np.lib.format.open_memmap(path, mode='w+', dtype=np.uint8, shape=shape)
+        print(f"[FrameStack] 할당: {path} shape={shape}")
+        return self
+
+    def _convert(self, frame):
+        if self.grayscale and frame.ndim == 3:
+            frame = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        if self.size is not None and (frame.shape[1], frame.shape[0]) != self.size:
+            frame = cv2.resize(frame, self.size, interpolation=cv2.INTER_AREA)
+        return frame.reshape(self._array.shape[1:])
+
+    def tap(self, frames):
+        """(frame_number, frame) iterable 을 그대로 흘려보내며 배열에 복사"""
+        for frame_number, frame in frames:
+            index = len(self.frame_numbers)
+            if index < len(self._array):
+                self._array[index] = self._convert(frame)
+                self.frame_numbers.append(frame_number)
+            yield frame_number, frame
+
+    def close(self, fps):
+        """플러시 후 실제 저장 장수로 배열을 줄이고 사이드카 JSON 기록
+
+        Returns:
+            str: 사이드카 JSON 경로
+        """
+        if self._array is None:
+            return self.sidecar_path
+        count = len(self.frame_numbers)
+        shape = (count,) + self._array.shape[1:]
+        capacity = len(self._array)
+        self._array.flush()
+        self._array = None  # 메모리맵 해제 (Windows 에서는 해제 전 파일 크기 변경 불가)
+        if count < capacity:
+            FrameStack._shrink(self.path, shape)
+
+        sidecar = {
+            'array': os.path.basename(self.path),
+            'shape': list(shape),
+            'dtype': 'uint8',
+            'channels': 'gray' if self.grayscale else 'bgr',
+            'fps': fps,
+            'frame_numbers': self.frame_numbers,
+            'timestamps': [round(n / fps, 3) for n in self.frame_numbers],
+        }
+        with open(self.sidecar_path, 'w', encoding='utf-8') as f:
+            json.dump(sidecar, f, ensure_ascii=False, indent=2)
+        print(f"[FrameStack] 저장: {self.path} shape={shape}")
+        return self.sidecar_path
+
+    @staticmethod
+    def _shrink(path, shape):
+        """.npy 헤더의 shape 를 제자리에서 고치고 남는 뒷부분을 잘라냄
+
+        헤더는 공백으로 채워진 고정 길이라 장수가 줄어도 같은 길이로 다시 쓸 수 있다.
+        """
+        with open(path, 'r+b') as f:
+            version = np.lib.format.read_magic(f)
+            if version == (1, 0):
+                np.lib.format.read_array_header_1_0(f)
+                length_format = '<H'
+            else:
+                np.lib.format.read_array_header_2_0(f)
+                length_format = '<I'
+            data_offset = f.tell()
+
+            header = "{'descr': '|u1', 'fortran_order': False, 'shape': %r, }" % (shape,)
+            header_len = data_offset - 8 - struct.calcsize(length_format)
+            header = header.ljust(header_len - 1) + '\n'
+            f.seek(0)
+            f.write(np.lib.format.magic(*version))
+            f.write(struct.pack(length_format, header_len))
+            f.write(header.encode('latin1'))
+            f.truncate(data_offset + int(np.prod(shape)))
@@ -0,0 +1,115 @@
+import cv2
+
+
+class FrameTransform:
+    """이미지 저장 전 프레임 자르기(crop)와 크기 변경
+
+    자르기 → 크기 변경 순서로 적용한다. OpenCV 경로에서는 자르기를 NumPy 슬라이스(복사 없음)로,
+    축소를 인코더 스레드의 cv2.resize(INTER_AREA)로 하고, ffmpeg 경로에서는 같은 결과의
+    crop/scale 필터를 ffmpeg 안에서 적용한다. 인코딩/저장할 픽셀 수가 줄어드는 만큼
+    인코딩과 쓰기 비용이 줄어든다.
+    """
+
+    def __init__(self, crop=None, size=None, scale=None):
+        """
+        Args:
+            crop: (x, y, 가로, 세로) 관심 영역
+            size: (가로, 세로) 출력 크기 - scale 과 함께 쓸 수 없음
+            scale: 자른 영역 기준 배율 (예: 0.5)
+        """
+        if size is not None and scale is not None:
+            raise ValueError("size 와 scale 은 함께 지정할 수 없습니다.")
+        if crop is not None:
+            crop = tuple(int(v) for v in crop)
+            if len(crop) != 4 or crop[0] < 0 or crop[1] < 0 or crop[2] <= 0 or crop[3] <= 0:
+                raise ValueError(f"잘못된 crop 영역: {crop}")
+        if size is not None:
+            size = (int(size[0]), int(size[1]))
+            if size[0] <= 0 or size[1] <= 0:
+                raise ValueError(f"size 는 0보다 커야 합니다: {size}")
+        if scale is not None and not scale > 0:
+            raise ValueError(f"scale 은 0보다 커야 합니다: {scale}")
+        self.crop = crop
+        self.size = size
+        self.scale = None if scale is None else float(scale)
+
+    def describe(self):
+        """로그용 설명 문구"""
+        parts = []
+        if self.crop:
+            parts.append("crop {2}x{3}+{0}+{1}".format(*self.crop))
+        if self.size:
+            parts.append(f"resize {self.size[0]}x{self.size[1]}")
+        elif self.scale:
+            parts.append(f"scale x{self.scale:g}")
+        return ', '.join(parts) or '원본'
+
+    def crop_size(self, width, height):
+        """자른 뒤 크기 (가로, 세로) - 영역이 프레임을 벗어나면 ValueError"""
+        if self.crop is None:
+            return width, height
+        x, y, w, h = self.crop
+        if x + w > width or y + h > height:
+            raise ValueError(f"crop 영역 {self.crop} 이 프레임 크기 {width}x{height} 를 벗어납니다.")
+        return w, h
+
+    def output_size(self, width, height):
+        """최종 저장 크기 (가로, 세로)"""
+        w, h = self.crop_size(width, height)
+        if self.size:
+            return self.size
+        if self.scale:
+            return max(1, int(round(w * self.scale))), max(1, int(round(h * self.scale)))
+        return w, h
+
+    @property
+    def resizes(self):
+        return self.size is not None or (self.scale is not None and self.scale != 1.0)
+
+    def crop_frames(self, frames):
+        """(frame_number, frame) iterable 의 프레임을 관심 영역 뷰로 바꿔 생성 (복사 없음)"""
+        if self.crop is None:
+            yield from frames
+            return
+        x, y, w, h = self.crop
+        for frame_number, frame in frames:
+            yield frame_number, frame[y:y + h, x:x + w]
+
+    def resize(self, frame):
+        """(자른) 프레임을 출력 크기로 변경 - 인코더 스레드에서 호출"""
+        if not self.resizes:
+            return frame
+        height, width = frame.shape[:2]
+        if self.size:
+            target = self.size
+        else:
+            target = (max(1, int(round(width * self.scale))),
+                      max(1, int(round(height * self.scale))))
+        if target == (width, height):
+            return frame
+        # 축소는 INTER_AREA (모아레 없음), 확대는 INTER_LINEAR
+        shrink = target[0] * target[1] < width * height
+        return cv2.resize(frame, target,
+                          interpolation=cv2.INTER_AREA if shrink else cv2.INTER_LINEAR)
+
+    def ffmpeg_filters(self, width=None, height=None):
+        """ffmpeg -vf 용 필터 목록 (crop, scale)
+
+        원본 크기를 모르면 배율은 ffmpeg 식(iw, ih)으로 계산한다.
+        """
+        filters = []
+        if self.crop:
+            if width and height:
+                self.crop_size(width, height)
+            x, y, w, h = self.crop
+            filters.append(f"crop={w}:{h}:{x}:{y}")
+        if self.resizes:
+            if self.size:
+                out_w, out_h = self.size
+            elif width and height:
+                out_w, out_h = self.output_size(width, height)
+            else:
+                out_w, out_h = (f"max(1\\,round(iw*{self.scale:g}))",
+                                f"max(1\\,round(ih*{self.scale:g}))")
+            filters.append(f"scale={out_w}:{out_h}:flags=area")
+        return filters
@@ -4,16 +4,49 @@ import cv2
 import subprocess
 from utils.utils import VideoUtils
 from utils.image_utils import ImageUtils
+from .frame_pipeline import FramePipeline
+from .frame_sampler import FrameSampler
+from .scene_detector import SceneDetector
+from .frame_sinks import FrameSinks
+from .contact_sheet import ContactSheet
+from .encode_profile import EncodeProfile
+from .frame_transform import FrameTransform
+from .ffmpeg_frame_source import FFmpegFrameSource
+from .media_index import MediaIndex
+from .media_probe import MediaProbe
+from .video_extractor import VideoExtractor
 
 
 class ImageExtractor:
-    """OpenCV를 사용하여 비디오 프레임을 이미지로 추출"""
+    """OpenCV를 사용하여 비디오 프레임을 이미지로 추출
+
+    추출 모드:
+    - 'all': 샘플링 전략(FrameSampler)에 따라 프레임 저장 (기본)
+    - 'keyframes': I-프레임(키프레임)만 저장 - ffmpeg -skip_frame nokey 로 P/B 프레임 디코딩 생략
+    - 'scene': 장면 전환 프레임만 저장 (SceneDetector)
+    - 'contact_sheet': 구간 전체를 K장의 축소 이미지로 모은 한 장만 저장 (ContactSheet)
+
+    디코더:
+    - 'opencv': cv2.VideoCapture
+    - 'ffmpeg': ffmpeg rawvideo 파이프 (FFmpegFrameSource)
+    - 'auto': 파일마다 OpenCV로 첫 프레임을 읽어 보고, 안 되면 ffmpeg (기본)
+    """
+
+    IMAGE_MODES = ('all', 'keyframes', 'scene', 'contact_sheet')
+    DECODERS = ('opencv', 'ffmpeg', 'auto')
 
     @staticmethod
     def extract_frames_from_video(input_path, output_folder, start_time, end_time,
-                                  progress_callback=None, cancel_event=None):
+                                  progress_callback=None, cancel_event=None,
+                                  encode_workers=None, queue_depth=None, shards=1,
+                                  ffmpeg_executable='ffmpeg', sampler=None, mode='all',
+                                  scene_threshold=None, deduplicator=None, output_sink='dir',
+                                  frame_stack=None, decoder='auto', transform=None,
+                                  encode_profile=None, contact_sheet=None):
         """비디오에서 프레임 추출 (퍼블릭 API)
 
+        디코딩/JPEG 인코딩/파일 쓰기는 FramePipeline 에서 서로 겹쳐 실행된다.
+
         Args:
             input_path: 입력 비디오 경로
             output_folder: 출력 폴더 경로
@@ -21,24 +54,54 @@ class ImageExtractor:
             end_time: 종료 초
             progress_callback: 진행률 콜백(progress, extracted_count, total_frames)
             cancel_event: 취소 이벤트
+            encode_workers: JPEG 인코더 스레드 수 (None이면 CPU 코어 수 기준)
+            queue_depth: 파이프라인 대기열 크기 - 메모리에 머무는 프레임 수 상한
+            shards: 2 이상이면 구간을 키프레임 경계로 나눠 프로세스별로 디코딩 (FrameSharder)
+            ffmpeg_executable: 샤드 분할용 키프레임 조회에 쓰는 ffmpeg 경로
+            sampler: 저장할 프레임 선택 전략 (FrameSampler, None이면 fps 기준 프레임 스킵)
+            mode: 추출 모드 ('all' | 'keyframes' | 'scene' | 'contact_sheet', IMAGE_MODES)
+            scene_threshold: 'scene' 모드 장면 전환 판정 기준 (0~1)
+            deduplicator: 거의 같은 연속 프레임 생략 (FrameDeduplicator) - 사용 시 manifest 기록
+            output_sink: 저장 방식 ('dir' 개별 파일 | 'zip' | 'tar' 아카이브 1개, FrameSinks.KINDS)
+            frame_stack: 저장하는 프레임을 .npy 메모리맵에도 기록 (FrameStack)
+            decoder: 프레임 디코더 ('opencv' | 'ffmpeg' | 'auto', DECODERS)
+            transform: 인코딩 전 자르기/크기 변경 (FrameTransform)
+            encode_profile: 이미지 형식/품질 (EncodeProfile, None이면 JPEG 기본값)
+            contact_sheet: 'contact_sheet' 모드 장수/열/타일 크기 설정 (ContactSheet)
         Returns:
-            dict: {'extracted_count', 'total_frames', 'fps'}
+            dict: {'extracted_count', 'total_frames', 'fps', 'encode_stats'}
+                  (중복 제거 시 'skipped_count', 'manifest_path', 아카이브 저장 시 'archive_path',
+                   프레임 배열 저장 시 'stack_path', 'stack_sidecar_path' 추가)
         """
 
+        if mode not in ImageExtractor.IMAGE_MODES:
+            raise ValueError(f"지원하지 않는 이미지 추출 모드: {mode}")
+        if output_sink not in FrameSinks.KINDS:
+            raise ValueError(f"지원하지 않는 출력 방식: {output_sink}")
+        if decoder not in ImageExtractor.DECODERS:
+            raise ValueError(f"지원하지 않는 디코더: {decoder}")
+        if mode == 'contact_sheet':
+            return ImageExtractor.create_contact_sheet(
+                input_path, output_folder, start_time, end_time, sheet=contact_sheet,
+                progress_callback=progress_callback, cancel_event=cancel_event,
+                decoder=decoder, transform=transform, encode_profile=encode_profile,
+                scene_threshold=scene_threshold, ffmpeg_executable=ffmpeg_executable)
+
         print(
-            f"[ImageExtractor] start: input='{input_path}', out='{output_folder}', segment_time=({start_time}->{end_time}))")
+            f"[ImageExtractor] start: input='{input_path}', out='{output_folder}', segment_time=({start_time}->{end_time}), mode={mode})")
 
-        # 비디오 열기
-        cap = ImageExtractor._open_capture(input_path)
+        # 비디오 열기 - cap 이 None 이면 ffmpeg 파이프로 디코딩
+        cap, info = ImageExtractor._open_source(input_path, decoder, ffmpeg_executable)
 
         try:
-            # FPS 가져오기
-            fps = ImageExtractor._resolve_fps(cap)
+            fps = info['fps']
             # 비디오 총 프레임 개수
-            total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+            total_frames = info['frame_count']
 
-            # 프레임 스킵 계산
-            frame_skip = ImageExtractor._calculate_frame_skip_for_images(fps)
+            # 샘플링 전략 (기본: 프레임 스킵 - 50fps 이상이면 2프레임마다 1장)
+            if sampler is None:
+                sampler = FrameSampler.every_nth(
+                    ImageExtractor._calculate_frame_skip_for_images(fps))
             # 추출 시작/종료 프레임 계산
             start_frame = int(start_time * fps)
             end_frame = int(end_time * fps)
@@ -47,80 +110,527 @@ class ImageExtractor:
 
             print(f"[ImageExtractor] 출력 폴더: {output_folder}")
 
-            # 순차적 디코딩 방식 추출 진행
-            # 시작 프레임 이동
-            cap.set(cv2.CAP_PROP_POS_FRAMES, start_frame)
-
-            # frame_count 는 아래 추출 while문을 돌기 위한 카운터
-            frame_count = start_frame
-            # extracted_count 는 추출된 프레임 개수로 진행률 계산을 위한 카운터터
-            extracted_count = 0
-
-            # 저장할 프레임 이미지 총 개수(진행률 계산용)
-            try:
-                if end_frame >= start_frame:
-                    # 예시: 10초이며 fps가 30일때, (300-0) // 1 + 1 = 300개
-                    total_exports = (
-                        (end_frame - start_frame) // max(frame_skip, 1) + 1)
+            if encode_profile is None:
+                encode_profile = EncodeProfile()
+
+            def path_for(frame_number):
+                filename = ImageUtils.generate_image_filename(
+                    base_filename, frame_number, encode_profile.ext)
+                return os.path.join(output_folder, filename)
+
+            # 자르기/크기 변경: ffmpeg 디코더면 ffmpeg 필터로, OpenCV면 슬라이스 + 인코더 스레드에서
+            source_kwargs, frame_size = ImageExtractor._prepare_transform(transform, cap, info)
+            pipeline = ImageExtractor._create_pipeline(
+                encode_workers, queue_depth, transform, cap, encode_profile)
+            print(f"[ImageExtractor] 파이프라인: 인코더 {pipeline.encode_workers}개, "
+                  f"대기열 {pipeline.queue_depth}, 디코더 {'opencv' if cap else 'ffmpeg'}, "
+                  f"형식 {encode_profile.describe()}")
+
+            def ffmpeg_source(first_frame, **kwargs):
+                # 파이프라인 대기열에 머무는 프레임보다 버퍼가 많아야 재사용 중 덮어쓰지 않음
+                return FFmpegFrameSource(
+                    input_path, info['width'], info['height'],
+                    start_time=first_frame / fps, ffmpeg_executable=ffmpeg_executable,
+                    buffers=pipeline.frames_in_flight + 1, **source_kwargs, **kwargs)
+
+            progress_fn = None
+            if mode == 'scene':
+                # 장면 전환은 앞 프레임과 비교해야 하므로 단일 프로세스로 순차 검사
+                detector = SceneDetector(threshold=scene_threshold)
+                scan_total = max(1, end_frame - start_frame + 1)
+                if cap is not None:
+                    frames = detector.iter_scene_frames(
+                        cap, start_frame, end_frame, fps, cancel_event)
                 else:
-                    total_exports = 0
-            except Exception:
+                    source = ffmpeg_source(start_frame)
+                    frames = detector.scan(
+                        source.iter_frames(start_frame, range(start_frame, end_frame + 1),
+                                           cancel_event),
+                        fps, cancel_event)
                 total_exports = 0
+                stack_capacity = detector.max_scene_count(start_frame, end_frame, fps)
+                progress_fn = lambda: min(100.0, detector.scanned / scan_total * 100.0)  # noqa: E731
+
+            elif mode == 'keyframes':
+                frame_numbers = ImageExtractor._plan_keyframes(
+                    input_path, start_frame, end_frame, fps, ffmpeg_executable)
+                total_exports = stack_capacity = len(frame_numbers)
+                print(f"[ImageExtractor] 키프레임 {total_exports}장")
+                frames = ImageExtractor._iter_keyframes(
+                    cap, frame_numbers, fps, ffmpeg_source, cancel_event)
+
+            else:
+                # 저장할 프레임 번호 목록 - 개수는 진행률 계산에 사용
+                # 예시: 10초이며 fps가 30일때, 프레임 스킵 1이면 301개
+                frame_numbers = sampler.plan(
+                    start_frame, end_frame, fps,
+                    ImageExtractor._frame_times(input_path, sampler, ffmpeg_executable))
+                total_exports = stack_capacity = len(frame_numbers)
+                print(f"[ImageExtractor] 샘플링: {sampler.describe()} → {total_exports}장")
+
+                if shards and shards > 1 and deduplicator is None and output_sink == 'dir' \
+                        and frame_stack is None and cap is not None:
+                    from .frame_sharder import FrameSharder
+                    extracted_count = FrameSharder.extract(
+                        input_path, output_folder, frame_numbers, fps,
+                        shards, progress_callback=progress_callback,
+                        cancel_event=cancel_event, ffmpeg_executable=ffmpeg_executable,
+                        transform=transform, encode_profile=encode_profile)
+                    print(
+                        f"[ImageExtractor] done: saved={extracted_count}/{total_frames}, fps={fps}")
+                    return {
+                        'extracted_count': extracted_count,
+                        'total_frames': total_frames}
+                if shards and shards > 1:
+                    # 중복 제거는 연속 프레임 비교, 아카이브/프레임 배열은 한 곳에 순차 기록이 필요
+                    print("[ImageExtractor] 중복 제거/아카이브/프레임 배열 저장, "
+                          "FFmpeg 디코더는 단일 프로세스로 진행합니다.")
+
+                frames = ImageExtractor._iter_planned(
+                    cap, info, input_path, frame_numbers, fps, ffmpeg_executable,
+                    pipeline.frames_in_flight + 1, cancel_event, source_kwargs)
+
+            if transform is not None and cap is not None:
+                # 관심 영역만 남김 (뷰라 복사 없음) - 중복 제거/프레임 배열도 같은 영역 기준
+                frames = transform.crop_frames(frames)
+
+            if deduplicator is not None:
+                # 해시가 거의 같은 프레임은 인코딩 대기열에 넣기 전에 걸러냄
+                frames = deduplicator.filter(frames)
+                if progress_fn is None and total_exports:
+                    # 건너뛴 프레임도 진행한 것으로 계산
+                    progress_fn = lambda: min(100.0, (  # noqa: E731
+                        len(deduplicator.ranges) + deduplicator.skipped) / total_exports * 100.0)
+
+            if cap is None and (mode == 'scene' or deduplicator is not None):
+                # 걸러진 프레임도 FFmpegFrameSource 버퍼를 돌려 쓰므로 대기열에 있는 프레임이
+                # 덮어써지지 않게 넘기는 프레임만 복사
+                frames = ((frame_number, frame.copy()) for frame_number, frame in frames)
+
+            archive_name = f"{base_filename}_{datetime.now().strftime('%y%m%d')}_frames"
+            if frame_stack is not None:
+                # 인코딩 대기열로 넘어가기 전 디코더 스레드에서 원본 프레임을 배열에 복사
+                frame_stack.open(
+                    os.path.join(output_folder, f"{archive_name}.npy"), stack_capacity,
+                    *frame_size)
+                frames = frame_stack.tap(frames)
+
+            sink = FrameSinks.create(output_sink, output_folder, archive_name=archive_name)
+            try:
+                with sink:
+                    extracted_count = pipeline.run(
+                        frames,
+                        path_for,
+                        progress_callback=progress_callback,
+                        cancel_event=cancel_event,
+                        total=total_exports,
+                        progress_fn=progress_fn,
+                        sink=sink)
+            finally:
+                if frame_stack is not None:
+                    stack_sidecar_path = frame_stack.close(fps)
+
+            result = {
+                'extracted_count': extracted_count,
+                'total_frames': total_frames,
+                'decoder': 'opencv' if cap is not None else 'ffmpeg',
+                'encode_stats': pipeline.stats}
+            ImageExtractor._print_encode_stats(pipeline.stats)
+            if output_sink != 'dir':
+                result['archive_path'] = sink.path
+                print(f"[ImageExtractor] 아카이브 저장: {sink.path}")
+            if frame_stack is not None:
+                result['stack_path'] = frame_stack.path
+                result['stack_sidecar_path'] = stack_sidecar_path
+
+            if deduplicator is not None:
+                manifest_path = os.path.join(
+                    output_folder, f"{base_filename}_manifest.json")
+                deduplicator.write_manifest(manifest_path, path_for, fps)
+                result['skipped_count'] = deduplicator.skipped
+                result['manifest_path'] = manifest_path
+                # 마지막 저장 뒤에 건너뛴 프레임까지 끝났으므로 진행률 마무리
+                if progress_callback and not (cancel_event and cancel_event.is_set()):
+                    progress_callback(100.0, extracted_count, total_exports)
+                print(f"[ImageExtractor] 중복 프레임 {deduplicator.skipped}장 생략, "
+                      f"manifest: {manifest_path}")
 
-            # 추출 진행
-            while frame_count <= end_frame:
-                # 취소 체크
-                if cancel_event and cancel_event.is_set():
-                    print("[ImageExtractor] 취소 요청 감지 - 추출 중단")
-                    break
+            print(
+                f"[ImageExtractor] done: saved={extracted_count}/{total_frames}, fps={fps}")
+            return result
+
+        finally:
+            if cap is not None:
+                cap.release()
 
-                # 프레임 읽기 (순차적 디코딩)
-                ret, frame = cap.read()
-                if not ret:
-                    break
+    @staticmethod
+    def extract_frames_multi(input_path, segments, progress_callback=None, cancel_event=None,
+                             encode_workers=None, queue_depth=None, ffmpeg_executable='ffmpeg',
+                             sampler=None, mode='all', decoder='auto', transform=None,
+                             encode_profile=None):
+        """한 비디오의 여러 구간을 한 번의 순차 디코딩으로 추출
 
-                if (frame_count - start_frame) % frame_skip == 0:
-                    timestamp = frame_count / fps
-                    filename = ImageUtils.generate_image_filename(
-                        base_filename, frame_count)
-                    filepath = os.path.join(output_folder, filename)
+        구간별 저장 프레임 계획을 합쳐 정렬한 뒤 파일을 한 번만 열어 앞에서부터 읽고,
+        각 프레임은 한 번만 인코딩해 그 프레임을 원하는 모든 구간 폴더에 저장한다
+        (첫 폴더에 쓰고 나머지는 하드링크). 겹치는 구간도 두 번 디코딩하지 않는다.
 
-                    # 파일저장 (유니코드 경로 안전)
-                    try:
-                        ok, buf = cv2.imencode('.jpg', frame)
-                        if ok:
-                            buf.tofile(filepath)
-                        else:
-                            raise IOError('imencode 실패')
-                    except Exception as e:
-                        print(f"저장 실패: {filepath} - {e}")
-                        frame_count += 1
-                        continue
-                    print(f"저장됨: {filepath}")
-                    extracted_count += 1
-
-                    # 진행률 콜백
-                    try:
-                        progress = (extracted_count /
-                                    max(1, total_exports)) * 100.0
-                        if progress_callback:
-                            progress_callback(
-                                progress, extracted_count, total_exports)
-                    except Exception:
-                        pass
+        Args:
+            segments: [{'start', 'end', 'output_folder'}, ...]
+            mode: 'all' | 'keyframes' ('scene' 은 구간마다 비교 기준이 달라 지원하지 않음)
+            나머지는 extract_frames_from_video 와 같음
+        Returns:
+            dict: {'extracted_count'(저장 파일 수), 'decoded_count'(저장한 고유 프레임 수),
+                   'total_frames', 'decoder', 'segments': [{'output_folder', 'extracted_count'}]}
+        """
+        if mode not in ('all', 'keyframes'):
+            raise ValueError(f"여러 구간 한 번에 추출을 지원하지 않는 모드: {mode}")
+        if decoder not in ImageExtractor.DECODERS:
+            raise ValueError(f"지원하지 않는 디코더: {decoder}")
 
-                frame_count += 1
+        print(f"[ImageExtractor] multi start: input='{input_path}', segments={len(segments)}, mode={mode}")
+        cap, info = ImageExtractor._open_source(input_path, decoder, ffmpeg_executable)
 
-            print(
-                f"[ImageExtractor] done: saved={extracted_count}/{total_frames}, fps={fps}")
-            return {
-                'extracted_count': extracted_count,
-                'total_frames': total_frames}
+        try:
+            fps = info['fps']
+            if sampler is None:
+                sampler = FrameSampler.every_nth(
+                    ImageExtractor._calculate_frame_skip_for_images(fps))
+            ranges = [(int(seg['start'] * fps), int(seg['end'] * fps)) for seg in segments]
+
+            # 프레임 번호 → 저장할 구간 번호 목록
+            if mode == 'keyframes':
+                # 구간 사이 키프레임도 디코딩 순서에 포함되므로 전체 범위 키프레임으로 계획
+                all_frames = ImageExtractor._plan_keyframes(
+                    input_path, min(r[0] for r in ranges), max(r[1] for r in ranges),
+                    fps, ffmpeg_executable)
+                plans = [[f for f in all_frames if start <= f <= end] for start, end in ranges]
+            else:
+                all_frames = None
+                pts = ImageExtractor._frame_times(input_path, sampler, ffmpeg_executable)
+                plans = [sampler.plan(start, end, fps, pts) for start, end in ranges]
+            targets = ImageExtractor._merge_segment_plans(plans)
+            frame_numbers = sorted(targets)
+            total_files = sum(len(plan) for plan in plans)
+            print(f"[ImageExtractor] 구간 {len(segments)}개 → 고유 프레임 {len(frame_numbers)}장 "
+                  f"(파일 {total_files}개)")
+
+            base_filename = ImageUtils.basename_of_videofile(input_path)
+            if encode_profile is None:
+                encode_profile = EncodeProfile()
+
+            def path_for(frame_number):
+                filename = ImageUtils.generate_image_filename(
+                    base_filename, frame_number, encode_profile.ext)
+                return [os.path.join(segments[i]['output_folder'], filename)
+                        for i in targets[frame_number]]
+
+            source_kwargs, _ = ImageExtractor._prepare_transform(transform, cap, info)
+            pipeline = ImageExtractor._create_pipeline(
+                encode_workers, queue_depth, transform, cap, encode_profile)
+            buffers = pipeline.frames_in_flight + 1
+
+            if mode == 'keyframes':
+                frames = ImageExtractor._iter_keyframes(
+                    cap, all_frames, fps,
+                    lambda first_frame, **kwargs: FFmpegFrameSource(
+                        input_path, info['width'], info['height'],
+                        start_time=first_frame / fps, ffmpeg_executable=ffmpeg_executable,
+                        buffers=buffers, **source_kwargs, **kwargs),
+                    cancel_event, wanted=set(frame_numbers))
+            else:
+                frames = ImageExtractor._iter_planned(
+                    cap, info, input_path, frame_numbers, fps, ffmpeg_executable,
+                    buffers, cancel_event, source_kwargs)
+            if transform is not None and cap is not None:
+                frames = transform.crop_frames(frames)
+
+            decoded_count = pipeline.run(
+                frames, path_for,
+                progress_callback=progress_callback,
+                cancel_event=cancel_event,
+                total=len(frame_numbers))
+
+            cancelled = cancel_event is not None and cancel_event.is_set()
+            result = {
+                'extracted_count': 0 if cancelled else total_files,
+                'decoded_count': decoded_count,
+                'total_frames': info['frame_count'],
+                'decoder': 'opencv' if cap is not None else 'ffmpeg',
+                'encode_stats': pipeline.stats,
+                'segments': [{'output_folder': seg['output_folder'],
+                              'extracted_count': 0 if cancelled else len(plan)}
+                             for seg, plan in zip(segments, plans)],
+            }
+            if decoded_count < len(frame_numbers):
+                # 일부 프레임을 못 읽은 경우 - 실제 저장된 파일 수로 보정
+                result['extracted_count'] = sum(
+                    len(targets[f]) for f in frame_numbers[:decoded_count])
+            print(f"[ImageExtractor] multi done: frames={decoded_count}/{len(frame_numbers)}, "
+                  f"files={result['extracted_count']}")
+            return result
 
         finally:
-            cap.release()
+            if cap is not None:
+                cap.release()
+
+    @staticmethod
+    def create_contact_sheet(input_path, output_folder, start_time, end_time, sheet=None,
+                             progress_callback=None, cancel_event=None, decoder='auto',
+                             transform=None, encode_profile=None, scene_threshold=None,
+                             ffmpeg_executable='ffmpeg'):
+        """구간 개요용 contact sheet 한 장 저장
+
+        구간에서 sheet.count 장을 고르게(또는 장면 전환 기준으로) 골라 디코딩 즉시 타일 크기로
+        줄여 보관하고, 미리 할당한 캔버스에 시각과 함께 배치해 한 번만 인코딩한다.
+        ffmpeg 디코더면 자르기/축소를 ffmpeg 필터로 처리해 타일 크기 프레임만 받는다.
+        transform 은 자르기(crop)만 적용하고 크기는 sheet.tile_width 를 따른다.
+
+        Returns:
+            dict: {'extracted_count'(1 또는 0), 'total_frames', 'sheet_path', 'tile_count',
+                   'decoder'}
+        """
+        sheet = sheet or ContactSheet()
+        if encode_profile is None:
+            encode_profile = EncodeProfile()
+        print(f"[ImageExtractor] contact sheet start: input='{input_path}', "
+              f"segment_time=({start_time}->{end_time}), count={sheet.count}, "
+              f"selection={sheet.selection}")
+
+        cap, info = ImageExtractor._open_source(input_path, decoder, ffmpeg_executable)
+        try:
+            fps = info['fps']
+            start_frame = int(start_time * fps)
+            end_frame = int(end_time * fps)
+            if info['frame_count'] > 0:
+                # 고르게 나눌 때 파일 끝을 넘는 프레임을 고르지 않도록
+                end_frame = min(end_frame, info['frame_count'] - 1)
+            crop = transform.crop if transform is not None else None
+            if crop:
+                FrameTransform(crop=crop).crop_size(info['width'], info['height'])
+                source_size = crop[2], crop[3]
+            else:
+                source_size = info['width'], info['height']
+            tile_size = sheet.tile_size(*source_size)
+
+            def read(frame_numbers):
+                """프레임 번호 목록을 읽어 (frame_number, 관심 영역 프레임) 생성"""
+                if cap is not None:
+                    frames = ImageExtractor._iter_planned(
+                        cap, info, input_path, frame_numbers, fps, ffmpeg_executable,
+                        cancel_event=cancel_event)
+                    return FrameTransform(crop=crop).crop_frames(frames) if crop else frames
+                return ImageExtractor._iter_planned(
+                    cap, info, input_path, frame_numbers, fps, ffmpeg_executable,
+                    cancel_event=cancel_event,
+                    source_kwargs={'crop': crop, 'scale': tile_size})
+
+            tiles = []
+            if sheet.selection == 'scene':
+                detector = SceneDetector(threshold=scene_threshold)
+                scan_total = max(1, end_frame - start_frame + 1)
+                if cap is not None:
+                    frames = detector.iter_scene_frames(
+                        cap, start_frame, end_frame, fps, cancel_event)
+                    if crop:
+                        frames = FrameTransform(crop=crop).crop_frames(frames)
+                else:
+                    # 장면 점수도 타일 크기 프레임으로 계산 (비교용 축소와 같은 효과)
+                    frames = detector.scan(
+                        read(list(range(start_frame, end_frame + 1))), fps, cancel_event)
+                for frame_number, frame in frames:
+                    tiles.append((frame_number, sheet.make_tile(frame, tile_size)))
+                    if progress_callback:
+                        progress_callback(min(100.0, detector.scanned / scan_total * 100.0),
+                                          len(tiles), sheet.count)
+                print(f"[ImageExtractor] 장면 전환 {len(tiles)}장")
+                if len(tiles) < 2 and not (cancel_event and cancel_event.is_set()):
+                    print("[ImageExtractor] 장면 전환이 부족해 구간을 고르게 나눠 고릅니다.")
+                    tiles = []
+                tiles = sheet.pick(tiles)
+
+            if not tiles:
+                frame_numbers = sheet.plan(start_frame, end_frame)
+                for frame_number, frame in read(frame_numbers):
+                    tiles.append((frame_number, sheet.make_tile(frame, tile_size)))
+                    if progress_callback:
+                        progress_callback(len(tiles) / len(frame_numbers) * 100.0,
+                                          len(tiles), len(frame_numbers))
+
+            result = {
+                'extracted_count': 0,
+                'total_frames': info['frame_count'],
+                'tile_count': len(tiles),
+                'decoder': 'opencv' if cap is not None else 'ffmpeg'}
+            if (cancel_event and cancel_event.is_set()) or not tiles:
+                print("[ImageExtractor] contact sheet 저장 안 함 (취소 또는 프레임 없음)")
+                return result
+
+            base_filename = ImageUtils.basename_of_videofile(input_path)
+            title = (f"{base_filename}  {VideoUtils.format_time(start_time)} - "
+                     f"{VideoUtils.format_time(end_time)}")
+            canvas = sheet.compose(tiles, fps, title)
+            sheet_path = os.path.join(
+                output_folder, ImageUtils.generate_contact_sheet_filename(
+                    base_filename, start_frame, end_frame, encode_profile.ext))
+            ok, buffer = cv2.imencode(encode_profile.ext, canvas, encode_profile.cv2_params())
+            if not ok:
+                raise IOError(f"contact sheet 인코딩 실패: {sheet_path}")
+            # tofile 은 한글 경로에서도 동작 (cv2.imwrite 는 실패)
+            buffer.tofile(sheet_path)
+
+            result['extracted_count'] = 1
+            result['sheet_path'] = sheet_path
+            print(f"[ImageExtractor] contact sheet 저장: {sheet_path} "
+                  f"({canvas.shape[1]}x{canvas.shape[0]}, 타일 {len(tiles)}장, "
+                  f"{buffer.size / 1024:.1f}KB)")
+            return result
+
+        finally:
+            if cap is not None:
+                cap.release()
 
     # ----------------- 내부 헬퍼 메서드 -----------------
+    @staticmethod
+    def _create_pipeline(encode_workers, queue_depth, transform, cap, encode_profile):
+        """인코딩 프로파일과 (OpenCV 경로의) 크기 변경을 적용한 FramePipeline"""
+        return FramePipeline(
+            encode_workers=encode_workers, queue_depth=queue_depth,
+            ext=encode_profile.ext, encode_params=encode_profile.cv2_params(),
+            transform=transform.resize if transform is not None and cap is not None else None)
+
+    @staticmethod
+    def _print_encode_stats(stats):
+        if stats.get('frames'):
+            print(f"[ImageExtractor] 인코딩 {stats['encode_ms_per_frame']:.1f}ms/장, "
+                  f"{stats['bytes_per_frame'] / 1024:.1f}KB/장")
+
+    @staticmethod
+    def _prepare_transform(transform, cap, info):
+        """자르기/크기 변경 준비 - (ffmpeg 디코더에 줄 crop/scale 인자, 파이프라인에 들어가는 프레임 크기)
+
+        crop 영역이 프레임을 벗어나면 ValueError.
+        """
+        size = (info['width'], info['height'])
+        if transform is None:
+            return {}, size
+        output_size = transform.output_size(*size)
+        print(f"[ImageExtractor] 변환: {transform.describe()} → {output_size[0]}x{output_size[1]}")
+        if cap is not None:
+            # OpenCV: 자르기만 디코더 쪽에서, 크기 변경은 인코더 스레드에서
+            return {}, transform.crop_size(*size)
+        source_kwargs = {}
+        if transform.crop:
+            source_kwargs['crop'] = transform.crop
+        if transform.resizes:
+            source_kwargs['scale'] = output_size
+        return source_kwargs, output_size
+
+    @staticmethod
+    def _frame_times(input_path, sampler, ffmpeg_executable='ffmpeg'):
+        """'target_fps' 샘플링용 프레임별 PTS 배열 (다른 전략이거나 인덱스가 없으면 None)"""
+        if sampler.strategy != 'target_fps':
+            return None
+        index = MediaIndex.load(input_path, ffmpeg_executable)
+        return index.pts if index is not None else None
+
+    @staticmethod
+    def _merge_segment_plans(plans):
+        """구간별 프레임 번호 목록들을 {frame_number: [구간 번호, ...]} 로 합침"""
+        targets = {}
+        for segment_index, plan in enumerate(plans):
+            for frame_number in plan:
+                targets.setdefault(frame_number, []).append(segment_index)
+        return targets
+
+    @staticmethod
+    def _iter_planned(cap, info, input_path, frame_numbers, fps, ffmpeg_executable='ffmpeg',
+                      buffers=None, cancel_event=None, source_kwargs=None):
+        """오름차순 프레임 번호 목록을 디코더에 맞게 읽어 (frame_number, frame) 생성"""
+        if not frame_numbers:
+            return
+        if cap is not None:
+            keyframes = None
+            if len(frame_numbers) > 1 and \
+                    frame_numbers[-1] - frame_numbers[0] >= len(frame_numbers):
+                # 건너뛰는 프레임이 있으면 키프레임 위치로 탐색/grab 결정
+                index = MediaIndex.load(input_path, ffmpeg_executable)
+                if index is not None:
+                    keyframes = index.keyframe_numbers(
+                        fps, ImageExtractor._frame_origin(input_path, ffmpeg_executable)).tolist()
+            yield from FrameSampler.iter_frames(
+                cap, frame_numbers, fps, cancel_event, keyframes=keyframes)
+            return
+
+        # ffmpeg 파이프는 탐색 없이 순차로만 읽으므로 멀리 떨어진 묶음마다 새로 실행
+        seek_gap = int(FrameSampler.SEEK_GAP_SECONDS * fps)
+        run_start = 0
+        for i in range(1, len(frame_numbers) + 1):
+            if i < len(frame_numbers) and frame_numbers[i] - frame_numbers[i - 1] <= seek_gap:
+                continue
+            run = frame_numbers[run_start:i]
+            run_start = i
+            if cancel_event and cancel_event.is_set():
+                return
+            source = FFmpegFrameSource(
+                input_path, info['width'], info['height'], start_time=run[0] / fps,
+                ffmpeg_executable=ffmpeg_executable, buffers=buffers, **(source_kwargs or {}))
+            yield from source.iter_frames(run[0], run, cancel_event)
+
+    @staticmethod
+    def _iter_keyframes(cap, frame_numbers, fps, ffmpeg_source, cancel_event=None, wanted=None):
+        """키프레임 (frame_number, frame) 생성
+
+        ffmpeg -skip_frame nokey 로 키프레임만 디코딩해 rawvideo 파이프로 받는다.
+        ffmpeg 실행이 실패하면 OpenCV로 키프레임마다 탐색해 읽는다.
+        wanted 가 주어지면 그 안의 프레임만 생성 (나머지 키프레임은 디코딩만 하고 버림).
+        """
+        if not frame_numbers:
+            return
+        source = ffmpeg_source(
+            frame_numbers[0], end_time=(frame_numbers[-1] + 0.5) / fps, skip_frame='nokey')
+        keep = (lambda i: frame_numbers[i] in wanted) if wanted is not None else None
+        yielded = 0
+        reader = source.read_selected(keep, cancel_event, limit=len(frame_numbers))
+        try:
+            for index, frame in reader:
+                yield frame_numbers[index], frame
+                yielded = index + 1
+        except OSError as e:
+            print(f"[ImageExtractor] FFmpeg 키프레임 디코딩 실패: {e}")
+        finally:
+            reader.close()  # ffmpeg 종료
+        if cancel_event and cancel_event.is_set():
+            print("[ImageExtractor] 취소 요청 감지 - 추출 중단")
+            return
+
+        if yielded < len(frame_numbers) and cap is not None:
+            # 나머지 키프레임은 OpenCV 탐색으로 읽기
+            print(f"[ImageExtractor] FFmpeg 키프레임 {yielded}/{len(frame_numbers)}장 - "
+                  f"나머지는 OpenCV로 읽습니다.")
+            remaining = [f for f in frame_numbers[yielded:] if wanted is None or f in wanted]
+            yield from FrameSampler.iter_frames(
+                cap, remaining, fps, cancel_event, seek_gap_seconds=0)
+
+    @staticmethod
+    def _plan_keyframes(input_path, start_frame, end_frame, fps, ffmpeg_executable='ffmpeg'):
+        """ffprobe 패킷 플래그로 구간 안 키프레임의 프레임 번호 목록 (디코딩 없음)"""
+        # 키프레임 시각(pts_time)은 절대값 - 0번 프레임 시각 기준으로 바꿔 프레임 번호와 맞춤
+        origin = ImageExtractor._frame_origin(input_path, ffmpeg_executable)
+        keyframes = VideoExtractor.probe_keyframes(
+            input_path, start_frame / fps + origin, end_frame / fps + origin, window=0.0,
+            ffmpeg_executable=ffmpeg_executable)
+        if not keyframes:
+            print("[ImageExtractor] 구간 안 키프레임을 찾지 못했습니다.")
+            return []
+        return FrameSampler.at_timestamps(
+            [k - origin for k in keyframes]).plan(start_frame, end_frame, fps)
+
+    @staticmethod
+    def _frame_origin(input_path, ffmpeg_executable='ffmpeg'):
+        """0번 프레임의 절대 시각(초, MediaProbe) - 모르면 0"""
+        info = MediaProbe.probe(input_path, ffmpeg_executable)
+        return info.frame_origin if info is not None else 0.0
+
     @staticmethod
     def _open_capture(input_path):
         """OpenCV를 사용하여 비디오 파일을 열고 비디오 캡처 객체를 반환"""
@@ -129,6 +639,42 @@ class ImageExtractor:
             raise IOError(f"[VideoLoadError]비디오 파일을 열 수 없습니다: {input_path}")
         return cap
 
+    @staticmethod
+    def _open_source(input_path, decoder='auto', ffmpeg_executable='ffmpeg'):
+        """디코더를 골라 비디오를 열고 (cap, info) 반환
+
+        'auto' 는 OpenCV로 첫 프레임을 읽어 보고 실패하면(열리지 않거나 0프레임) ffmpeg 를 쓴다.
+        ffmpeg 디코더면 cap 은 None 이고 info 는 ffprobe 로 채운다.
+
+        Returns:
+            tuple: (cap 또는 None, {'width', 'height', 'fps', 'frame_count'})
+        """
+        if decoder != 'ffmpeg':
+            cap = cv2.VideoCapture(input_path)
+            usable = cap.isOpened()
+            if usable and decoder == 'auto':
+                usable = cap.read()[0] and int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)) > 0
+                cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            if usable:
+                return cap, {
+                    'width': int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+                    'height': int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+                    'fps': ImageExtractor._resolve_fps(cap),
+                    'frame_count': int(cap.get(cv2.CAP_PROP_FRAME_COUNT)),
+                }
+            cap.release()
+            if decoder == 'opencv':
+                raise IOError(f"[VideoLoadError]비디오 파일을 열 수 없습니다: {input_path}")
+            print("[ImageExtractor] OpenCV로 프레임을 읽을 수 없어 FFmpeg 디코더를 사용합니다.")
+
+        info = FFmpegFrameSource.probe(input_path, ffmpeg_executable)
+        if info is None:
+            raise IOError(f"[VideoLoadError]비디오 파일을 열 수 없습니다: {input_path}")
+        if not info['fps'] or info['fps'] <= 0:
+            info['fps'] = 30.0
+            print("[ImageExtractor] FPS를 읽지 못해 기본 30fps로 진행합니다.")
+        return None, info
+
     @staticmethod
     def _resolve_fps(cap):
         """비디오의 FPS를 GET하고 없으면 기본값 fps=30을 반환"""
@@ -150,9 +696,15 @@ class ImageExtractor:
     def extract_frames_with_ffmpeg(input_path, output_folder, start_time, end_time,
                                    ffmpeg_executable='ffmpeg', target_fps=None,
                                    quality=2, base_filename=None, timestamp=None,
-                                   cancel_event=None):
+                                   cancel_event=None, mode='all', scene_threshold=None,
+                                   transform=None, encode_profile=None):
         """FFmpeg을 사용하여 이미지 프레임 추출 (OpenCV 디코드 실패시 폴백)
 
+        encode_profile 이 있으면 quality 대신 프로파일의 형식/품질로 저장한다.
+
+        mode 'keyframes' 는 -skip_frame nokey 로 키프레임만 디코딩하고,
+        'scene' 은 select 필터의 scene 점수로 장면 전환 프레임만 저장한다.
+
         Returns dict: {'success', 'extracted_count', 'message'}
         """
         try:
@@ -163,20 +715,40 @@ class ImageExtractor:
             if timestamp is None:
                 timestamp = datetime.now().strftime("%y%m%d")
 
+            ext = encode_profile.ext if encode_profile is not None else '.jpg'
             output_pattern = os.path.join(
-                output_folder, f"{base_filename}_{timestamp}_frame%06d.jpg")
+                output_folder, f"{base_filename}_{timestamp}_frame%06d{ext}")
 
             # FFmpeg 커맨드 생성
-            command = [
-                ffmpeg_executable, '-y',
+            command = [ffmpeg_executable, '-y']
+            if mode == 'keyframes':
+                # 디코더가 키프레임 외 프레임을 건너뜀 (입력 옵션이므로 -i 앞)
+                command += ['-skip_frame', 'nokey']
+            command += [
                 '-ss', str(start_time),
                 '-to', str(end_time),
-                '-i', input_path,
-                '-qscale:v', str(quality)
+                '-i', input_path
             ]
+            if encode_profile is not None:
+                command += encode_profile.ffmpeg_args()
+            else:
+                command += ['-qscale:v', str(quality)]
+            filters = []
+            if mode == 'keyframes':
+                command += ['-vsync', 'vfr']
+            elif mode == 'scene':
+                threshold = (SceneDetector.DEFAULT_THRESHOLD
+                             if scene_threshold is None else scene_threshold)
+                filters.append(f"select='eq(n,0)+gt(scene,{threshold})'")
+                command += ['-vsync', 'vfr']
             # frame skip 대신 FPS 제한으로 opencv에서의 동일 효과 구현
-            if target_fps:
-                command += ['-vf', f'fps={target_fps}']
+            elif target_fps:
+                filters.append(f'fps={target_fps}')
+            if transform is not None:
+                # 장면 점수는 원본 기준으로 계산한 뒤 자르기/크기 변경
+                filters += transform.ffmpeg_filters()
+            if filters:
+                command += ['-vf', ','.join(filters)]
 
             command.append(output_pattern)  # FFmpeg 커맨드에서 마지막은 항상 출력 파일 경로.
 
@@ -192,6 +764,9 @@ class ImageExtractor:
                 encoding='utf-8',
                 errors='ignore'
             )
+            # 작업별 취소 토큰이면 취소 즉시 프로세스 종료되도록 연결
+            if hasattr(cancel_event, 'attach_process'):
+                cancel_event.attach_process(process)
 
             # 취소 체크하면서 대기 (최적화된 버전)
             while process.poll() is None:  # 프로세스가 실행 중일 때
@@ -210,6 +785,8 @@ class ImageExtractor:
 
             # 프로세스 결과 확인
             stdout, stderr = process.communicate()
+            if hasattr(cancel_event, 'detach_process'):
+                cancel_event.detach_process(process)
             result = subprocess.CompletedProcess(
                 args=command,
                 returncode=process.returncode,
@@ -228,7 +805,7 @@ class ImageExtractor:
             count = 0
             try:
                 pattern = os.path.join(
-                    output_folder, f"{base_filename}_{timestamp}_frame*.jpg")
+                    output_folder, f"{base_filename}_{timestamp}_frame*{ext}")
                 count = len(glob.glob(pattern))
             except Exception:
                 pass
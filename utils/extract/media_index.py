@@ -0,0 +1,177 @@
+import threading
+from collections import OrderedDict
+import subprocess
+import numpy as np
+from utils.media_cache import MediaCache
+from .video_extractor import VideoExtractor
+
+
+class MediaIndex:
+    """비디오 스트림의 패킷 인덱스 (PTS, 키프레임 여부, 바이트 위치)
+
+    ffprobe 패킷 정보로 파일당 한 번 만들고, 구조화 NumPy 배열(.npy)로 공용 캐시
+    폴더에 저장한다 (MediaCache - 경로+크기+수정 시각 기준). 같은 파일은 디스크/메모리
+    캐시에서 바로 읽으므로 탐색 계획, 키프레임 경계 판단, 시각→프레임 변환이
+    매번 파일을 다시 훑지 않는다.
+    """
+
+    # 캐시 형식이 바뀌면 버전을 올려 이전 캐시를 무시
+    CACHE_SUFFIX = '.index.v1.npy'
+    DTYPE = np.dtype([('pts', '<f8'), ('key', 'u1'), ('pos', '<i8')])
+    # 메모리에 둘 인덱스 수 (1시간 30fps 영상 하나가 약 2MB)
+    MAX_ENTRIES = 16
+
+    _loaded = OrderedDict()
+    _lock = threading.Lock()
+
+    def __init__(self, packets):
+        # 표시 순서(PTS) 기준 정렬 - B 프레임이 있으면 디코딩 순서와 다름
+        self.packets = np.sort(packets, order='pts')
+        self.pts = self.packets['pts']
+        self.keyframes = self.pts[self.packets['key'] != 0]
+
+    @property
+    def frame_count(self):
+        return len(self.packets)
+
+    @staticmethod
+    def cached(input_path):
+        """메모리/디스크 캐시에 있는 인덱스 (없으면 파일을 훑지 않고 None)"""
+        try:
+            fingerprint = MediaCache.fingerprint(input_path)
+        except OSError:
+            return None
+
+        with MediaIndex._lock:
+            index = MediaIndex._loaded.get(fingerprint)
+            if index is not None:
+                MediaIndex._loaded.move_to_end(fingerprint)
+                return index
+
+        try:
+            packets = np.load(MediaCache.path_for(input_path, MediaIndex.CACHE_SUFFIX),
+                              allow_pickle=False)
+        except (OSError, ValueError):
+            return None
+        if packets.dtype != MediaIndex.DTYPE:
+            return None
+        return MediaIndex._remember(fingerprint, MediaIndex(packets))
+
+    @staticmethod
+    def load(input_path, ffmpeg_executable='ffmpeg'):
+        """파일의 인덱스 (메모리 → 디스크 캐시 → ffprobe 순). 만들 수 없으면 None"""
+        index = MediaIndex.cached(input_path)
+        if index is not None:
+            return index
+
+        try:
+            fingerprint = MediaCache.fingerprint(input_path)
+        except OSError:
+            return None
+        # 전체 파일 스캔은 오래 걸릴 수 있으므로 잠금 밖에서 (다른 파일 작업을 막지 않음)
+        packets = MediaIndex._scan(input_path, ffmpeg_executable)
+        if packets is None:
+            return None
+        try:
+            MediaCache.write_atomic(
+                MediaCache.path_for(input_path, MediaIndex.CACHE_SUFFIX),
+                lambda f: np.save(f, packets, allow_pickle=False))
+        except OSError as e:
+            print(f"[MediaIndex] 캐시 저장 실패: {e}")
+        return MediaIndex._remember(fingerprint, MediaIndex(packets))
+
+    @staticmethod
+    def _remember(fingerprint, index):
+        """메모리 LRU 에 저장 (MAX_ENTRIES 초과분은 오래된 것부터 제거)"""
+        with MediaIndex._lock:
+            MediaIndex._loaded[fingerprint] = index
+            MediaIndex._loaded.move_to_end(fingerprint)
+            while len(MediaIndex._loaded) > MediaIndex.MAX_ENTRIES:
+                MediaIndex._loaded.popitem(last=False)
+        return index
+
+    @staticmethod
+    def _scan(input_path, ffmpeg_executable='ffmpeg'):
+        """ffprobe 로 첫 비디오 스트림의 전체 패킷 정보 읽기 (디코딩 없음)"""
+        command = [
+            VideoExtractor.get_ffprobe_executable(ffmpeg_executable),
+            '-v', 'error',
+            '-select_streams', 'v:0',
+            '-show_entries', 'packet=pts_time,flags,pos',
+            '-of', 'csv=p=0',
+            input_path
+        ]
+        print(f"[MediaIndex] 패킷 인덱스 생성: {input_path}")
+        try:
+            result = subprocess.run(
+                command, capture_output=True, text=True,
+                encoding='utf-8', errors='ignore', timeout=600)
+        except Exception as e:
+            print(f"[MediaIndex] ffprobe 실행 실패: {e}")
+            return None
+        if result.returncode != 0:
+            return None
+
+        rows = []
+        for line in result.stdout.splitlines():
+            parts = line.strip().split(',')
+            if len(parts) < 2:
+                continue
+            try:
+                pts = float(parts[0])
+            except ValueError:
+                continue  # pts_time이 N/A인 패킷
+            try:
+                pos = int(parts[2]) if len(parts) > 2 else -1
+            except ValueError:
+                pos = -1
+            rows.append((pts, 1 if 'K' in parts[1] else 0, pos))
+        if not rows:
+            return None
+        return np.array(rows, dtype=MediaIndex.DTYPE)
+
+    def keyframe_times(self, start_time=None, end_time=None):
+        """[start_time, end_time] 안 키프레임 시각(초) 목록"""
+        lo = 0 if start_time is None else np.searchsorted(self.keyframes, start_time, 'left')
+        hi = (len(self.keyframes) if end_time is None
+              else np.searchsorted(self.keyframes, end_time, 'right'))
+        return self.keyframes[lo:hi].tolist()
+
+    def keyframe_before(self, time_value):
+        """time_value 이하 마지막 키프레임 시각 (없으면 None)"""
+        i = np.searchsorted(self.keyframes, time_value, 'right')
+        return float(self.keyframes[i - 1]) if i > 0 else None
+
+    def keyframe_after(self, time_value):
+        """time_value 이상 첫 키프레임 시각 (없으면 None)"""
+        i = np.searchsorted(self.keyframes, time_value, 'left')
+        return float(self.keyframes[i]) if i < len(self.keyframes) else None
+
+    def frame_at(self, time_value):
+        """time_value 에 표시 중인 프레임 번호 (PTS 기준, 0부터)"""
+        return max(0, int(np.searchsorted(self.pts, time_value + 1e-6, 'right')) - 1)
+
+    def frames_between(self, start_time, end_time):
+        """PTS 가 [start_time, end_time) 안인 프레임 수"""
+        lo = np.searchsorted(self.pts, start_time - 1e-6, 'left')
+        hi = np.searchsorted(self.pts, end_time - 1e-6, 'left')
+        return max(0, int(hi - lo))
+
+    def time_of(self, frame_number):
+        """프레임 번호의 PTS(초)"""
+        return float(self.pts[min(max(0, frame_number), len(self.pts) - 1)])
+
+    def byte_offset(self, time_value):
+        """time_value 직전 키프레임 패킷의 파일 내 바이트 위치 (모르면 -1)"""
+        i = np.searchsorted(self.packets['pts'], time_value, 'right') - 1
+        while i >= 0 and not self.packets['key'][i]:
+            i -= 1
+        return int(self.packets['pos'][i]) if i >= 0 else -1
+
+    def keyframe_numbers(self, fps, origin=0.0):
+        """키프레임의 프레임 번호 배열 (round((pts - origin) * fps), 탐색 계획용)
+
+        pts 는 절대값이므로 origin 에 0번 프레임 시각(MediaInfo.frame_origin)을 넘겨야
+        0부터 세는 프레임 번호와 맞는다.
+        """
+        return np.round((self.keyframes - origin) * fps).astype(np.int64)
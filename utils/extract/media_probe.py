@@ -0,0 +1,306 @@
+import os
+import json
+import threading
+import subprocess
+from collections import OrderedDict
+from typing import NamedTuple, Optional, Tuple
+import cv2
+from utils.media_cache import MediaCache
+from .video_extractor import VideoExtractor
+
+
+class StreamInfo(NamedTuple):
+    """스트림 하나의 정보 (비디오면 크기/FPS/프레임 수, 오디오면 샘플레이트/채널)
+
+    profile/level/pix_fmt/field_order/color_* 는 비디오 SPS 에 들어가는 값으로,
+    일부만 재인코딩해 이어 붙일 때(SmartCutter) 원본과 맞추는 데 쓴다.
+    start_time 은 스트림 첫 타임스탬프(초, 절대값) - 비디오면 0번 프레임의 시각이다.
+    """
+    index: int
+    codec_type: str
+    codec: Optional[str] = None
+    width: int = 0
+    height: int = 0
+    fps: float = 0.0
+    frame_count: int = 0
+    sample_rate: int = 0
+    channels: int = 0
+    duration: float = 0.0
+    pix_fmt: Optional[str] = None
+    profile: Optional[str] = None
+    level: int = 0
+    time_base: Optional[str] = None
+    has_b_frames: int = 0
+    field_order: Optional[str] = None
+    color_range: Optional[str] = None
+    color_space: Optional[str] = None
+    color_transfer: Optional[str] = None
+    color_primaries: Optional[str] = None
+    start_time: float = 0.0
+
+
+class MediaInfo(NamedTuple):
+    """미디어 파일 메타데이터 (불변) - 대표 값은 첫 비디오 스트림 기준
+
+    source 는 'ffprobe' 또는 'opencv'. OpenCV 로 읽은 경우 오디오 스트림 정보가 없으므로
+    오디오 유무는 알 수 없다 (audio_known 이 False).
+    start_time 은 컨테이너의 첫 타임스탬프(초) - 입력측 -ss/-to 는 이 시각 기준의 상대값이다.
+    """
+    path: str
+    file_size: int
+    duration: float
+    fps: float
+    width: int
+    height: int
+    frame_count: int
+    streams: Tuple[StreamInfo, ...] = ()
+    source: str = 'ffprobe'
+    start_time: float = 0.0
+
+    @property
+    def video(self):
+        """첫 비디오 스트림 (없으면 None)"""
+        return next((s for s in self.streams if s.codec_type == 'video'), None)
+
+    @property
+    def audio(self):
+        """첫 오디오 스트림 (없으면 None)"""
+        return next((s for s in self.streams if s.codec_type == 'audio'), None)
+
+    @property
+    def video_codec(self):
+        return self.video.codec if self.video else None
+
+    @property
+    def audio_codec(self):
+        return self.audio.codec if self.audio else None
+
+    @property
+    def has_audio(self):
+        return self.audio is not None
+
+    @property
+    def audio_known(self):
+        return self.source == 'ffprobe'
+
+    @property
+    def frame_origin(self):
+        """0번 비디오 프레임의 절대 시각 - ffprobe pts_time 을 프레임 번호로 바꿀 때 빼는 값"""
+        return self.video.start_time if self.video else self.start_time
+
+    def to_dict(self):
+        data = self._asdict()
+        data['streams'] = [s._asdict() for s in self.streams]
+        return data
+
+    @staticmethod
+    def from_dict(data):
+        data = dict(data)
+        data['streams'] = tuple(StreamInfo(**s) for s in data.get('streams', ()))
+        return MediaInfo(**data)
+
+
+class MediaProbe:
+    """파일당 한 번만 읽는 미디어 메타데이터 조회 서비스
+
+    메모리 LRU → 공용 캐시 폴더의 JSON (MediaCache - 경로+크기+수정 시각 기준) →
+    ffprobe 한 번 실행 순으로 찾고, ffprobe 를 쓸 수 없으면 OpenCV 로 비디오 정보만 읽는다.
+    OpenCV 결과는 오디오 정보가 없으므로 디스크에 남기지 않고, 메모리에서도 ffmpeg 경로별로
+    따로 기억해 다른 경로로 조회하면 ffprobe 를 다시 시도한다.
+    파일 정보 표시, 추출 전 FPS/크기 확인, 오디오 스트림 확인이 모두 같은 결과를 공유하므로
+    구간을 선택할 때마다 VideoCapture 를 새로 열거나 ffprobe 를 다시 실행하지 않는다.
+    """
+
+    # 캐시 형식이 바뀌면 버전을 올려 이전 캐시를 무시
+    CACHE_SUFFIX = '.probe.v4.json'
+    MAX_ENTRIES = 128
+
+    _memo = OrderedDict()
+    _lock = threading.Lock()
+
+    @staticmethod
+    def probe(input_path, ffmpeg_executable='ffmpeg', cache=True):
+        """파일의 MediaInfo (파일이 없거나 읽을 수 없으면 None)
+
+        cache=False 면 캐시를 읽지도 남기지도 않는다 (곧 지울 임시 파일 확인용).
+        """
+        if not cache:
+            return MediaProbe._run_ffprobe(input_path, ffmpeg_executable)
+        try:
+            fingerprint = MediaCache.fingerprint(input_path)
+        except OSError:
+            return None
+
+        # ffprobe 결과는 fingerprint, OpenCV 결과는 (fingerprint, ffmpeg 경로) 로 기억
+        fallback_key = (fingerprint, ffmpeg_executable)
+        with MediaProbe._lock:
+            for key in (fingerprint, fallback_key):
+                info = MediaProbe._memo.get(key)
+                if info is not None:
+                    MediaProbe._memo.move_to_end(key)
+                    break
+        if info is not None:
+            return info if info.path == input_path else info._replace(path=input_path)
+
+        key = fingerprint
+        info = MediaProbe._load_cache(input_path)
+        if info is None:
+            info = MediaProbe._run_ffprobe(input_path, ffmpeg_executable)
+            if info is not None:
+                MediaProbe._save_cache(input_path, info)
+            else:
+                info = MediaProbe._run_opencv(input_path)
+                key = fallback_key
+            if info is None:
+                return None
+
+        with MediaProbe._lock:
+            MediaProbe._memo[key] = info
+            MediaProbe._memo.move_to_end(key)
+            while len(MediaProbe._memo) > MediaProbe.MAX_ENTRIES:
+                MediaProbe._memo.popitem(last=False)
+        return info
+
+    @staticmethod
+    def clear():
+        """메모리 캐시 비우기 (디스크 캐시는 파일이 바뀌면 자동으로 무시됨)"""
+        with MediaProbe._lock:
+            MediaProbe._memo.clear()
+
+    @staticmethod
+    def _load_cache(input_path):
+        try:
+            with open(MediaCache.path_for(input_path, MediaProbe.CACHE_SUFFIX),
+                      'r', encoding='utf-8') as f:
+                info = MediaInfo.from_dict(json.load(f))
+        except (OSError, ValueError, TypeError):
+            return None
+        return info._replace(path=input_path)
+
+    @staticmethod
+    def _save_cache(input_path, info):
+        try:
+            MediaCache.write_atomic(
+                MediaCache.path_for(input_path, MediaProbe.CACHE_SUFFIX),
+                lambda f: f.write(json.dumps(info.to_dict(), ensure_ascii=False).encode('utf-8')))
+        except OSError as e:
+            print(f"[MediaProbe] 캐시 저장 실패: {e}")
+
+    @staticmethod
+    def _number(value):
+        """ffprobe 값 ('30000/1001', '12.5', 'N/A') → float (읽을 수 없으면 0.0)"""
+        try:
+            value = str(value)
+            if '/' in value:
+                num, den = value.split('/', 1)
+                return float(num) / float(den) if float(den) else 0.0
+            return float(value)
+        except (TypeError, ValueError):
+            return 0.0
+
+    @staticmethod
+    def _run_ffprobe(input_path, ffmpeg_executable='ffmpeg'):
+        """ffprobe 한 번으로 전체 스트림과 컨테이너 정보 조회 (실패 시 None)"""
+        command = [
+            VideoExtractor.get_ffprobe_executable(ffmpeg_executable),
+            '-v', 'error',
+            '-show_streams', '-show_format',
+            '-of', 'json',
+            input_path
+        ]
+        try:
+            result = subprocess.run(
+                command, capture_output=True, text=True,
+                encoding='utf-8', errors='ignore', timeout=30)
+            if result.returncode != 0:
+                return None
+            data = json.loads(result.stdout or '{}')
+        except Exception as e:
+            print(f"[MediaProbe] ffprobe 실행 실패: {e}")
+            return None
+
+        number = MediaProbe._number
+        container = data.get('format', {})
+        streams = []
+        for stream in data.get('streams', []):
+            codec_type = stream.get('codec_type')
+            duration = number(stream.get('duration')) or number(container.get('duration'))
+            if codec_type == 'video':
+                fps = number(stream.get('avg_frame_rate')) or number(stream.get('r_frame_rate'))
+                streams.append(StreamInfo(
+                    index=int(stream.get('index', len(streams))),
+                    codec_type=codec_type,
+                    codec=stream.get('codec_name'),
+                    width=int(number(stream.get('width'))),
+                    height=int(number(stream.get('height'))),
+                    fps=fps,
+                    frame_count=int(number(stream.get('nb_frames'))) or int(duration * fps),
+                    duration=duration,
+                    pix_fmt=stream.get('pix_fmt'),
+                    profile=stream.get('profile'),
+                    level=int(number(stream.get('level'))),
+                    time_base=stream.get('time_base'),
+                    has_b_frames=int(number(stream.get('has_b_frames'))),
+                    field_order=stream.get('field_order'),
+                    color_range=stream.get('color_range'),
+                    color_space=stream.get('color_space'),
+                    color_transfer=stream.get('color_transfer'),
+                    color_primaries=stream.get('color_primaries'),
+                    start_time=number(stream.get('start_time'))))
+            elif codec_type == 'audio':
+                streams.append(StreamInfo(
+                    index=int(stream.get('index', len(streams))),
+                    codec_type=codec_type,
+                    codec=stream.get('codec_name'),
+                    sample_rate=int(number(stream.get('sample_rate'))),
+                    channels=int(number(stream.get('channels'))),
+                    duration=duration,
+                    start_time=number(stream.get('start_time'))))
+        if not streams:
+            return None
+
+        video = next((s for s in streams if s.codec_type == 'video'), None)
+        # 컨테이너 시작 시각 (없으면 첫 비디오 스트림 값)
+        raw_video = next(
+            (s for s in data.get('streams', []) if s.get('codec_type') == 'video'), {})
+        start_time = number(container.get('start_time')) or number(raw_video.get('start_time'))
+        try:
+            size = os.path.getsize(input_path)
+        except OSError:
+            size = int(number(container.get('size')))
+        return MediaInfo(
+            path=input_path,
+            file_size=size,
+            duration=number(container.get('duration')) or max(s.duration for s in streams),
+            fps=video.fps if video else 0.0,
+            width=video.width if video else 0,
+            height=video.height if video else 0,
+            frame_count=video.frame_count if video else 0,
+            streams=tuple(streams),
+            source='ffprobe',
+            start_time=start_time)
+
+    @staticmethod
+    def _run_opencv(input_path):
+        """ffprobe 를 쓸 수 없을 때 OpenCV 로 비디오 정보만 조회 (실패 시 None)"""
+        cap = cv2.VideoCapture(input_path)
+        try:
+            if not cap.isOpened():
+                return None
+            fps = cap.get(cv2.CAP_PROP_FPS) or 0.0
+            frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+            width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+            height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        finally:
+            cap.release()
+        duration = frame_count / fps if fps > 0 else 0.0
+        try:
+            size = os.path.getsize(input_path)
+        except OSError:
+            size = 0
+        video = StreamInfo(index=0, codec_type='video', width=width, height=height,
+                           fps=fps, frame_count=frame_count, duration=duration)
+        return MediaInfo(
+            path=input_path, file_size=size, duration=duration, fps=fps,
+            width=width, height=height, frame_count=frame_count,
+            streams=(video,), source='opencv')
@@ -0,0 +1,92 @@
+import cv2
+import numpy as np
+
+
+class SceneDetector:
+    """장면 전환 프레임 검출 - 축소한 회색조 프레임을 NumPy로 비교
+
+    방식:
+    - 'hist': 회색조 히스토그램의 총 변동 거리 (0~1, 기본 - 움직임에 둔감)
+    - 'diff': 직전 프레임과의 평균 절대 차이 (0~1, 같은 밝기 분포의 구도 변화도 검출)
+
+    점수가 threshold 이상인 프레임을 새 장면의 시작으로 보고, 구간의 첫 프레임은 항상 포함한다.
+    """
+
+    METHODS = ('hist', 'diff')
+    # 비교용 축소 크기 (가로, 세로) - 작을수록 빠르고 노이즈에 둔감
+    THUMB_SIZE = (64, 36)
+    HIST_BINS = 32
+    DEFAULT_THRESHOLD = 0.3
+    # 전환 직후 연속 검출 방지를 위한 최소 간격(초)
+    MIN_SCENE_SECONDS = 0.5
+
+    def __init__(self, threshold=None, method='hist', min_scene_seconds=None):
+        if method not in SceneDetector.METHODS:
+            raise ValueError(f"지원하지 않는 장면 검출 방식: {method}")
+        self.threshold = SceneDetector.DEFAULT_THRESHOLD if threshold is None else float(threshold)
+        if not 0 < self.threshold <= 1:
+            raise ValueError(f"threshold 는 0~1 사이여야 합니다: {threshold}")
+        self.method = method
+        self.min_scene_seconds = (SceneDetector.MIN_SCENE_SECONDS
+                                  if min_scene_seconds is None else min_scene_seconds)
+        # 진행률 계산용 - 지금까지 검사한 프레임 수
+        self.scanned = 0
+
+    def signature(self, frame):
+        """비교용 특징 (축소 회색조 배열 또는 정규화 히스토그램)"""
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY) if frame.ndim == 3 else frame
+        thumb = cv2.resize(gray, SceneDetector.THUMB_SIZE, interpolation=cv2.INTER_AREA)
+        if self.method == 'diff':
+            return thumb.astype(np.float32) / 255.0
+        bins = (thumb // (256 // SceneDetector.HIST_BINS)).ravel()
+        hist = np.bincount(bins, minlength=SceneDetector.HIST_BINS).astype(np.float32)
+        return hist / hist.sum()
+
+    def score(self, prev_signature, signature):
+        """두 특징 사이의 변화량 (0~1)"""
+        if self.method == 'diff':
+            return float(np.abs(signature - prev_signature).mean())
+        return float(np.abs(signature - prev_signature).sum() / 2.0)
+
+    def max_scene_count(self, start_frame, end_frame, fps=30.0):
+        """구간에서 검출될 수 있는 장면 시작 프레임 최대 개수 (최소 간격 기준)"""
+        min_gap = max(1, int(self.min_scene_seconds * fps))
+        return max(0, end_frame - start_frame) // min_gap + 1
+
+    def iter_scene_frames(self, cap, start_frame, end_frame, fps=30.0, cancel_event=None):
+        """start_frame~end_frame 을 순차 디코딩하며 장면 시작 (frame_number, frame) 생성"""
+        cap.set(cv2.CAP_PROP_POS_FRAMES, start_frame)
+
+        def read_frames():
+            for frame_number in range(start_frame, end_frame + 1):
+                ret, frame = cap.read()
+                if not ret:
+                    return
+                yield frame_number, frame
+
+        return self.scan(read_frames(), fps, cancel_event)
+
+    def scan(self, frames, fps=30.0, cancel_event=None):
+        """연속 (frame_number, frame) iterable 에서 장면 시작 프레임만 생성"""
+        min_gap = max(1, int(self.min_scene_seconds * fps))
+        self.scanned = 0
+
+        prev = None
+        last_kept = None
+        for frame_number, frame in frames:
+            if cancel_event and cancel_event.is_set():
+                print("[ImageExtractor] 취소 요청 감지 - 추출 중단")
+                return
+            self.scanned += 1
+
+            signature = self.signature(frame)
+            if prev is None:
+                keep = True
+            else:
+                keep = (self.score(prev, signature) >= self.threshold and
+                        frame_number - last_kept >= min_gap)
+            prev = signature
+
+            if keep:
+                last_kept = frame_number
+                yield frame_number, frame
@@ -0,0 +1,368 @@
+import os
+import shutil
+import subprocess
+import tempfile
+from .video_extractor import VideoExtractor
+
+
+class SmartCutter:
+    """경계 GOP만 재인코딩하는 프레임 정확 구간 추출 (스마트 컷)
+
+    [start, 첫 키프레임) 과 [마지막 키프레임, end) 만 libx264로 재인코딩하고,
+    가운데 키프레임 사이 구간은 스트림 복사한 뒤 concat demuxer로 이어 붙인다.
+    오디오는 원본에서 같은 구간을 한 번만 aac로 인코딩해 최종 파일에 합친다.
+
+    경계 조각은 원본 SPS 값(profile, level, pix_fmt, 인터레이스, 색 정보)을 맞춰 인코딩하고
+    키프레임마다 SPS/PPS 를 다시 넣는다 (repeat-headers). mp4/mov 출력은 avc3 태그로 먹싱해
+    조각마다 다른 파라미터 셋을 스트림 안에서 전달한다. 조각을 만든 뒤 SPS 값과
+    프레임 수(MediaIndex 기준)를 확인하고, 하나라도 다르면 전체 재인코딩으로 폴백한다.
+    """
+
+    # 재인코딩 조각과 복사 조각을 이어붙일 수 있는 코덱 (원본 코덱 → 인코더)
+    SUPPORTED_CODECS = {'h264': 'libx264'}
+    # 경계 조각 인코딩 품질 (원본과 육안 구분이 어렵도록 높은 품질)
+    ENCODE_PRESET = 'veryfast'
+    ENCODE_CRF = '18'
+    # 키프레임과 경계가 이 값(초) 이하로 차이나면 해당 조각 생략
+    BOUNDARY_EPSILON = 0.001
+    # ffprobe profile 이름 → libx264 -profile:v
+    X264_PROFILES = {
+        'Constrained Baseline': 'baseline', 'Baseline': 'baseline', 'Main': 'main',
+        'High': 'high', 'High 10': 'high10', 'High 4:2:2': 'high422',
+        'High 4:4:4 Predictive': 'high444',
+    }
+    # 조각과 원본이 같아야 하는 SPS 관련 값
+    SPS_FIELDS = ('codec', 'profile', 'level', 'width', 'height', 'pix_fmt', 'field_order',
+                  'color_range', 'color_space', 'color_transfer', 'color_primaries')
+    # avc3 (스트림 내 파라미터 셋) 로 먹싱할 출력 확장자
+    AVC3_EXTENSIONS = ('.mp4', '.m4v', '.mov')
+    # 진행률 비중 - 스트림 복사/병합은 같은 길이 재인코딩의 이 비율만큼으로 계산
+    COPY_PROGRESS_WEIGHT = 0.1
+
+    @staticmethod
+    def extract_segment(input_video_path, output_video_path, start_time, end_time,
+                        progress_callback=None, ffmpeg_executable='ffmpeg', cancel_event=None):
+        """스마트 컷으로 구간 추출. 스마트 컷이 불가능하면 재인코딩으로 폴백
+
+        Returns:
+            dict: {'success', 'message', 'output_path', 'cut_mode'}
+        """
+        start_sec = VideoExtractor.to_seconds(start_time)
+        end_sec = VideoExtractor.to_seconds(end_time)
+
+        def reencode():
+            return VideoExtractor.extract_segment(
+                input_video_path, output_video_path, start_time, end_time,
+                progress_callback=progress_callback, ffmpeg_executable=ffmpeg_executable,
+                cancel_event=cancel_event, cut_mode='reencode')
+
+        plan = SmartCutter.plan(input_video_path, start_sec, end_sec,
+                                ffmpeg_executable=ffmpeg_executable)
+        if not plan:
+            print("SmartCutter: 스마트 컷 불가 - 전체 재인코딩으로 진행")
+            return reencode()
+
+        output_dir = os.path.dirname(output_video_path)
+        if output_dir and not os.path.exists(output_dir):
+            os.makedirs(output_dir)
+
+        # 조각 파일은 출력 폴더와 같은 디스크에 생성 (최종 concat 시 복사 비용 절감)
+        work_dir = tempfile.mkdtemp(prefix='smartcut_', dir=output_dir or None)
+        try:
+            pieces = []
+            steps = SmartCutter._build_piece_commands(
+                input_video_path, plan, work_dir, ffmpeg_executable)
+            total_steps = len(steps) + 1
+
+            # 단계별 진행률 구간 (재인코딩 조각은 길이, 복사/병합은 길이 x COPY_PROGRESS_WEIGHT)
+            weights = [duration * (SmartCutter.COPY_PROGRESS_WEIGHT if is_copy else 1.0)
+                       for _, _, _, duration, is_copy, _ in steps]
+            weights.append((end_sec - start_sec) * SmartCutter.COPY_PROGRESS_WEIGHT)
+            total_weight = sum(weights) or 1.0
+            bounds = [sum(weights[:i]) / total_weight * 100.0 for i in range(len(weights) + 1)]
+
+            for index, (label, piece_path, frames, duration, _, command) in enumerate(steps, start=1):
+                if cancel_event and cancel_event.is_set():
+                    return {'success': False, 'message': "사용자 취소", 'output_path': None}
+                step_label = f"{label} ({index}/{total_steps})"
+                if progress_callback:
+                    progress_callback(step_label, {'percent': bounds[index - 1]})
+                result = VideoExtractor.execute_command(
+                    command, cancel_event=cancel_event,
+                    progress_callback=SmartCutter._scaled_progress(
+                        progress_callback, bounds[index - 1], bounds[index]),
+                    duration=duration, label=step_label)
+                if not result.get('success'):
+                    return result
+                problem = SmartCutter.verify_piece(
+                    piece_path, plan['stream'], frames, ffmpeg_executable)
+                if problem:
+                    print(f"SmartCutter: {label} 확인 실패 ({problem}) - 전체 재인코딩으로 진행")
+                    return reencode()
+                pieces.append(piece_path)
+
+            if cancel_event and cancel_event.is_set():
+                return {'success': False, 'message': "사용자 취소", 'output_path': None}
+            step_label = f"조각 병합 중 ({total_steps}/{total_steps})"
+            if progress_callback:
+                progress_callback(step_label, {'percent': bounds[-2]})
+
+            list_path = os.path.join(work_dir, 'concat.txt')
+            SmartCutter._write_concat_list(list_path, pieces)
+            command = SmartCutter.build_concat_command(
+                list_path, input_video_path, output_video_path,
+                start_sec, end_sec, ffmpeg_executable, stream=plan['stream'])
+            result = VideoExtractor.execute_command(
+                command, cancel_event=cancel_event,
+                progress_callback=SmartCutter._scaled_progress(
+                    progress_callback, bounds[-2], bounds[-1]),
+                duration=end_sec - start_sec, label=step_label)
+            if result.get('success'):
+                result['output_path'] = output_video_path
+                result['cut_mode'] = 'smart'
+            return result
+
+        except Exception as e:
+            return {
+                'success': False,
+                'message': f"스마트 컷 오류 발생: {e}",
+                'output_path': None
+            }
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    @staticmethod
+    def plan(input_path, start_sec, end_sec, ffmpeg_executable='ffmpeg'):
+        """키프레임 위치로 head/middle/tail 경계와 조각별 프레임 수 계산
+
+        키프레임/프레임 시각은 패킷 인덱스(MediaIndex)의 절대 PTS 이므로 파일 시작 시각을
+        빼서 입력측 -ss 기준으로 바꾼다.
+
+        Returns:
+            dict 또는 None: {'start', 'end', 'mid_start', 'mid_end', 'head_frames',
+            'mid_frames', 'tail_frames', 'encoder', 'stream'}
+            가운데 복사 구간이 없거나 코덱이 지원되지 않으면 None
+        """
+        from .media_index import MediaIndex
+        from .media_probe import MediaProbe
+
+        info = MediaProbe.probe(input_path, ffmpeg_executable)
+        stream = info.video if info is not None else None
+        if stream is None or stream.codec not in SmartCutter.SUPPORTED_CODECS:
+            print(f"SmartCutter: 지원하지 않는 비디오 코덱: {stream.codec if stream else None}")
+            return None
+        if stream.profile not in SmartCutter.X264_PROFILES:
+            print(f"SmartCutter: 맞춰 인코딩할 수 없는 프로파일: {stream.profile}")
+            return None
+
+        index = MediaIndex.load(input_path, ffmpeg_executable)
+        if index is None:
+            return None
+
+        eps = SmartCutter.BOUNDARY_EPSILON
+        origin = info.start_time
+        inner = [k - origin for k in
+                 index.keyframe_times(start_sec + origin - eps, end_sec + origin + eps)]
+        if len(inner) < 2:
+            # 구간 안에 키프레임이 1개 이하면 복사할 GOP가 없음
+            return None
+
+        def frames(a, b):
+            return index.frames_between(a + origin, b + origin)
+
+        return {
+            'start': start_sec,
+            'end': end_sec,
+            'mid_start': inner[0],
+            'mid_end': inner[-1],
+            'head_frames': frames(start_sec, inner[0]),
+            'mid_frames': frames(inner[0], inner[-1]),
+            'tail_frames': frames(inner[-1], end_sec),
+            'encoder': SmartCutter.SUPPORTED_CODECS[stream.codec],
+            'stream': stream,
+        }
+
+    @staticmethod
+    def verify_piece(piece_path, source_stream, expected_frames, ffmpeg_executable='ffmpeg'):
+        """조각의 SPS 값과 프레임 수가 원본/계획과 같은지 확인 (다르면 설명 문자열, 같으면 None)"""
+        from .media_probe import MediaProbe
+
+        info = MediaProbe.probe(piece_path, ffmpeg_executable, cache=False)
+        piece = info.video if info is not None else None
+        if piece is None:
+            return "비디오 정보를 읽지 못함"
+        for field in SmartCutter.SPS_FIELDS:
+            expected, actual = getattr(source_stream, field), getattr(piece, field)
+            if expected and actual != expected:
+                return f"{field} 불일치: 원본 {expected}, 조각 {actual}"
+
+        frames = SmartCutter.count_frames(piece_path, ffmpeg_executable)
+        if frames != expected_frames:
+            return f"프레임 수 불일치: 예상 {expected_frames}, 조각 {frames}"
+        return None
+
+    @staticmethod
+    def count_frames(input_path, ffmpeg_executable='ffmpeg'):
+        """첫 비디오 스트림의 패킷(프레임) 수 - 디코딩 없음 (실패 시 -1)"""
+        command = [
+            VideoExtractor.get_ffprobe_executable(ffmpeg_executable),
+            '-v', 'error',
+            '-select_streams', 'v:0',
+            '-show_entries', 'packet=pts_time',
+            '-of', 'csv=p=0',
+            input_path
+        ]
+        try:
+            result = subprocess.run(
+                command, capture_output=True, text=True,
+                encoding='utf-8', errors='ignore', timeout=60)
+        except Exception as e:
+            print(f"SmartCutter: ffprobe 실행 실패: {e}")
+            return -1
+        if result.returncode != 0:
+            return -1
+        return sum(1 for line in result.stdout.splitlines() if line.strip())
+
+    @staticmethod
+    def _scaled_progress(progress_callback, low, high):
+        """한 단계의 ffmpeg 진행률(0~100%)을 전체 진행률의 [low, high] 구간으로 바꿔 전달하는 콜백
+
+        남은 시간은 단계 기준이라 전체와 맞지 않으므로 전달하지 않는다.
+        """
+        if progress_callback is None:
+            return None
+
+        def callback(message, stats=None):
+            if stats and stats.get('percent') is not None:
+                stats = dict(stats, percent=low + (high - low) * stats['percent'] / 100.0,
+                             eta=None)
+            progress_callback(message, stats)
+        return callback
+
+    @staticmethod
+    def _build_piece_commands(input_path, plan, work_dir, ffmpeg_executable):
+        """(표시 문구, 조각 경로, 예상 프레임 수, 길이(초), 복사 여부, ffmpeg 커맨드) 목록 생성"""
+        eps = SmartCutter.BOUNDARY_EPSILON
+        steps = []
+
+        if plan['mid_start'] - plan['start'] > eps and plan['head_frames']:
+            head_path = os.path.join(work_dir, 'head.ts')
+            steps.append(("앞쪽 경계 재인코딩", head_path, plan['head_frames'],
+                          plan['mid_start'] - plan['start'], False,
+                          SmartCutter._encode_command(
+                              input_path, head_path, plan['start'], plan['mid_start'],
+                              plan['head_frames'], plan, ffmpeg_executable)))
+
+        # 가운데: 키프레임 바로 뒤로 입력측 탐색(VideoExtractor.COPY_SEEK_MARGIN 참고),
+        # 다음 경계 키프레임에서 -to. 입력측 -to 는 DTS 기준이라 B 프레임이 있으면
+        # 경계 뒤 프레임이 섞이므로 -frames:v 로 PTS 기준 프레임 수만큼만 복사한다.
+        mid_path = os.path.join(work_dir, 'middle.ts')
+        seek = plan['mid_start'] + min(VideoExtractor.COPY_SEEK_MARGIN,
+                                       (plan['mid_end'] - plan['mid_start']) / 2)
+        steps.append(("가운데 구간 복사", mid_path, plan['mid_frames'],
+                      plan['mid_end'] - plan['mid_start'], True, [
+            ffmpeg_executable, '-y',
+            '-ss', f"{seek:.6f}",
+            '-to', f"{plan['mid_end']:.6f}",
+            '-i', input_path,
+            '-map', '0:v:0', '-an', '-sn', '-dn',
+            '-c:v', 'copy',
+            '-frames:v', str(plan['mid_frames']),
+            '-bsf:v', 'h264_mp4toannexb',
+            '-f', 'mpegts',
+            mid_path
+        ]))
+
+        if plan['end'] - plan['mid_end'] > eps and plan['tail_frames']:
+            tail_path = os.path.join(work_dir, 'tail.ts')
+            steps.append(("뒤쪽 경계 재인코딩", tail_path, plan['tail_frames'],
+                          plan['end'] - plan['mid_end'], False,
+                          SmartCutter._encode_command(
+                              input_path, tail_path, plan['mid_end'], plan['end'],
+                              plan['tail_frames'], plan, ffmpeg_executable)))
+
+        return steps
+
+    @staticmethod
+    def encode_args(stream):
+        """원본 비디오 스트림 SPS 값에 맞춘 libx264 인자"""
+        params = ['repeat-headers=1']
+        if not stream.has_b_frames:
+            params.append('bframes=0')
+        if stream.field_order in ('tt', 'bt'):
+            params.append('tff=1')
+        elif stream.field_order in ('bb', 'tb'):
+            params.append('bff=1')
+        for key, value in (('colorprim', stream.color_primaries),
+                           ('transfer', stream.color_transfer),
+                           ('colormatrix', stream.color_space)):
+            if value and value not in ('unknown', 'reserved'):
+                params.append(f"{key}={value}")
+        if stream.color_range == 'pc':
+            params.append('fullrange=on')
+
+        args = ['-profile:v', SmartCutter.X264_PROFILES[stream.profile]]
+        if stream.level:
+            args += ['-level:v', f"{stream.level / 10:.1f}"]
+        args += ['-pix_fmt', stream.pix_fmt or 'yuv420p',
+                 '-x264-params', ':'.join(params)]
+        return args
+
+    @staticmethod
+    def _encode_command(input_path, piece_path, start_sec, end_sec, frames, plan,
+                        ffmpeg_executable):
+        """경계 조각 재인코딩 커맨드 (입력측 -ss: 트랜스코딩 시 프레임 정확)
+
+        원본 타임스탬프를 그대로 두고(passthrough) 계획한 프레임 수만큼만 인코딩한다.
+        """
+        return [
+            ffmpeg_executable, '-y',
+            '-ss', f"{start_sec:.6f}",
+            '-i', input_path,
+            '-t', f"{end_sec - start_sec:.6f}",
+            '-map', '0:v:0', '-an', '-sn', '-dn',
+            '-fps_mode', 'passthrough',
+            '-frames:v', str(frames),
+            '-c:v', plan['encoder'],
+            '-preset', SmartCutter.ENCODE_PRESET,
+            '-crf', SmartCutter.ENCODE_CRF,
+        ] + SmartCutter.encode_args(plan['stream']) + [
+            '-f', 'mpegts',
+            piece_path
+        ]
+
+    @staticmethod
+    def build_concat_command(list_path, input_path, output_path, start_sec, end_sec,
+                             ffmpeg_executable='ffmpeg', stream=None):
+        """조각 비디오(concat) + 원본 오디오 구간을 최종 파일로 먹싱
+
+        mp4/mov 는 avc3 태그(파라미터 셋을 샘플 안에 둠)와 원본 타임베이스로 먹싱한다.
+        """
+        mux_args = []
+        if os.path.splitext(output_path)[1].lower() in SmartCutter.AVC3_EXTENSIONS:
+            mux_args += ['-tag:v', 'avc3']
+            timescale = (stream.time_base or '').partition('/')[2] if stream else ''
+            if timescale.isdigit():
+                mux_args += ['-video_track_timescale', timescale]
+        return [
+            ffmpeg_executable, '-y',
+            '-f', 'concat', '-safe', '0',
+            '-i', list_path,
+            '-ss', f"{start_sec:.6f}",
+            '-t', f"{end_sec - start_sec:.6f}",
+            '-i', input_path,
+            '-map', '0:v:0',
+            '-map', '1:a:0?',
+            '-c:v', 'copy',
+            '-c:a', 'aac',
+        ] + mux_args + [
+            output_path
+        ]
+
+    @staticmethod
+    def _write_concat_list(list_path, pieces):
+        """concat demuxer 입력 목록 작성 (작은따옴표 이스케이프)"""
+        with open(list_path, 'w', encoding='utf-8') as f:
+            for piece in pieces:
+                escaped = piece.replace("'", "'\\''")
+                f.write(f"file '{escaped}'\n")
@@ -1,21 +1,68 @@
 import os
+import time
+import threading
 import subprocess
+from collections import deque
 from utils.utils import VideoUtils
+from .ffmpeg_progress import FFmpegProgress
 # 상대경로  from ..image_utils import ImageUtils
 # 앱이 ffmpeg 절대경로를 쓰도록 유지하기 위해, ffmpeg_executable='ffmpeg' 로 수정.
 
 
 class VideoExtractor:
-    """비디오 구간 추출을 담당하는 클래스 (항상 재인코딩)"""
+    """비디오 구간 추출을 담당하는 클래스
+
+    컷 모드:
+    - 'reencode': 항상 libx264/aac 재인코딩 (정확하지만 느림)
+    - 'copy': 가장 가까운 키프레임에 맞춰 스트림 복사 (-c copy, 디스크 속도)
+    - 'auto': 키프레임이 허용 오차 안에 있으면 copy, 아니면 reencode
+    - 'smart': 경계 GOP만 재인코딩하고 나머지는 복사 (프레임 정확, SmartCutter)
+
+    재인코딩 시 탐색(seek) 방식:
+    - 'output': -i 뒤에 -ss/-to (0초부터 디코딩 후 버림, 구간이 뒤쪽일수록 느림)
+    - 'input': -i 앞에 -ss (시작 직전 키프레임으로 바로 이동)
+    - 'hybrid': 입력측으로 시작 PRE_ROLL_SECONDS 전까지 이동 후 출력측 -ss로 정확히 자름
+    """
+
+    CUT_MODES = ('reencode', 'copy', 'auto', 'smart')
+    SEEK_MODES = ('output', 'input', 'hybrid')
+    # hybrid 탐색에서 출력측으로 디코딩해 버리는 구간 길이(초)
+    PRE_ROLL_SECONDS = 3.0
+    # copy 모드 입력측 -ss 를 키프레임보다 이만큼 뒤로 (B 프레임이 있고 PTS 탐색을 못 하는
+    # 형식이면 ffmpeg 가 3/23초 앞에서 찾아 이전 키프레임부터 복사하므로)
+    COPY_SEEK_MARGIN = 0.15
+    # 일괄 추출 시 이 간격(초) 이하로 떨어진 구간은 하나의 디코딩으로 묶음
+    BATCH_MERGE_GAP = 10.0
+    # FFmpeg 실행 중 취소 여부 확인 주기(초)
+    POLL_INTERVAL = 0.05
+    # 진행률 콜백 최소 간격(초) - UI 이벤트 과다 발생 방지
+    PROGRESS_INTERVAL = 0.25
+    # 이 시간(초) 동안 ffmpeg 진행 출력이 없으면 멈춘 것으로 보고 중단
+    STALL_TIMEOUT = 60.0
+    # 오류 메시지에 남길 stderr 마지막 줄 수
+    STDERR_TAIL_LINES = 50
 
     @staticmethod
-    def build_ffmpeg_command(input_path, output_path, start_time, end_time, ffmpeg_executable='ffmpeg'):
-        command = [
-            ffmpeg_executable,
-            '-y',
-            '-i', input_path,
-            '-ss', str(start_time),
-            '-to', str(end_time),
+    def build_ffmpeg_command(input_path, output_path, start_time, end_time, ffmpeg_executable='ffmpeg',
+                             cut_mode='reencode', seek_mode='hybrid'):
+        if cut_mode == 'copy':
+            # 입력측 -ss/-to: 디코딩 없이 키프레임부터 패킷 단위로 리먹스
+            command = [
+                ffmpeg_executable,
+                '-y',
+                '-ss', str(start_time),
+                '-to', str(end_time),
+                '-i', input_path,
+                '-c', 'copy',
+                '-avoid_negative_ts', 'make_zero'
+            ]
+            command.append(output_path)
+            return command
+
+        command = [ffmpeg_executable, '-y']
+        command += VideoExtractor.build_seek_args(
+            input_path, start_time, end_time, seek_mode)
+        command += [
             '-c:v', 'libx264',
             '-c:a', 'aac',
             '-strict', 'experimental'
@@ -24,9 +71,31 @@ class VideoExtractor:
 
         return command
 
+    @staticmethod
+    def build_seek_args(input_path, start_time, end_time, seek_mode='hybrid'):
+        """탐색 방식에 맞는 '-ss ... -i input ...' 인자 목록 생성"""
+        if seek_mode not in VideoExtractor.SEEK_MODES:
+            raise ValueError(f"지원하지 않는 탐색 방식: {seek_mode}")
+
+        if seek_mode == 'output':
+            return ['-i', input_path, '-ss', str(start_time), '-to', str(end_time)]
+
+        start_sec = VideoExtractor.to_seconds(start_time)
+        duration = VideoExtractor.to_seconds(end_time) - start_sec
+        if seek_mode == 'input':
+            # 트랜스코딩 시 입력측 -ss는 키프레임 이동 후 시작 지점까지 디코딩해 버리므로 정확함
+            return ['-ss', f"{start_sec:.3f}", '-i', input_path,
+                    '-t', f"{duration:.3f}"]
+
+        # hybrid: 시작 PRE_ROLL 전까지는 빠르게 이동, 나머지는 출력측에서 정확히 자름
+        pre_roll = min(start_sec, VideoExtractor.PRE_ROLL_SECONDS)
+        return ['-ss', f"{start_sec - pre_roll:.3f}", '-i', input_path,
+                '-ss', f"{pre_roll:.3f}", '-t', f"{duration:.3f}"]
+
     @staticmethod
     def extract_segment(input_video_path, output_video_path, start_time, end_time,
-                        progress_callback=None, ffmpeg_executable='ffmpeg', cancel_event=None):
+                        progress_callback=None, ffmpeg_executable='ffmpeg', cancel_event=None,
+                        cut_mode='reencode', keyframe_tolerance=0.5, seek_mode='hybrid'):
         try:
             if not os.path.exists(input_video_path):
                 return {
@@ -35,27 +104,59 @@ class VideoExtractor:
                     'output_path': None
                 }
 
-            start_time_str = VideoExtractor.format_time_for_ffmpeg(start_time)
-            end_time_str = VideoExtractor.format_time_for_ffmpeg(end_time)
+            if cut_mode == 'smart':
+                from .smart_cutter import SmartCutter
+                return SmartCutter.extract_segment(
+                    input_video_path, output_video_path, start_time, end_time,
+                    progress_callback=progress_callback,
+                    ffmpeg_executable=ffmpeg_executable, cancel_event=cancel_event)
 
             output_dir = os.path.dirname(output_video_path)
             if output_dir and not os.path.exists(output_dir):
                 os.makedirs(output_dir)
 
+            # 컷 모드 결정 (copy/auto는 키프레임 위치 확인)
+            mode, cut_start, cut_end = VideoExtractor.plan_cut(
+                input_video_path, start_time, end_time, cut_mode=cut_mode,
+                tolerance=keyframe_tolerance, ffmpeg_executable=ffmpeg_executable)
+
+            if mode == 'copy':
+                start_time_str = f"{cut_start:.3f}"
+                end_time_str = f"{cut_end:.3f}"
+            elif seek_mode != 'output':
+                start_time_str = f"{VideoExtractor.to_seconds(start_time):.3f}"
+                end_time_str = f"{VideoExtractor.to_seconds(end_time):.3f}"
+            else:
+                start_time_str = VideoExtractor.format_time_for_ffmpeg(
+                    start_time)
+                end_time_str = VideoExtractor.format_time_for_ffmpeg(end_time)
+
             command = VideoExtractor.build_ffmpeg_command(
                 input_video_path,
                 output_video_path,
                 start_time_str,
                 end_time_str,
-                ffmpeg_executable=ffmpeg_executable
+                ffmpeg_executable=ffmpeg_executable,
+                cut_mode=mode,
+                seek_mode=seek_mode
             )
 
             if progress_callback:
                 progress_callback("추출 중...")
 
-            result = VideoExtractor.execute_command(command)
+            start_sec = cut_start if mode == 'copy' else VideoExtractor.to_seconds(start_time)
+            end_sec = cut_end if mode == 'copy' else VideoExtractor.to_seconds(end_time)
+            stall_timeout = None
+            if mode != 'copy' and seek_mode == 'output':
+                # 출력측 -ss 는 시작 지점까지 출력 없이 디코딩하므로 그만큼 여유를 둠
+                stall_timeout = VideoExtractor.STALL_TIMEOUT + start_sec
+            result = VideoExtractor.execute_command(
+                command, cancel_event=cancel_event, progress_callback=progress_callback,
+                duration=end_sec - start_sec,
+                stall_timeout=stall_timeout)
             if result.get('success'):
                 result['output_path'] = output_video_path
+                result['cut_mode'] = mode
             return result
 
         except Exception as e:
@@ -65,6 +166,260 @@ class VideoExtractor:
                 'output_path': None
             }
 
+    @staticmethod
+    def build_batch_command(input_path, segments, ffmpeg_executable='ffmpeg', has_audio=True):
+        """여러 구간을 FFmpeg 프로세스 하나에서 한 번씩만 디코딩해 추출하는 커맨드 생성
+
+        서로 가까운(BATCH_MERGE_GAP 이하) 구간들은 하나의 입력(-ss/-t)으로 묶어 한 번만
+        디코딩하고 split/asplit + trim/atrim 으로 나눈다. 멀리 떨어진 묶음은 같은 파일을
+        별도 입력으로 열어 사이 구간을 디코딩하지 않는다.
+
+        Args:
+            segments: [{'start': 초, 'end': 초, 'output_path': 경로}, ...]
+            has_audio: 오디오 스트림 존재 여부 (없으면 atrim 분기와 오디오 인코딩 생략)
+        """
+        if not segments:
+            raise ValueError("추출할 구간이 없습니다.")
+
+        command = [ffmpeg_executable, '-y']
+        graph = []
+        clusters = VideoExtractor._cluster_segments(segments)
+
+        for k, (base, span, members) in enumerate(clusters):
+            command += ['-ss', f"{base:.3f}", '-t', f"{span:.3f}", '-i', input_path]
+
+            count = len(members)
+            graph.append(f"[{k}:v]split={count}" +
+                         ''.join(f"[v{i}]" for i, _, _ in members))
+            for i, start, end in members:
+                graph.append(f"[v{i}]trim=start={start - base:.3f}:end={end - base:.3f},"
+                             f"setpts=PTS-STARTPTS[vo{i}]")
+            if has_audio:
+                graph.append(f"[{k}:a]asplit={count}" +
+                             ''.join(f"[a{i}]" for i, _, _ in members))
+                for i, start, end in members:
+                    graph.append(f"[a{i}]atrim=start={start - base:.3f}:end={end - base:.3f},"
+                                 f"asetpts=PTS-STARTPTS[ao{i}]")
+
+        command += ['-filter_complex', ';'.join(graph)]
+        for i, seg in enumerate(segments):
+            command += ['-map', f"[vo{i}]", '-c:v', 'libx264']
+            if has_audio:
+                command += ['-map', f"[ao{i}]", '-c:a', 'aac']
+            command.append(seg['output_path'])
+        return command
+
+    @staticmethod
+    def _cluster_segments(segments):
+        """시작 시각 순으로 정렬해 겹치거나 가까운 구간끼리 묶음
+
+        Returns:
+            list: [(base, span, [(원래 인덱스, start, end), ...]), ...]
+        """
+        items = sorted(
+            ((i, VideoExtractor.to_seconds(seg['start']), VideoExtractor.to_seconds(seg['end']))
+             for i, seg in enumerate(segments)),
+            key=lambda item: item[1])
+
+        clusters = []
+        for item in items:
+            if clusters and item[1] - clusters[-1][1] <= VideoExtractor.BATCH_MERGE_GAP:
+                clusters[-1][1] = max(clusters[-1][1], item[2])
+                clusters[-1][2].append(item)
+            else:
+                clusters.append([item[1], item[2], [item]])
+
+        return [(base, end - base, members) for base, end, members in clusters]
+
+    @staticmethod
+    def extract_segments_batch(input_video_path, segments, progress_callback=None,
+                               ffmpeg_executable='ffmpeg', cancel_event=None):
+        """같은 비디오의 여러 구간을 FFmpeg 프로세스 하나로 추출
+
+        Returns:
+            dict: {'success', 'message', 'output_paths'}
+        """
+        from .media_probe import MediaProbe
+
+        try:
+            if not os.path.exists(input_video_path):
+                return {
+                    'success': False,
+                    'message': f"입력 비디오 파일이 존재하지 않습니다: {input_video_path}",
+                    'output_paths': []
+                }
+
+            for seg in segments:
+                output_dir = os.path.dirname(seg['output_path'])
+                if output_dir and not os.path.exists(output_dir):
+                    os.makedirs(output_dir)
+
+            # 오디오는 MediaProbe 가 스트림을 확인한 경우에만 포함 (없는 [a] 를 참조하면 전체 실패)
+            info = MediaProbe.probe(input_video_path, ffmpeg_executable)
+            has_audio = info is not None and info.has_audio
+            if info is None or not info.audio_known:
+                print("VideoExtractor: 오디오 스트림을 확인할 수 없어 비디오만 추출합니다.")
+            command = VideoExtractor.build_batch_command(
+                input_video_path, segments, ffmpeg_executable, has_audio=has_audio)
+
+            if progress_callback:
+                progress_callback(f"{len(segments)}개 구간 일괄 추출 중...")
+
+            # 출력 위치(out_time)는 가장 긴 출력 파일 기준으로 진행
+            longest = max(VideoExtractor.to_seconds(seg['end']) - VideoExtractor.to_seconds(seg['start'])
+                          for seg in segments)
+            result = VideoExtractor.execute_command(
+                command, cancel_event=cancel_event, progress_callback=progress_callback,
+                duration=longest, label=f"{len(segments)}개 구간 일괄 추출 중")
+            result['output_paths'] = [seg['output_path'] for seg in segments] \
+                if result.get('success') else []
+            if result.get('success'):
+                result['message'] = f"{len(segments)}개 구간 일괄 추출 성공"
+            return result
+
+        except Exception as e:
+            return {
+                'success': False,
+                'message': f"오류 발생: {e}",
+                'output_paths': []
+            }
+
+    @staticmethod
+    def has_audio_stream(input_path, ffmpeg_executable='ffmpeg'):
+        """오디오 스트림 존재 여부 확인 (MediaProbe 캐시 사용, 확인 실패 시 True로 가정)"""
+        from .media_probe import MediaProbe
+
+        info = MediaProbe.probe(input_path, ffmpeg_executable)
+        if info is None or not info.audio_known:
+            return True
+        return info.has_audio
+
+    @staticmethod
+    def plan_cut(input_path, start_time, end_time, cut_mode='reencode', tolerance=0.5,
+                 ffmpeg_executable='ffmpeg'):
+        """컷 모드와 실제 시작/끝 시각 결정
+
+        copy 는 시작과 끝을 각각 가장 가까운 키프레임에 맞추고, auto 는 두 경계 모두
+        tolerance 안에 키프레임이 있을 때만 copy, 아니면 재인코딩한다 (파일 끝까지면 끝 경계는 통과).
+        ffprobe 키프레임 시각(pts_time)은 절대값이므로 파일 시작 시각(start_time)을 빼서
+        입력측 -ss/-to 기준으로 바꾼다. copy 의 시작 값은 입력측 -ss 에 그대로 넘길 수 있게
+        키프레임보다 COPY_SEEK_MARGIN (다음 키프레임까지 간격의 절반 이하) 만큼 뒤다.
+
+        Returns:
+            tuple: (mode, start_seconds, end_seconds) - mode는 'reencode' 또는 'copy'
+        """
+        from .media_probe import MediaProbe
+
+        if cut_mode not in VideoExtractor.CUT_MODES:
+            raise ValueError(f"지원하지 않는 컷 모드: {cut_mode}")
+
+        start_sec = VideoExtractor.to_seconds(start_time)
+        end_sec = VideoExtractor.to_seconds(end_time)
+        if cut_mode not in ('copy', 'auto'):
+            return 'reencode', start_sec, end_sec
+
+        info = MediaProbe.probe(input_path, ffmpeg_executable)
+        origin = info.start_time if info is not None else 0.0
+        keyframes = VideoExtractor.probe_keyframes(
+            input_path, start_sec + origin, end_sec + origin, window=max(tolerance, 0) + 10.0,
+            ffmpeg_executable=ffmpeg_executable)
+        if not keyframes:
+            # 키프레임 정보가 없으면 auto는 안전하게 재인코딩,
+            # copy는 ffmpeg가 직전 키프레임으로 맞추도록 그대로 진행
+            print("VideoExtractor: 키프레임 정보를 가져오지 못했습니다.")
+            mode = 'copy' if cut_mode == 'copy' else 'reencode'
+            return mode, start_sec, end_sec
+        keyframes = [k - origin for k in keyframes]
+
+        # 요청 시작 시각에 가장 가까운 키프레임 (구간 안쪽 키프레임만 후보)
+        candidates = [k for k in keyframes if k < end_sec] or keyframes
+        cut_start = min(candidates, key=lambda k: abs(k - start_sec))
+        start_offset = abs(cut_start - start_sec)
+
+        # 끝: 파일 끝까지면 그대로, 아니면 시작 이후 가장 가까운 키프레임 (-to 는 그 직전 패킷까지)
+        at_file_end = info is not None and info.duration > 0 and end_sec >= info.duration
+        later = [k for k in keyframes if k > cut_start]
+        if at_file_end:
+            cut_end, end_offset = end_sec, 0.0
+        elif later:
+            cut_end = min(later, key=lambda k: abs(k - end_sec))
+            end_offset = abs(cut_end - end_sec)
+        else:
+            cut_end, end_offset = end_sec, float('inf')
+        print(f"VideoExtractor: 가장 가까운 키프레임 {cut_start:.3f}~{cut_end:.3f}초 "
+              f"(요청 {start_sec:.3f}~{end_sec:.3f}초, 차이 {start_offset:.3f}/{end_offset:.3f}초)")
+
+        if cut_mode == 'copy' or max(start_offset, end_offset) <= tolerance:
+            following = [k for k in keyframes if k > cut_start]
+            gap = (following[0] - cut_start) if following else VideoExtractor.COPY_SEEK_MARGIN * 2
+            return 'copy', cut_start + min(VideoExtractor.COPY_SEEK_MARGIN, gap / 2), cut_end
+        return 'reencode', start_sec, end_sec
+
+    @staticmethod
+    def probe_keyframes(input_path, start_time, end_time, window=10.0, ffmpeg_executable='ffmpeg'):
+        """ffprobe 패킷 정보로 구간 주변의 비디오 키프레임 시각(초) 목록 반환
+
+        디코딩 없이 패킷 플래그만 읽으므로 긴 파일에서도 빠름. 실패 시 None 반환.
+        파일별 패킷 인덱스(MediaIndex)가 이미 캐시에 있으면 바로 찾고, 없으면 짧은 컷을 위해
+        전체 파일을 훑지 않고 구간 주변(-read_intervals)만 읽는다.
+        """
+        from .media_index import MediaIndex
+        read_from = max(0.0, start_time - window)
+        read_to = end_time + window
+        index = MediaIndex.cached(input_path)
+        if index is not None:
+            return index.keyframe_times(read_from, read_to)
+
+        command = [
+            VideoExtractor.get_ffprobe_executable(ffmpeg_executable),
+            '-v', 'error',
+            '-select_streams', 'v:0',
+            '-read_intervals', f"{read_from:.3f}%{read_to:.3f}",
+            '-show_entries', 'packet=pts_time,flags',
+            '-of', 'csv=p=0',
+            input_path
+        ]
+        try:
+            result = subprocess.run(
+                command, capture_output=True, text=True,
+                encoding='utf-8', errors='ignore', timeout=60)
+        except Exception as e:
+            print(f"VideoExtractor: ffprobe 실행 실패: {e}")
+            return None
+        if result.returncode != 0:
+            return None
+
+        keyframes = []
+        for line in result.stdout.splitlines():
+            parts = line.strip().split(',')
+            if len(parts) < 2 or 'K' not in parts[1]:
+                continue
+            try:
+                keyframes.append(float(parts[0]))
+            except ValueError:
+                continue  # pts_time이 N/A인 패킷
+        # -read_intervals 는 탐색한 키프레임부터 읽으므로 앞뒤로 넘친 패킷은 제외 (인덱스 결과와 동일하게)
+        return sorted(k for k in keyframes if read_from <= k <= read_to)
+
+    @staticmethod
+    def get_ffprobe_executable(ffmpeg_executable='ffmpeg'):
+        """ffmpeg 실행 경로로부터 같은 위치의 ffprobe 경로 추정"""
+        return ffmpeg_executable.replace(
+            'ffmpeg', 'ffprobe').replace('ffmpeg.EXE', 'ffprobe.EXE')
+
+    @staticmethod
+    def to_seconds(time_value):
+        """초(숫자) 또는 'HH:MM:SS(.ms)' 문자열을 float 초로 변환"""
+        if isinstance(time_value, (int, float)):
+            return float(time_value)
+        if isinstance(time_value, str):
+            seconds = 0.0
+            for part in time_value.strip().split(':'):
+                seconds = seconds * 60 + float(part)
+            return seconds
+        raise ValueError(
+            f"Invalid time format 지원하지 않는 시간 형식: {type(time_value)}")
+
     @staticmethod
     def format_time_for_ffmpeg(time_value):
         if isinstance(time_value, (int, float)):
@@ -76,46 +431,139 @@ class VideoExtractor:
                 f"Invalid time format 지원하지 않는 시간 형식: {type(time_value)}")
 
     @staticmethod
-    def execute_command(command, cancel_event=None):
+    def execute_command(command, cancel_event=None, progress_callback=None, duration=None,
+                        stall_timeout=None, label="추출 중"):
+        """FFmpeg 실행 - `-progress pipe:1` 출력을 실시간 파싱해 진행률 전달
+
+        Args:
+            cancel_event: threading.Event 또는 CancelToken. CancelToken 이면 프로세스를
+                연결해 cancel() 시점에 바로 kill 하고, 그 외에는 POLL_INTERVAL 마다 확인
+            progress_callback: progress_callback(message, stats) 형태로
+                PROGRESS_INTERVAL 간격 이하로 호출 (stats 는 FFmpegProgress.snapshot())
+            duration: 출력 예상 길이(초) - 퍼센트/ETA 계산용
+            stall_timeout: 이 시간(초) 동안 진행 출력이 없으면 멈춘 것으로 보고 중단
+                (기본 STALL_TIMEOUT, 0 이면 감지 안 함)
+
+        Returns:
+            dict: {'success', 'message', 'output_path', 'speed', 'elapsed'}
+        """
+        if stall_timeout is None:
+            stall_timeout = VideoExtractor.STALL_TIMEOUT
+        progress = FFmpegProgress(duration)
+        command = FFmpegProgress.with_progress_args(command)
+        stderr_tail = deque(maxlen=VideoExtractor.STDERR_TAIL_LINES)
+        lock = threading.Lock()
+        process = None
+
+        def read_progress(stream):
+            for line in stream:
+                with lock:
+                    progress.feed_line(line)
+
+        def read_stderr(stream):
+            for line in stream:
+                stderr_tail.append(line.rstrip())
+
         try:
             command_str = ' '.join(command)
             print(f"Executing FFmpeg command: {command_str}")
 
-            # 취소 기능이 필요 없으면 기존 subprocess.run 사용 (빠름)
-            result = subprocess.run(
+            process = subprocess.Popen(
                 command,
-                check=True,
-                capture_output=True,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
                 text=True,
                 encoding='utf-8',
-                errors='ignore',
-                timeout=300)
-            print(f"FFmpeg 출력: {result.stdout}")
-            if result.stderr:
-                print(f"FFmpeg 경고: {result.stderr}")
+                errors='ignore')
+            if hasattr(cancel_event, 'attach_process'):
+                cancel_event.attach_process(process)
+
+            # 파이프가 가득 차 ffmpeg가 멈추지 않도록 stdout/stderr 를 각각 스레드에서 비움
+            readers = [
+                threading.Thread(target=read_progress, args=(process.stdout,), daemon=True),
+                threading.Thread(target=read_stderr, args=(process.stderr,), daemon=True),
+            ]
+            for reader in readers:
+                reader.start()
+
+            last_report, reported_updates = 0.0, 0
+            while True:
+                try:
+                    process.wait(timeout=VideoExtractor.POLL_INTERVAL)
+                    break
+                except subprocess.TimeoutExpired:
+                    pass
+
+                if cancel_event and cancel_event.is_set():
+                    process.kill()
+                    process.wait()
+                    print("FFmpeg 취소 요청 감지 - 프로세스 종료")
+                    return {'success': False, 'cancelled': True, 'message': "사용자 취소"}
+
+                with lock:
+                    stalled = progress.stalled_for()
+                    now = time.monotonic()
+                    report = (progress_callback and progress.updates != reported_updates and
+                              now - last_report >= VideoExtractor.PROGRESS_INTERVAL)
+                    if report:
+                        reported_updates = progress.updates
+                        message, stats = progress.format_status(label), progress.snapshot()
+                if report:
+                    last_report = now
+                    progress_callback(message, stats)
+
+                if stall_timeout and stalled > stall_timeout:
+                    process.kill()
+                    process.wait()
+                    return {
+                        'success': False,
+                        'message': f"FFmpeg 응답 없음: {stall_timeout:.0f}초 동안 진행 출력 없음"
+                    }
+
+            for reader in readers:
+                reader.join(timeout=1)
+
+            if cancel_event and cancel_event.is_set():
+                return {'success': False, 'cancelled': True, 'message': "사용자 취소"}
+
+            stderr = '\n'.join(stderr_tail)
+            if process.returncode != 0:
+                error_message = f"FFmpeg 오류 발생: 코드 {process.returncode}"
+                if stderr:
+                    error_message += f"\n 오류내용 {stderr}"
+                return {'success': False, 'message': error_message}
+            if stderr:
+                print(f"FFmpeg 경고: {stderr}")
+
+            elapsed = time.monotonic() - progress.started_at
+            # 평균 처리 속도 (× 실시간) - 배치 크기 산정용 로그
+            speed = progress.out_time / elapsed if elapsed > 0 and progress.out_time else None
+            print(f"FFmpeg 완료: 출력 {progress.out_time:.1f}초 / 소요 {elapsed:.1f}초"
+                  + (f" (평균 {speed:.2f}x)" if speed else ""))
+            if progress_callback:
+                progress.finished = True
+                progress_callback(progress.format_status(label), progress.snapshot())
 
             # FFmpeg가 성공적으로 완료되면 성공 결과 반환
             return {
                 'success': True,
                 'message': "비디오 세그먼트 추출 성공",
-                'output_path': command[-1]
+                'output_path': command[-1],
+                'speed': speed,
+                'elapsed': elapsed
             }
 
-        except subprocess.CalledProcessError as e:
-            error_message = f"FFmpeg 오류 발생: 코드 {e.returncode}"
-            if e.stderr:
-                error_message += f"\n 오류내용 {e.stderr}"
-            return {'success': False, 'message': error_message}
-
-        except subprocess.TimeoutExpired:
-            return {'success': False, 'message': "FFmpeg 실행 시간 5분 초과"}
-
         except FileNotFoundError:
             return {'success': False, 'message': "FFmpeg가 설치되지 않았거나, PATH에 없습니다"}
 
         except UnicodeDecodeError as e:
             return {'success': False, 'message': f"인코딩 오류: {str(e)}"}
 
+        finally:
+            if process is not None and hasattr(cancel_event, 'detach_process'):
+                cancel_event.detach_process(process)
+
     @staticmethod
     def get_supported_formats():
         return [
@@ -146,6 +594,38 @@ class ExtractConfig:
         self.output_format = 'mp4'
         self.create_subfolders = False
         self.filename_template = "{basename}_{start}_{end}"
+        # 컷 모드: 'reencode' | 'copy' | 'auto' | 'smart' (VideoExtractor.CUT_MODES)
+        self.cut_mode = 'reencode'
+        # auto 모드에서 copy를 허용할 시작 지점 키프레임 오차(초)
+        self.keyframe_tolerance = 0.5
+        # 재인코딩 탐색 방식: 'output' | 'input' | 'hybrid' (VideoExtractor.SEEK_MODES)
+        self.seek_mode = 'hybrid'
+        # 이미지 추출 시 구간을 나눠 동시에 디코딩할 프로세스 수 (1이면 단일 프로세스)
+        self.image_shards = 1
+        # 이미지 추출 프레임 샘플링 전략 (FrameSampler, None이면 fps 기준 프레임 스킵)
+        self.image_sampler = None
+        # 이미지 추출 모드: 'all' | 'keyframes' | 'scene' | 'contact_sheet' (ImageExtractor.IMAGE_MODES)
+        self.image_mode = 'all'
+        # 'scene' 모드 장면 전환 기준 (0~1, None이면 SceneDetector 기본값)
+        self.scene_threshold = None
+        # 이미지 중복 제거 해밍 거리 기준 (None이면 중복 제거 안 함)
+        self.dedupe_threshold = None
+        # 이미지 저장 방식: 'dir' | 'zip' | 'tar' (FrameSinks.KINDS)
+        self.image_sink = 'dir'
+        # 프레임 배열(.npy) 동시 저장 여부와 저장 크기 (가로, 세로), 회색조 여부
+        self.image_stack = False
+        self.image_stack_size = None
+        self.image_stack_grayscale = False
+        # 이미지 추출 디코더: 'opencv' | 'ffmpeg' | 'auto' (파일마다 선택)
+        self.image_decoder = 'auto'
+        # 이미지 자르기/크기 변경 (FrameTransform, None이면 원본 그대로)
+        self.image_transform = None
+        # 이미지 형식/품질 (EncodeProfile, None이면 JPEG 기본값)
+        self.image_encode_profile = None
+        # 'contact_sheet' 모드 장수/열/타일 크기 (ContactSheet, None이면 기본 16장)
+        self.image_contact_sheet = None
+        # 오디오 출력 형식: 'mp3' | 'wav' | 'native' (원본 스트림 복사, AudioExtractor.AUDIO_FORMATS)
+        self.audio_format = 'mp3'
 
     def generate_filename(self, segment_info):
         base_name = os.path.splitext(segment_info.get('file', 'video'))[0]
@@ -170,3 +650,82 @@ class ExtractConfig:
 
     def set_output_format(self, format_extension):
         self.output_format = format_extension.lstrip('.')
+
+    def set_cut_mode(self, cut_mode, keyframe_tolerance=None):
+        if cut_mode not in VideoExtractor.CUT_MODES:
+            raise ValueError(f"지원하지 않는 컷 모드: {cut_mode}")
+        self.cut_mode = cut_mode
+        if keyframe_tolerance is not None:
+            self.keyframe_tolerance = float(keyframe_tolerance)
+
+    def set_seek_mode(self, seek_mode):
+        if seek_mode not in VideoExtractor.SEEK_MODES:
+            raise ValueError(f"지원하지 않는 탐색 방식: {seek_mode}")
+        self.seek_mode = seek_mode
+
+    def set_image_shards(self, shards):
+        shards = int(shards)
+        if shards < 1:
+            raise ValueError(f"샤드 수는 1 이상이어야 합니다: {shards}")
+        self.image_shards = shards
+
+    def set_image_sampler(self, sampler):
+        self.image_sampler = sampler
+
+    def set_image_mode(self, mode, scene_threshold=None):
+        from .image_extractor import ImageExtractor
+        if mode not in ImageExtractor.IMAGE_MODES:
+            raise ValueError(f"지원하지 않는 이미지 추출 모드: {mode}")
+        self.image_mode = mode
+        if scene_threshold is not None:
+            self.scene_threshold = float(scene_threshold)
+
+    def set_dedupe_threshold(self, threshold):
+        if threshold is not None and int(threshold) < 0:
+            raise ValueError(f"중복 제거 기준은 0 이상이어야 합니다: {threshold}")
+        self.dedupe_threshold = None if threshold is None else int(threshold)
+
+    def set_image_sink(self, sink):
+        from .frame_sinks import FrameSinks
+        if sink not in FrameSinks.KINDS:
+            raise ValueError(f"지원하지 않는 출력 방식: {sink}")
+        self.image_sink = sink
+
+    def set_image_stack(self, enabled, size=None, grayscale=False):
+        if size is not None and (int(size[0]) <= 0 or int(size[1]) <= 0):
+            raise ValueError(f"프레임 배열 크기는 0보다 커야 합니다: {size}")
+        self.image_stack = bool(enabled)
+        self.image_stack_size = None if size is None else (int(size[0]), int(size[1]))
+        self.image_stack_grayscale = bool(grayscale)
+
+    def set_image_decoder(self, decoder):
+        from .image_extractor import ImageExtractor
+        if decoder not in ImageExtractor.DECODERS:
+            raise ValueError(f"지원하지 않는 디코더: {decoder}")
+        self.image_decoder = decoder
+
+    def set_image_transform(self, crop=None, size=None, scale=None):
+        from .frame_transform import FrameTransform
+        if crop is None and size is None and scale is None:
+            self.image_transform = None
+        else:
+            self.image_transform = FrameTransform(crop=crop, size=size, scale=scale)
+
+    def set_image_encode_profile(self, profile):
+        """EncodeProfile 또는 프리셋 이름 ('default', 'fast', 'png', 'webp' ...)"""
+        from .encode_profile import EncodeProfile
+        if isinstance(profile, str):
+            profile = EncodeProfile.preset(profile)
+        self.image_encode_profile = profile
+
+    def set_audio_format(self, audio_format):
+        from .audio_extractor import AudioExtractor
+        if audio_format not in AudioExtractor.AUDIO_FORMATS:
+            raise ValueError(f"지원하지 않는 오디오 형식: {audio_format}")
+        self.audio_format = audio_format
+
+    def set_image_contact_sheet(self, count=None, columns=None, tile_width=None,
+                                selection='even'):
+        from .contact_sheet import ContactSheet
+        self.image_contact_sheet = ContactSheet(
+            count=count, columns=columns, tile_width=tile_width, selection=selection)
@@ -1,5 +1,6 @@
 import os
 import threading
+import functools
 import subprocess
 from datetime import datetime
 from tkinter import filedialog, messagebox
@@ -8,33 +9,53 @@ from utils.extract.image_extractor import ImageUtils
 from utils.event_system import event_system, Events
 from utils.extract.video_extractor import VideoExtractor, ExtractConfig
 from utils.extract.image_extractor import ImageExtractor
+from utils.extract.frame_dedup import FrameDeduplicator
+from utils.extract.frame_stack import FrameStack
 from utils.extract.audio_extractor import AudioExtractor
+from utils.job_scheduler import ExtractionScheduler, ExtractionJob, JobStatus
 
 
 class ExtractionManager:
     """추출 작업 관리자"""
 
-    def __init__(self, parent_frame, app, ffmpeg_manager=None):
+    def __init__(self, parent_frame, app, ffmpeg_manager=None, max_workers=None):
         self.parent_frame = parent_frame
         self.app = app
         self.ffmpeg_manager = ffmpeg_manager
 
-        # 작업 상태 플래그
-        self._is_extracting = False
-        self._is_image_extracting = False
-        self._is_audio_extracting = False
-
-        # 취소 이벤트 객체
-        self.cancel_event = threading.Event()  # 취소 신호 전송 여부 확인
+        # 작업 스케줄러 (제한된 워커 풀 + 우선순위 대기열)
+        self.scheduler = ExtractionScheduler(max_workers=max_workers)
 
         # 추출 설정
         self.extract_config = ExtractConfig()
 
-    def is_busy(self):
-        """작업 중인지 확인"""
-        return (self._is_extracting or
-                self._is_image_extracting or
-                self._is_audio_extracting)
+    def is_busy(self, kind=None):
+        """(종류별) 대기 또는 실행 중인 작업이 있는지 확인"""
+        return self.scheduler.is_busy(kind)
+
+    def _submit_job(self, kind, func, args, description, priority=0, on_done=None):
+        """추출 작업을 스케줄러 대기열에 추가
+
+        작업 함수에는 해당 작업 전용 취소 토큰이 cancel_token 키워드로 전달된다.
+        """
+        # 진행 중인 작업이 하나도 없으면 이전 작업 기록 정리
+        if not self.scheduler.is_busy():
+            self.scheduler.clear_finished()
+
+        job = ExtractionJob(
+            kind, func, args=args, priority=priority,
+            description=description, on_done=on_done)
+        job.kwargs['cancel_token'] = job.cancel_token
+        self.scheduler.submit(job)
+
+        waiting = self.scheduler.pending_count()
+        if waiting:
+            self.parent_frame.after(0, lambda: event_system.emit(
+                Events.PROGRESS_UPDATE,
+                progress=None,
+                job_id=job.job_id,
+                status=f"작업 대기열에 추가됨 (대기 {waiting}개, 동시 {self.scheduler.max_workers}개 실행)"))
+        return job
 
     def _handle_extraction_error(self, extraction_type, error):
         """추출 준비 중 에러 처리"""
@@ -42,16 +63,11 @@ class ExtractionManager:
             "오류", f"{extraction_type} 추출 준비 중 오류: {str(error)}")
 
 # ======== 공개 API 메서드 ========
+# extract_* 는 제출한 작업 목록을 반환 (추출을 시작하지 않았으면 None) - 작업별 취소에 사용
 
     def extract_video_segment(self, segment_info=None):
         """비디오 구간 추출"""
         try:
-            # 중복 실행 방지
-            if self._is_extracting:
-                messagebox.showwarning(
-                    "경고", "이미 비디오 추출 작업이 진행 중입니다.")
-                return
-
             # 구간 정보 가져오기
             if not segment_info:
                 segment_info = self._get_selected_segment_info()
@@ -73,20 +89,61 @@ class ExtractionManager:
                 return
 
             # 추출 시작
-            self._start_video_extraction(input_path, output_path, segment_info)
+            return self._start_video_extraction(input_path, output_path, segment_info)
 
         except Exception as e:
             self._handle_extraction_error("비디오", e)
 
-    def extract_images(self, segment_info=None):
-        """선택한 구간에서 이미지 추출"""
+    def extract_all_video_segments(self, segments=None):
+        """저장된 모든 구간을 비디오별로 묶어 FFmpeg 한 번의 디코딩으로 일괄 추출"""
         try:
-            # 중복 실행 방지
-            if self._is_image_extracting:
+            if segments is None:
+                segments = getattr(self.app, 'saved_segments', None)
+            if not segments:
                 messagebox.showwarning(
-                    "경고", "이미 이미지 추출 작업이 진행 중입니다.")
+                    "경고", "추출할 구간이 없습니다.\n먼저 구간을 저장해주세요.")
+                return
+
+            # FFmpeg 확인
+            if self.ffmpeg_manager and not self.ffmpeg_manager.require_ffmpeg_or_show_error(self.parent_frame, "비디오"):
+                return
+
+            # 출력 폴더 선택
+            output_folder = filedialog.askdirectory(
+                title="비디오 일괄 저장할 폴더 선택",
+                initialdir=VideoUtils.get_default_save_path()
+            )
+            if not output_folder:
+                return
+
+            # 비디오 파일별로 구간 묶기 (파일마다 FFmpeg 1회 실행)
+            batches = {}
+            for segment_info in segments:
+                if segment_info['file'] not in batches:
+                    input_path = self._find_input_file(segment_info)
+                    # 찾지 못한 파일도 기록해 같은 파일의 다른 구간에서 다시 묻지 않음
+                    batches[segment_info['file']] = (input_path, []) if input_path else None
+                if batches[segment_info['file']] is None:
+                    continue
+                batches[segment_info['file']][1].append({
+                    'start': segment_info['start'],
+                    'end': segment_info['end'],
+                    'output_path': self.extract_config.get_output_path(
+                        segment_info, output_folder)
+                })
+
+            batches = [batch for batch in batches.values() if batch is not None]
+            if not batches:
                 return
 
+            return self._start_batch_video_extraction(batches, output_folder)
+
+        except Exception as e:
+            self._handle_extraction_error("비디오", e)
+
+    def extract_images(self, segment_info=None):
+        """선택한 구간에서 이미지 추출"""
+        try:
             # 1. 선택한 구간 정보 가져오기
             if not segment_info:
                 segment_info = self._get_selected_segment_info()
@@ -105,21 +162,61 @@ class ExtractionManager:
                 return
 
             # 4. 이미지 추출 시작
-            self._start_image_extraction(
+            return self._start_image_extraction(
                 input_path, output_folder, segment_info)
 
         except Exception as e:
             self._handle_extraction_error("이미지", e)
 
-    def extract_audio(self, segment_info=None):
-        """오디오 추출"""
+    def extract_all_images(self, segments=None):
+        """저장된 모든 구간 이미지를 비디오별로 묶어 파일당 한 번의 디코딩으로 추출"""
         try:
-            # 중복 실행 방지
-            if self._is_audio_extracting:
+            if segments is None:
+                segments = getattr(self.app, 'saved_segments', None)
+            if not segments:
                 messagebox.showwarning(
-                    "경고", "이미 오디오 추출 작업이 진행 중입니다.")
+                    "경고", "추출할 구간이 없습니다.\n먼저 구간을 저장해주세요.")
                 return
 
+            output_base_folder = filedialog.askdirectory(
+                title="이미지 일괄 저장할 기본 폴더 선택",
+                initialdir=VideoUtils.get_default_save_path()
+            )
+            if not output_base_folder:
+                return
+
+            # 비디오 파일별로 구간 묶기 (구간마다 기존과 같은 이름의 폴더)
+            batches = {}
+            for segment_info in segments:
+                if segment_info['file'] not in batches:
+                    input_path = self._find_input_file(segment_info)
+                    # 찾지 못한 파일도 기록해 같은 파일의 다른 구간에서 다시 묻지 않음
+                    batches[segment_info['file']] = (input_path, []) if input_path else None
+                if batches[segment_info['file']] is None:
+                    continue
+                input_path = batches[segment_info['file']][0]
+                output_folder = os.path.join(
+                    output_base_folder, ImageUtils.generate_output_folder_name(
+                        input_path, segment_info['start'], segment_info['end']))
+                os.makedirs(output_folder, exist_ok=True)
+                batches[segment_info['file']][1].append({
+                    'start': segment_info['start'],
+                    'end': segment_info['end'],
+                    'output_folder': output_folder
+                })
+
+            batches = [batch for batch in batches.values() if batch is not None]
+            if not batches:
+                return
+
+            return self._start_batch_image_extraction(batches, output_base_folder)
+
+        except Exception as e:
+            self._handle_extraction_error("이미지", e)
+
+    def extract_audio(self, segment_info=None):
+        """오디오 추출"""
+        try:
             # 구간 정보 가져오기
             if not segment_info:
                 segment_info = self._get_selected_segment_info()
@@ -142,12 +239,67 @@ class ExtractionManager:
                 return
 
             # 추출 시작
-            self._start_audio_extraction(
+            return self._start_audio_extraction(
                 input_path, output_folder, segment_info)
 
         except Exception as e:
             self._handle_extraction_error("오디오", e)
 
+    def extract_all_audio(self, segments=None):
+        """저장된 모든 구간 오디오를 비디오별로 묶어 파일당 FFmpeg 한 번으로 추출"""
+        try:
+            if segments is None:
+                segments = getattr(self.app, 'saved_segments', None)
+            if not segments:
+                messagebox.showwarning(
+                    "경고", "추출할 구간이 없습니다.\n먼저 구간을 저장해주세요.")
+                return
+
+            # FFmpeg 확인 (오디오 추출에는 필수)
+            if self.ffmpeg_manager and not self.ffmpeg_manager.require_ffmpeg_or_show_error(self.parent_frame, "오디오"):
+                return
+
+            output_base_folder = filedialog.askdirectory(
+                title="오디오 일괄 저장할 기본 폴더 선택",
+                initialdir=VideoUtils.get_default_save_path()
+            )
+            if not output_base_folder:
+                return
+
+            # 'native' 는 추출기가 원본 코덱에 맞게 확장자를 바꿈
+            ext = '.wav' if self.extract_config.audio_format == 'wav' else '.mp3'
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+            # 비디오 파일별로 구간 묶기 (구간마다 단일 추출과 같은 이름의 폴더/파일)
+            batches = {}
+            for segment_info in segments:
+                if segment_info['file'] not in batches:
+                    input_path = self._find_input_file(segment_info)
+                    # 찾지 못한 파일도 기록해 같은 파일의 다른 구간에서 다시 묻지 않음
+                    batches[segment_info['file']] = (input_path, []) if input_path else None
+                if batches[segment_info['file']] is None:
+                    continue
+                input_path = batches[segment_info['file']][0]
+                base_filename = os.path.splitext(os.path.basename(input_path))[0]
+                output_folder = os.path.join(
+                    output_base_folder, ImageUtils.generate_output_folder_name(
+                        input_path, segment_info['start'], segment_info['end']))
+                batches[segment_info['file']][1].append({
+                    'start': segment_info['start'],
+                    'end': segment_info['end'],
+                    'output_path': os.path.join(
+                        output_folder, f"{base_filename}_{timestamp}{ext}")
+                })
+
+            batches = [batch for batch in batches.values() if batch is not None]
+            if not batches:
+                return
+
+            return self._start_batch_audio_extraction(batches, output_base_folder)
+
+        except Exception as e:
+            self._handle_extraction_error("오디오", e)
+
 # ====== 추출 관련 메서드 =======
 
     def _get_selected_segment_info(self):
@@ -260,29 +412,55 @@ class ExtractionManager:
 
     def _start_video_extraction(self, input_path, output_path, segment_info):
         """비디오 추출 시작"""
-        self._is_extracting = True
-        self.cancel_event.clear()
-
         print(f"비디오 추출 시작: {segment_info['start']}~{segment_info['end']}초")
 
-        # 비디오 추출 시작 (직접 메서드 호출로 변경됨)
-
         # 진행률 정보를 콜백으로 전달 (UI 업데이트는 new_tab.py에서)
         if hasattr(self, '_video_progress_callback'):
             self._video_progress_callback("비디오 추출 준비 중...")
 
-        # 백그라운드 스레드에서 추출 실행
-        threading.Thread(
-            target=self._do_video_extraction,
-            args=(input_path, output_path, segment_info),
-            daemon=True
-        ).start()
+        # 워커 풀에서 추출 실행
+        return [self._submit_job(
+            'video', self._do_video_extraction,
+            (input_path, output_path, segment_info),
+            f"비디오 {segment_info['start']}~{segment_info['end']}초")]
+
+    def _start_batch_video_extraction(self, batches, output_folder):
+        """비디오 일괄 추출 시작 - 비디오 파일마다 작업 1개 (파일당 디코딩 1회, 파일끼리 병렬)"""
+        total = sum(len(segments) for _, segments in batches)
+        print(f"비디오 일괄 추출 시작: 파일 {len(batches)}개, 구간 {total}개")
+
+        if hasattr(self, '_video_progress_callback'):
+            self._video_progress_callback("비디오 일괄 추출 준비 중...")
+
+        # 모든 파일 작업이 끝나면 한 번만 완료/오류 이벤트 발행
+        group = {'remaining': len(batches), 'output_paths': [], 'errors': [],
+                 'cancelled': False}
+        group_lock = threading.Lock()
+
+        def on_file_done(job):
+            with group_lock:
+                group['remaining'] -= 1
+                result = job.result or {}
+                if job.status == JobStatus.DONE and result.get('success'):
+                    group['output_paths'].extend(result.get('output_paths', []))
+                elif job.status == JobStatus.CANCELLED:
+                    group['cancelled'] = True
+                else:
+                    group['errors'].append(
+                        result.get('message') or str(job.error or '알 수 없는 오류'))
+                if group['remaining'] > 0:
+                    return
+            self._finish_batch_video_extraction(group, output_folder)
+
+        return [self._submit_job(
+            'video', self._do_batch_video_extraction,
+            (input_path, segments),
+            f"비디오 일괄 {os.path.basename(input_path)} ({len(segments)}개 구간)",
+            on_done=on_file_done)
+            for input_path, segments in batches]
 
     def _start_image_extraction(self, input_path, output_folder, segment_info):
         """이미지 추출 시작"""
-        self._is_image_extracting = True
-        self.cancel_event.clear()  # 취소 신호 전송 False 값 전달
-
         print(f"이미지 추출 시작: {segment_info['start']}~{segment_info['end']}초")
         print(f"이미지 저장 폴더: {output_folder}")
 
@@ -292,18 +470,68 @@ class ExtractionManager:
             # progress=0, extracted_count=0, total_frames=0 (아직 추출 시작 전)
             self._image_progress_callback(0, 0, 0)
 
-        # 백그라운드 스레드에서 추출 실행
-        threading.Thread(
-            target=self._do_image_extraction,
-            args=(input_path, output_folder, segment_info),
-            daemon=True
-        ).start()
+        # 워커 풀에서 추출 실행
+        return [self._submit_job(
+            'image', self._do_image_extraction,
+            (input_path, output_folder, segment_info),
+            f"이미지 {segment_info['start']}~{segment_info['end']}초")]
+
+    def _start_batch_image_extraction(self, batches, output_folder):
+        """이미지 일괄 추출 시작 - 비디오 파일마다 작업 1개 (파일당 디코딩 1회)
+
+        장면/contact sheet 모드, 중복 제거, 아카이브/프레임 배열 저장은 구간마다 따로 처리해야 하므로
+        구간별 이미지 추출 작업으로 나눠 실행한다.
+        """
+        config = self.extract_config
+        if config.image_mode in ('scene', 'contact_sheet') or \
+                config.dedupe_threshold is not None or \
+                config.image_sink != 'dir' or config.image_stack:
+            jobs = []
+            for input_path, segments in batches:
+                for segment in segments:
+                    jobs.extend(self._start_image_extraction(
+                        input_path, segment['output_folder'], segment))
+            return jobs
+
+        total = sum(len(segments) for _, segments in batches)
+        print(f"이미지 일괄 추출 시작: 파일 {len(batches)}개, 구간 {total}개")
+        if hasattr(self, '_image_progress_callback'):
+            self._image_progress_callback(0, 0, 0)
+
+        # 모든 파일 작업이 끝나면 한 번만 완료/오류 이벤트 발행
+        group = {'remaining': len(batches), 'extracted_count': 0, 'errors': [],
+                 'cancelled': False}
+        group_lock = threading.Lock()
+
+        def on_file_done(job):
+            with group_lock:
+                group['remaining'] -= 1
+                result = job.result or {}
+                if job.status == JobStatus.CANCELLED:
+                    group['cancelled'] = True
+                elif job.status == JobStatus.DONE and result.get('success'):
+                    group['extracted_count'] += result.get('extracted_count', 0)
+                else:
+                    group['errors'].append(
+                        result.get('message') or str(job.error or '알 수 없는 오류'))
+                if group['remaining'] > 0:
+                    return
+            if group['errors']:
+                self._handle_image_extraction_error("\n".join(group['errors']))
+            elif not group['cancelled']:
+                result = {'success': True, 'extracted_count': group['extracted_count']}
+                self.parent_frame.after(
+                    0, lambda: self._emit_image_extraction_complete(result, output_folder))
+
+        return [self._submit_job(
+            'image', self._do_batch_image_extraction,
+            (input_path, segments),
+            f"이미지 일괄 {os.path.basename(input_path)} ({len(segments)}개 구간)",
+            on_done=on_file_done)
+            for input_path, segments in batches]
 
     def _start_audio_extraction(self, input_path, output_folder, segment_info):
         """오디오 추출 시작"""
-        self._is_audio_extracting = True
-        self.cancel_event.clear()
-
         print(f"오디오 추출 시작: {segment_info['start']}~{segment_info['end']}초")
         print(f"오디오 저장 폴더: {output_folder}")
 
@@ -311,22 +539,60 @@ class ExtractionManager:
         if hasattr(self, '_audio_progress_callback'):
             self._audio_progress_callback("오디오 추출 준비 중...")
 
-        # 백그라운드 스레드에서 추출 실행
-        threading.Thread(
-            target=self._do_audio_extraction,
-            args=(input_path, output_folder, segment_info),
-            daemon=True
-        ).start()
+        # 워커 풀에서 추출 실행
+        return [self._submit_job(
+            'audio', self._do_audio_extraction,
+            (input_path, output_folder, segment_info),
+            f"오디오 {segment_info['start']}~{segment_info['end']}초")]
+
+    def _start_batch_audio_extraction(self, batches, output_folder):
+        """오디오 일괄 추출 시작 - 비디오 파일마다 작업 1개 (파일당 FFmpeg 1회)"""
+        total = sum(len(segments) for _, segments in batches)
+        print(f"오디오 일괄 추출 시작: 파일 {len(batches)}개, 구간 {total}개")
+
+        if hasattr(self, '_audio_progress_callback'):
+            self._audio_progress_callback("오디오 일괄 추출 준비 중...")
+
+        # 모든 파일 작업이 끝나면 한 번만 완료/오류 이벤트 발행
+        group = {'remaining': len(batches), 'output_paths': [], 'errors': [],
+                 'cancelled': False}
+        group_lock = threading.Lock()
+
+        def on_file_done(job):
+            with group_lock:
+                group['remaining'] -= 1
+                result = job.result or {}
+                if job.status == JobStatus.DONE and result.get('success'):
+                    group['output_paths'].extend(result.get('output_paths', []))
+                elif job.status == JobStatus.CANCELLED:
+                    group['cancelled'] = True
+                else:
+                    group['errors'].append(
+                        result.get('message') or str(job.error or '알 수 없는 오류'))
+                if group['remaining'] > 0:
+                    return
+            if group['errors']:
+                self._handle_audio_extraction_error("\n".join(group['errors']))
+            elif not group['cancelled']:
+                result = {'success': True,
+                          'message': f"{len(group['output_paths'])}개 구간 오디오 일괄 추출 성공"}
+                self.parent_frame.after(
+                    0, lambda: self._emit_audio_extraction_complete(result, output_folder))
+
+        return [self._submit_job(
+            'audio', self._do_batch_audio_extraction,
+            (input_path, segments),
+            f"오디오 일괄 {os.path.basename(input_path)} ({len(segments)}개 구간)",
+            on_done=on_file_done)
+            for input_path, segments in batches]
 
 # ========= 실제 추출 메서드 ==========
 
-    def _do_video_extraction(self, input_path, output_path, segment_info):
+    def _do_video_extraction(self, input_path, output_path, segment_info, cancel_token=None):
         """실제 비디오 추출 작업 (백그라운드)"""
         try:
-            # # 취소 확인
-            # if self.cancel_event.is_set():
-            #     self._on_extraction_cancel()
-            #     return
+            if cancel_token and cancel_token.is_set():
+                return {'success': False, 'message': "사용자 취소", 'output_path': None}
 
             # extract/video_extractor.py 의 VideoExtractor로 추출
             result = VideoExtractor.extract_segment(
@@ -334,24 +600,66 @@ class ExtractionManager:
                 output_video_path=output_path,
                 start_time=segment_info['start'],
                 end_time=segment_info['end'],
-                progress_callback=self._video_progress_callback,
+                progress_callback=functools.partial(
+                    self._video_progress_callback, cancel_token=cancel_token),
                 ffmpeg_executable=self._get_ffmpeg_executable(),
-                cancel_event=self.cancel_event
+                cancel_event=cancel_token,
+                cut_mode=self.extract_config.cut_mode,
+                keyframe_tolerance=self.extract_config.keyframe_tolerance,
+                seek_mode=self.extract_config.seek_mode
             )
 
+            # 취소된 작업은 완료/오류 이벤트 없이 종료
+            if cancel_token and cancel_token.is_set():
+                return result
+
             # 결과 이벤트 발생
             self.parent_frame.after(
                 0, lambda: self._emit_video_extraction_complete(result))
+            return result
 
         except Exception as e:
-            self.parent_frame.after(
-                0, lambda err=e: self._handle_video_extraction_error(str(err)))
+            self._handle_video_extraction_error(str(e), cancel_token)
 
-    def _do_image_extraction(self, input_path, output_folder, segment_info):
+    def _do_batch_video_extraction(self, input_path, segments, cancel_token=None):
+        """실제 비디오 일괄 추출 작업 (워커 스레드) - 묶음당 FFmpeg 1회
+
+        완료/오류 이벤트는 묶음 전체가 끝난 뒤 _finish_batch_video_extraction 에서 발행
+        """
+        if cancel_token and cancel_token.is_set():
+            return {'success': False, 'message': "사용자 취소", 'output_paths': []}
+
+        return VideoExtractor.extract_segments_batch(
+            input_video_path=input_path,
+            segments=segments,
+            progress_callback=functools.partial(
+                self._video_progress_callback, cancel_token=cancel_token),
+            ffmpeg_executable=self._get_ffmpeg_executable(),
+            cancel_event=cancel_token
+        )
+
+    def _finish_batch_video_extraction(self, group, output_folder):
+        """일괄 추출의 모든 묶음 작업 종료 후 결과 이벤트 발행"""
+        if group['errors']:
+            self._handle_video_extraction_error("\n".join(group['errors']))
+            return
+        if group['cancelled']:
+            return
+
+        output_paths = group['output_paths']
+        result = {
+            'success': True,
+            'message': f"{len(output_paths)}개 구간 일괄 추출 성공",
+            'output_path': output_paths[0] if output_paths else output_folder
+        }
+        self.parent_frame.after(
+            0, lambda: self._emit_video_extraction_complete(result))
+
+    def _do_image_extraction(self, input_path, output_folder, segment_info, cancel_token=None):
         """실제 이미지 추출 작업 (백그라운드)"""
         try:
             # 취소 확인
-            if self.cancel_event.is_set():
+            if cancel_token and cancel_token.is_set():
                 return  # 취소 시 단순히 종료
 
             # extract/ImageExtractor.py의 메서드를 사용하여 프레임 추출
@@ -361,10 +669,35 @@ class ExtractionManager:
                 start_time=segment_info['start'],
                 end_time=segment_info['end'],
                 # 실제 추출 작업에서 진행률 콜백 호출함. 쓰레드에서 실행.
-                progress_callback=self._image_progress_callback,
-                cancel_event=self.cancel_event
+                progress_callback=functools.partial(
+                    self._image_progress_callback, cancel_token=cancel_token),
+                cancel_event=cancel_token,
+                shards=self.extract_config.image_shards,
+                sampler=self.extract_config.image_sampler,
+                mode=self.extract_config.image_mode,
+                scene_threshold=self.extract_config.scene_threshold,
+                deduplicator=(
+                    FrameDeduplicator(self.extract_config.dedupe_threshold)
+                    if self.extract_config.dedupe_threshold is not None else None),
+                output_sink=self.extract_config.image_sink,
+                frame_stack=(
+                    FrameStack(self.extract_config.image_stack_size,
+                               self.extract_config.image_stack_grayscale)
+                    if self.extract_config.image_stack else None),
+                decoder=self.extract_config.image_decoder,
+                transform=self.extract_config.image_transform,
+                encode_profile=self.extract_config.image_encode_profile,
+                contact_sheet=self.extract_config.image_contact_sheet,
+                ffmpeg_executable=self._get_ffmpeg_executable()
             )
 
+            if self.extract_config.image_mode == 'contact_sheet' and \
+                    not result.get('extracted_count'):
+                # contact sheet 는 디코더 자동 선택으로 이미 FFmpeg 까지 시도함
+                self._handle_image_extraction_error(
+                    "contact sheet 에 넣을 프레임을 읽지 못했습니다.", cancel_token)
+                return
+
             # OpenCV가 실패하거나 0개 추출 시 FFmpeg 폴백 시도
             if (not result) or (result.get('extracted_count', 0) == 0):
                 print("OpenCV 이미지 추출 결과가 0개입니다. FFmpeg 폴백(이미지 추출)을 시도합니다.")
@@ -375,7 +708,11 @@ class ExtractionManager:
                     start_time=segment_info['start'],
                     end_time=segment_info['end'],
                     ffmpeg_executable=self._get_ffmpeg_executable(),
-                    cancel_event=self.cancel_event
+                    cancel_event=cancel_token,
+                    mode=self.extract_config.image_mode,
+                    scene_threshold=self.extract_config.scene_threshold,
+                    transform=self.extract_config.image_transform,
+                    encode_profile=self.extract_config.image_encode_profile
                 )
                 if ff_result.get('success') and ff_result.get('extracted_count', 0) > 0:
                     # 폴백 성공 시 결과 변환하여 동일 경로로 전달
@@ -388,30 +725,61 @@ class ExtractionManager:
                 else:
                     # 폴백 실패 시 에러 이벤트
                     error_msg = ff_result.get('message', 'FFmpeg 폴백 실패')
-                    self._handle_image_extraction_error(error_msg)
+                    self._handle_image_extraction_error(error_msg, cancel_token)
                     return
 
             # 취소되지 않았으면, 완료 이벤트 발행
-            if not self.cancel_event.is_set():
+            if not (cancel_token and cancel_token.is_set()):
                 # 결과 이벤트 발생 (UI 업데이트는 new_tab.py에서 처리)
                 self.parent_frame.after(
                     0, lambda: self._emit_image_extraction_complete(result, output_folder))
 
         except Exception as e:
             error_msg = f"이미지 추출 중 오류 발생: {str(e)}"
-            self._handle_image_extraction_error(error_msg)
+            self._handle_image_extraction_error(error_msg, cancel_token)
+
+    def _do_batch_image_extraction(self, input_path, segments, cancel_token=None):
+        """실제 이미지 일괄 추출 작업 (워커 스레드) - 파일당 디코딩 1회
+
+        완료/오류 이벤트는 모든 파일 작업이 끝난 뒤 on_done 에서 발행
+        """
+        if cancel_token and cancel_token.is_set():
+            return {'success': False, 'message': "사용자 취소", 'extracted_count': 0}
+        try:
+            result = ImageExtractor.extract_frames_multi(
+                input_path=input_path,
+                segments=segments,
+                progress_callback=functools.partial(
+                    self._image_progress_callback, cancel_token=cancel_token),
+                cancel_event=cancel_token,
+                ffmpeg_executable=self._get_ffmpeg_executable(),
+                sampler=self.extract_config.image_sampler,
+                mode=self.extract_config.image_mode,
+                decoder=self.extract_config.image_decoder,
+                transform=self.extract_config.image_transform,
+                encode_profile=self.extract_config.image_encode_profile
+            )
+        except Exception as e:
+            return {'success': False,
+                    'message': f"이미지 일괄 추출 중 오류 발생: {str(e)}",
+                    'extracted_count': 0}
+        result['success'] = True
+        return result
 
-    def _do_audio_extraction(self, input_path, output_folder, segment_info):
+    def _do_audio_extraction(self, input_path, output_folder, segment_info, cancel_token=None):
         """실제 오디오 추출 작업 (백그라운드)"""
         try:
             # 취소 확인
-            if self.cancel_event.is_set():
+            if cancel_token and cancel_token.is_set():
                 return  # 취소 시 단순히 종료
 
             # AudioExtractor를 사용하여 오디오 추출
             base_filename = os.path.splitext(os.path.basename(input_path))[0]
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            audio_filename = f"{base_filename}_{timestamp}.mp3"
+            audio_format = self.extract_config.audio_format
+            # 'native' 는 추출기가 원본 코덱에 맞게 확장자를 바꿈 (결과의 output_path)
+            ext = '.wav' if audio_format == 'wav' else '.mp3'
+            audio_filename = f"{base_filename}_{timestamp}{ext}"
             output_path = os.path.join(output_folder, audio_filename)
 
             result = AudioExtractor.extract_audio_segment(
@@ -419,43 +787,78 @@ class ExtractionManager:
                 output_audio_path=output_path,
                 start_time=segment_info['start'],
                 end_time=segment_info['end'],
-                progress_callback=self._audio_progress_callback,
-                audio_format='mp3',
+                progress_callback=functools.partial(
+                    self._audio_progress_callback, cancel_token=cancel_token),
+                audio_format=audio_format,
                 audio_quality='192k',
                 ffmpeg_executable=self._get_ffmpeg_executable(),
-                cancel_event=self.cancel_event
+                cancel_event=cancel_token
             )
 
             # 취소된 경우가 아니며 추출완료시, 완료 이벤트 발행
-            if not self.cancel_event.is_set():
+            if not (cancel_token and cancel_token.is_set()):
                 # 결과 이벤트 발생
                 self.parent_frame.after(
                     0, lambda: self._emit_audio_extraction_complete(result, output_folder))
 
         except Exception as e:
-            self.parent_frame.after(
-                0, lambda err=e: self._handle_audio_extraction_error(str(err)))
+            self._handle_audio_extraction_error(str(e), cancel_token)
+
+    def _do_batch_audio_extraction(self, input_path, segments, cancel_token=None):
+        """실제 오디오 일괄 추출 작업 (워커 스레드) - 파일당 FFmpeg 1회
+
+        완료/오류 이벤트는 모든 파일 작업이 끝난 뒤 on_done 에서 발행
+        """
+        if cancel_token and cancel_token.is_set():
+            return {'success': False, 'message': "사용자 취소", 'output_paths': []}
+
+        return AudioExtractor.extract_audio_segments_batch(
+            input_video_path=input_path,
+            segments=segments,
+            progress_callback=functools.partial(
+                self._audio_progress_callback, cancel_token=cancel_token),
+            audio_format=self.extract_config.audio_format,
+            audio_quality='192k',
+            ffmpeg_executable=self._get_ffmpeg_executable(),
+            cancel_event=cancel_token
+        )
 
 # ======== 진행률 콜백 메서드 =========
 
-    def _video_progress_callback(self, message):
-        """비디오 추출 진행률 콜백"""
-        if not self.cancel_event.is_set():
-            self.parent_frame.after(0, lambda: event_system.emit(
-                Events.PROGRESS_UPDATE,
-                progress=50,
-                status=f"비디오 추출 중... {message}"))
+    def _video_progress_callback(self, message, stats=None, cancel_token=None):
+        """비디오 추출 진행률 콜백 (취소된 작업의 진행률은 무시)
 
-    def _image_progress_callback(self, progress, extracted_count, total_frames):
+        Args:
+            message (str): 상태 문구
+            stats (dict): FFmpegProgress.snapshot() - percent/speed/fps/eta (없으면 None)
+        """
+        if not (cancel_token and cancel_token.is_set()):
+            self._emit_ffmpeg_progress(f"비디오 {message}", stats)
+
+    def _emit_ffmpeg_progress(self, status, stats=None):
+        """FFmpeg 진행률(퍼센트, 처리 속도, 남은 시간) 이벤트 발행"""
+        stats = stats or {}
+        # 진행률을 알 수 없는 단계(준비 중 등)는 기존처럼 50%로 표시
+        progress = stats.get('percent') if stats else 50
+        self.parent_frame.after(0, lambda: event_system.emit(
+            Events.PROGRESS_UPDATE,
+            progress=progress,
+            status=status,
+            speed=stats.get('speed'),
+            fps=stats.get('fps'),
+            eta=stats.get('eta')))
+
+    def _image_progress_callback(self, progress, extracted_count, total_frames, cancel_token=None):
         """이미지 추출 진행률 콜백
         Args:
             progress (int): 진행률 (0-100)
             extracted_count (int): 현재까지 추출된 이미지 개수
             total_frames (int): 전체 추출할 프레임 개수
+            cancel_token: 작업 취소 토큰 (취소된 작업의 진행률은 무시)
         Note:
             ImageExtractor에서 호출되며, UI 업데이트를 위해 이벤트 시스템으로 전달
         """
-        if not self.cancel_event.is_set():
+        if not (cancel_token and cancel_token.is_set()):
             self.parent_frame.after(0, lambda: event_system.emit(
                 Events.PROGRESS_UPDATE,
                 progress=progress,
@@ -464,46 +867,41 @@ class ExtractionManager:
                 status=f"이미지 {extracted_count}/{total_frames} 저장 중..."
             ))
 
-    def _audio_progress_callback(self, message="오디오 추출 중..."):
-        """오디오 추출 진행률 콜백"""
-        if not self.cancel_event.is_set():
-            self.parent_frame.after(0, lambda: event_system.emit(
-                Events.PROGRESS_UPDATE,
-                progress=50,
-                status=message
-            ))
+    def _audio_progress_callback(self, message="오디오 추출 중...", stats=None, cancel_token=None):
+        """오디오 추출 진행률 콜백 (취소된 작업의 진행률은 무시)"""
+        if not (cancel_token and cancel_token.is_set()):
+            self._emit_ffmpeg_progress(message, stats)
 
 # ========= 추출 시작 이벤트는 제거됨 - 직접 호출로 변경 =========
 
 # ========= 추출 오류 이벤트 발행 관련 =========
 
-    def _handle_video_extraction_error(self, error_msg):
+    def _handle_video_extraction_error(self, error_msg, cancel_token=None):
         """비디오 추출 작업 중 오류가 발생했을때 호출되는 메서드 - 에러 이벤트 발행
 
         Note:
-            비디오 추출은 취소 불가능하므로 취소 조건 없이 항상 오류 이벤트 발행
+            취소된 작업(cancel_token 설정됨)은 오류 이벤트를 발행하지 않음
         """
-        self._is_extracting = False
+        if cancel_token and cancel_token.is_set():
+            return
 
         self.parent_frame.after(0, lambda: event_system.emit(
             Events.VIDEO_EXTRACTION_ERROR,
             message=error_msg, progress=0, status="오류 발생", icon="⚠️"))
 
-    def _handle_image_extraction_error(self, error_msg):
+    def _handle_image_extraction_error(self, error_msg, cancel_token=None):
         """이미지 추출 작업 중 오류가 발생했을때 호출되는 메서드 - 에러 이벤트 발행"""
-        self._is_image_extracting = False
         # 취소된 경우가 아니며 에러 발생시, 에러 이벤트 발행
-        if not self.cancel_event.is_set():
+        if not (cancel_token and cancel_token.is_set()):
             self.parent_frame.after(0, lambda: event_system.emit(
                 Events.IMAGE_EXTRACTION_ERROR,
                 message=error_msg, progress=0, status="오류 발생", icon="⚠️"))
 
-    def _handle_audio_extraction_error(self, error_msg):
+    def _handle_audio_extraction_error(self, error_msg, cancel_token=None):
         """오디오 추출 작업 중 오류가 발생했을때 호출되는 메서드 - 에러 이벤트 발행"""
-        self._is_audio_extracting = False
 
         # 취소된 경우가 아니며 에러 발생시, 에러 이벤트 발행
-        if not self.cancel_event.is_set():
+        if not (cancel_token and cancel_token.is_set()):
             self.parent_frame.after(0, lambda: event_system.emit(
                 Events.AUDIO_EXTRACTION_ERROR, message=error_msg))
 
@@ -517,7 +915,6 @@ class ExtractionManager:
         Note:
             UI 업데이트는 new_tab.py의 _show_extraction_success에서 처리
         """
-        self._is_extracting = False
         output_path = result.get('output_path', '')
         output_folder = os.path.dirname(output_path) if output_path else ''
 
@@ -538,14 +935,14 @@ class ExtractionManager:
         Note:
             UI 업데이트는 new_tab.py의 _show_extraction_success에서 처리
         """
-        self._is_image_extracting = False
 
         event_system.emit(
             Events.IMAGE_EXTRACTION_COMPLETE,
             extract_type="image",
             extracted_count=result['extracted_count'],
             output_folder=output_folder,  # 저장 위치 정보
-            success=result.get('success', True)  # result에서 success 값 가져오기
+            success=result.get('success', True),  # result에서 success 값 가져오기
+            sheet_path=result.get('sheet_path')  # contact sheet 모드일 때만
         )
 
     def _emit_audio_extraction_complete(self, result, output_folder):
@@ -557,9 +954,9 @@ class ExtractionManager:
         Note:
             UI 업데이트는 new_tab.py의 _show_extraction_success에서 처리
         """
-        self._is_audio_extracting = False
         output_path = result.get('output_path', '')
-        output_folder = os.path.dirname(output_path) if output_path else ''
+        # 일괄 추출은 output_path 없이 기본 폴더를 그대로 전달
+        output_folder = os.path.dirname(output_path) if output_path else output_folder
 
         event_system.emit(
             Events.AUDIO_EXTRACTION_COMPLETE,
@@ -577,15 +974,20 @@ class ExtractionManager:
 
 # ========= 추출 취소 요청청 메서드 =========
 
-    def _cancel_all_extractions(self, **kwargs):
+    def cancel_job(self, job_id):
+        """작업 하나만 취소 (다른 대기/실행 중 작업은 계속 진행)
+
+        Returns:
+            bool: 취소 요청 여부
+        """
+        return self.scheduler.cancel(job_id)
+
+    def _cancel_all_extractions(self, kind=None, **kwargs):
         """추출 취소 이벤트 발행 - 통합된 취소 처리"""
         try:
-            # 상태 플래그 리셋
-            self._is_image_extracting = False
-            self._is_audio_extracting = False
-
-            # 취소 이벤트 객체 설정
-            self.cancel_event.set()
+            # 대기 중인 작업은 실행하지 않고, 실행 중인 작업은 토큰으로 ffmpeg 즉시 종료
+            cancelled = self.scheduler.cancel_all(kind)
+            print(f"추출 작업 {len(cancelled)}개 취소 요청")
             # UI 업데이트는 new_tab.py에서 처리하므로 이벤트 발행 및 알림 제거
         except Exception as e:
             print(f"추출 취소 처리 중 오류: {str(e)}")
@@ -31,7 +31,13 @@ class ImageUtils:
         return f"{video_filename}_{start_time_str}_{end_time_str}_{today}"
 
     @staticmethod
-    def generate_image_filename(base_filename, frame_number):
-        """이미지 파일명 생성 (타임스탬프 포함)"""
+    def generate_image_filename(base_filename, frame_number, ext='.jpg'):
+        """이미지 파일명 생성 (타임스탬프 포함, ext 는 EncodeProfile.ext)"""
         timestamp = datetime.now().strftime("%y%m%d")
-        return f"{base_filename}_{timestamp}_frame{frame_number:06d}.jpg"
+        return f"{base_filename}_{timestamp}_frame{frame_number:06d}{ext}"
+
+    @staticmethod
+    def generate_contact_sheet_filename(base_filename, start_frame, end_frame, ext='.jpg'):
+        """contact sheet 파일명 생성 (구간 프레임 범위 포함)"""
+        timestamp = datetime.now().strftime("%y%m%d")
+        return f"{base_filename}_{timestamp}_sheet_{start_frame:06d}-{end_frame:06d}{ext}"
@@ -0,0 +1,275 @@
+import os
+import time
+import queue
+import itertools
+import threading
+
+
+class JobStatus:
+    """추출 작업 상태 상수들"""
+
+    PENDING = "pending"  # 대기열에서 대기 중
+    RUNNING = "running"  # 워커에서 실행 중
+    DONE = "done"  # 정상 완료
+    FAILED = "failed"  # 예외로 실패
+    CANCELLED = "cancelled"  # 취소됨 (대기 중 또는 실행 중)
+
+
+class CancelToken:
+    """작업별 취소 토큰 - threading.Event 와 같은 is_set()/wait() 인터페이스 제공
+
+    실행 중인 ffmpeg 프로세스를 attach_process() 로 연결해 두면 cancel() 호출
+    즉시 프로세스를 종료하므로, 폴링 주기를 기다리지 않고 바로 중단된다.
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._processes = []
+        self._lock = threading.Lock()
+
+    def cancel(self):
+        """취소 신호 설정 및 연결된 프로세스 즉시 종료"""
+        with self._lock:
+            self._event.set()
+            processes = list(self._processes)
+        for process in processes:
+            CancelToken._kill(process)
+
+    def is_set(self):
+        """취소 여부 (threading.Event 호환)"""
+        return self._event.is_set()
+
+    is_cancelled = is_set
+
+    def wait(self, timeout=None):
+        """취소될 때까지 최대 timeout 초 대기 (threading.Event 호환)"""
+        return self._event.wait(timeout)
+
+    def attach_process(self, process):
+        """취소 시 종료할 서브프로세스 연결 (이미 취소됐으면 바로 종료)"""
+        with self._lock:
+            self._processes.append(process)
+            cancelled = self._event.is_set()
+        if cancelled:
+            CancelToken._kill(process)
+
+    def detach_process(self, process):
+        """끝난 서브프로세스 연결 해제"""
+        with self._lock:
+            if process in self._processes:
+                self._processes.remove(process)
+
+    @staticmethod
+    def _kill(process):
+        try:
+            if process.poll() is None:
+                process.kill()
+        except Exception as e:
+            print(f"[CancelToken] 프로세스 종료 실패: {e}")
+
+
+class ExtractionJob:
+    """스케줄러에 제출되는 추출 작업 단위
+
+    Args:
+        kind: 작업 종류 ('video', 'image', 'audio' 등)
+        func: 워커 스레드에서 실행할 함수
+        args, kwargs: func 인자
+        priority: 작을수록 먼저 실행 (같은 값이면 제출 순서, FIFO)
+        description: 로그/상태 표시용 설명
+        on_done: 작업 종료(완료/실패/취소) 후 워커 스레드에서 호출되는 콜백(job)
+
+    각 작업은 자신의 cancel_token 을 가지므로 다른 작업에 영향 없이 개별 취소할 수 있다.
+    """
+
+    _id_counter = itertools.count(1)
+
+    def __init__(self, kind, func, args=(), kwargs=None, priority=0, description="",
+                 on_done=None):
+        self.job_id = next(ExtractionJob._id_counter)
+        self.kind = kind
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs or {}
+        self.priority = priority
+        self.description = description
+        self.on_done = on_done
+
+        self.status = JobStatus.PENDING
+        self.result = None
+        self.error = None
+        self.cancel_token = CancelToken()
+
+        # 시간 정보 (time.monotonic 기준)
+        self.submitted_at = time.monotonic()
+        self.started_at = None
+        self.finished_at = None
+
+    def is_finished(self):
+        """완료/실패/취소 여부"""
+        return self.status in (JobStatus.DONE, JobStatus.FAILED, JobStatus.CANCELLED)
+
+    def cancel(self):
+        """작업 취소 - 대기 중이면 실행하지 않고, 실행 중이면 취소 토큰 설정"""
+        self.cancel_token.cancel()
+
+    @property
+    def wait_time(self):
+        """대기열에서 기다린 시간(초)"""
+        end = self.started_at if self.started_at is not None else time.monotonic()
+        return end - self.submitted_at
+
+    @property
+    def run_time(self):
+        """실행 시간(초) - 시작 전이면 None"""
+        if self.started_at is None:
+            return None
+        end = self.finished_at if self.finished_at is not None else time.monotonic()
+        return end - self.started_at
+
+    def __repr__(self):
+        return f"<ExtractionJob #{self.job_id} {self.kind} {self.status} {self.description!r}>"
+
+
+class ExtractionScheduler:
+    """크기가 제한된 워커 풀 + 우선순위(FIFO) 대기열 기반 추출 작업 스케줄러
+
+    워커 스레드는 작업이 제출될 때 필요한 만큼만 만들어지며 max_workers 를 넘지 않는다.
+    """
+
+    # ffmpeg(libx264) 작업 하나가 효율적으로 쓰는 코어 수 - 기본 동시 작업 수 계산용
+    FFMPEG_THREADS_PER_JOB = 4
+    # 코어가 아주 많아도 디스크 I/O 경합을 막기 위한 상한
+    MAX_DEFAULT_WORKERS = 8
+
+    def __init__(self, max_workers=None, ffmpeg_threads=None):
+        self.max_workers = max_workers or ExtractionScheduler.default_worker_count(
+            ffmpeg_threads)
+        self._queue = queue.PriorityQueue()
+        self._sequence = itertools.count()
+        self._jobs = {}
+        self._workers = []
+        self._lock = threading.Lock()
+        self._idle_workers = 0
+
+    @staticmethod
+    def default_worker_count(ffmpeg_threads=None):
+        """CPU 코어 수와 ffmpeg 작업당 스레드 사용량으로 기본 동시 작업 수 계산"""
+        cpu_count = os.cpu_count() or 1
+        threads_per_job = max(
+            1, ffmpeg_threads or ExtractionScheduler.FFMPEG_THREADS_PER_JOB)
+        return max(1, min(cpu_count // threads_per_job,
+                          ExtractionScheduler.MAX_DEFAULT_WORKERS))
+
+    # ======== 공개 API ========
+
+    def submit(self, job):
+        """작업을 대기열에 추가하고 job 반환"""
+        with self._lock:
+            self._jobs[job.job_id] = job
+            self._queue.put((job.priority, next(self._sequence), job))
+            # 대기 작업이 쉬고 있는 워커보다 많으면 한도 안에서 새 워커 생성
+            if self._queue.qsize() > self._idle_workers and len(self._workers) < self.max_workers:
+                worker = threading.Thread(
+                    target=self._worker_loop,
+                    name=f"extract-worker-{len(self._workers) + 1}",
+                    daemon=True)
+                self._workers.append(worker)
+                worker.start()
+        print(f"[Scheduler] 작업 제출: {job} (대기 {self.pending_count()}개)")
+        return job
+
+    def get_job(self, job_id):
+        """작업 ID로 작업 조회"""
+        return self._jobs.get(job_id)
+
+    def jobs(self, kind=None):
+        """(종류별) 전체 작업 목록"""
+        with self._lock:
+            return [job for job in self._jobs.values()
+                    if kind is None or job.kind == kind]
+
+    def pending_count(self, kind=None):
+        """대기 중인 작업 수"""
+        return sum(1 for job in self.jobs(kind) if job.status == JobStatus.PENDING)
+
+    def running_count(self, kind=None):
+        """실행 중인 작업 수"""
+        return sum(1 for job in self.jobs(kind) if job.status == JobStatus.RUNNING)
+
+    def is_busy(self, kind=None):
+        """대기 또는 실행 중인 작업이 있는지 확인"""
+        return any(not job.is_finished() for job in self.jobs(kind))
+
+    def cancel(self, job_id):
+        """작업 하나 취소. 대기 중이면 바로 취소 상태로, 실행 중이면 토큰으로 중단 요청
+
+        Returns:
+            bool: 취소 요청 여부 (이미 끝난 작업이거나 없으면 False)
+        """
+        job = self.get_job(job_id)
+        if not job or job.is_finished():
+            return False
+
+        job.cancel()
+        with self._lock:
+            was_pending = job.status == JobStatus.PENDING
+            if was_pending:
+                job.status = JobStatus.CANCELLED
+                job.finished_at = time.monotonic()
+        if was_pending:
+            # 대기 중이던 작업은 워커가 꺼낼 때 건너뛰므로 여기서 종료 콜백 호출
+            self._notify_done(job)
+        return True
+
+    def cancel_all(self, kind=None):
+        """(종류별) 대기/실행 중인 모든 작업 취소. 취소 요청한 작업 목록 반환"""
+        return [job for job in self.jobs(kind)
+                if not job.is_finished() and self.cancel(job.job_id)]
+
+    def clear_finished(self):
+        """끝난 작업 기록 정리"""
+        with self._lock:
+            for job_id in [job_id for job_id, job in self._jobs.items() if job.is_finished()]:
+                del self._jobs[job_id]
+
+    # ======== 워커 ========
+
+    def _worker_loop(self):
+        """대기열에서 작업을 하나씩 꺼내 실행"""
+        while True:
+            with self._lock:
+                self._idle_workers += 1
+            _, _, job = self._queue.get()
+            with self._lock:
+                self._idle_workers -= 1
+                if job.status != JobStatus.PENDING:
+                    # 대기 중 취소된 작업
+                    self._queue.task_done()
+                    continue
+                job.status = JobStatus.RUNNING
+                job.started_at = time.monotonic()
+
+            try:
+                job.result = job.func(*job.args, **job.kwargs)
+                job.status = (JobStatus.CANCELLED if job.cancel_token.is_set()
+                              else JobStatus.DONE)
+            except Exception as e:
+                job.error = e
+                job.status = JobStatus.FAILED
+                print(f"[Scheduler] 작업 실패: {job} - {e}")
+            finally:
+                job.finished_at = time.monotonic()
+                print(f"[Scheduler] 작업 종료: {job} "
+                      f"(대기 {job.wait_time:.1f}초, 실행 {job.run_time:.1f}초)")
+                self._notify_done(job)
+                self._queue.task_done()
+
+    @staticmethod
+    def _notify_done(job):
+        """작업 종료 콜백 호출 (콜백 오류는 로그만 남김)"""
+        if job.on_done:
+            try:
+                job.on_done(job)
+            except Exception as e:
+                print(f"[Scheduler] 종료 콜백 오류: {job} - {e}")
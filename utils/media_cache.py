@@ -0,0 +1,51 @@
+import os
+import hashlib
+import tempfile
+
+
+class MediaCache:
+    """미디어 파일별 분석 결과(키프레임 인덱스 등)를 저장하는 공용 캐시 폴더
+
+    캐시 파일 이름은 경로 + 크기 + 수정 시각으로 만든 지문이라, 파일이 바뀌면
+    자동으로 새로 만들어진다. 위치는 VIDEO_EDITOR_CACHE_DIR 환경 변수로 바꿀 수 있다.
+    """
+
+    ENV_VAR = 'VIDEO_EDITOR_CACHE_DIR'
+    APP_DIR = 'VideoPlayer'
+
+    @staticmethod
+    def cache_dir():
+        """캐시 폴더 경로 (없으면 생성)"""
+        base = os.environ.get(MediaCache.ENV_VAR)
+        if not base:
+            root = (os.environ.get('LOCALAPPDATA') or os.environ.get('XDG_CACHE_HOME')
+                    or os.path.join(os.path.expanduser('~'), '.cache'))
+            base = os.path.join(root, MediaCache.APP_DIR, 'cache')
+        os.makedirs(base, exist_ok=True)
+        return base
+
+    @staticmethod
+    def fingerprint(media_path):
+        """경로 + 크기 + 수정 시각 기반 지문 (파일이 없으면 OSError)"""
+        stat = os.stat(media_path)
+        key = f"{os.path.normcase(os.path.abspath(media_path))}|{stat.st_size}|{stat.st_mtime_ns}"
+        return hashlib.sha1(key.encode('utf-8')).hexdigest()[:24]
+
+    @staticmethod
+    def path_for(media_path, suffix):
+        """media_path 에 대한 캐시 파일 경로 (suffix 예: '.index.npy')"""
+        return os.path.join(MediaCache.cache_dir(), MediaCache.fingerprint(media_path) + suffix)
+
+    @staticmethod
+    def write_atomic(cache_path, write_fn):
+        """임시 파일에 write_fn(file) 로 쓴 뒤 교체 - 쓰다 만 캐시를 남기지 않음"""
+        folder = os.path.dirname(cache_path)
+        fd, tmp_path = tempfile.mkstemp(dir=folder, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                write_fn(f)
+            os.replace(tmp_path, cache_path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
@@ -1,5 +1,4 @@
 import os
-import cv2
 import tkinter as tk
 from tkinter import messagebox
 from PIL import Image, ImageTk
@@ -100,6 +99,10 @@ def show_custom_messagebox(parent, title, message, msg_type="info", auto_close_m
 
 class VideoUtils:
     """비디오 관련 유틸리티 클래스"""
+
+    # FFmpegManager 탐색 결과 (처음 한 번만 탐색 - 구간 선택마다 ffmpeg -version 실행 방지)
+    _ffmpeg_path = None
+
     @staticmethod
     def format_time(seconds):
         '''초를 mm:ss 형식으로 변환하는 함수 '''
@@ -112,27 +115,29 @@ class VideoUtils:
         return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
 
     @staticmethod
-    def get_opencv_video_info(video_path):
-        """OpenCV로 비디오 정보 가져오기 - 메인탭 오른쪽 상단 정보 표시"""
-        try:
-            cap = cv2.VideoCapture(video_path)
-            if not cap.isOpened():
-                return None
-
-            video_info = {
-                'duration': cap.get(cv2.CAP_PROP_FRAME_COUNT) / cap.get(cv2.CAP_PROP_FPS),
-                'fps': cap.get(cv2.CAP_PROP_FPS),
-                'width': int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
-                'height': int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
-                'frame_count': int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-            }
+    def _ffmpeg_executable():
+        """FFmpegManager 가 찾은 FFmpeg 경로 (같은 폴더의 ffprobe 사용, 못 찾으면 'ffmpeg')"""
+        if VideoUtils._ffmpeg_path is None:
+            from .ffmpeg_manager import FFmpegManager
+            VideoUtils._ffmpeg_path = FFmpegManager().ffmpeg_path or 'ffmpeg'
+        return VideoUtils._ffmpeg_path
 
-            cap.release()
-            return video_info
+    @staticmethod
+    def get_opencv_video_info(video_path):
+        """비디오 정보 가져오기 - 메인탭 오른쪽 상단 정보 표시 (MediaProbe 캐시 사용)"""
+        from .extract.media_probe import MediaProbe
 
-        except Exception as e:
-            print(f"OpenCV 비디오 정보 가져오기 실패: {e}")
+        info = MediaProbe.probe(video_path, VideoUtils._ffmpeg_executable())
+        if info is None or info.width <= 0:
+            print(f"비디오 정보 가져오기 실패: {video_path}")
             return None
+        return {
+            'duration': info.duration,
+            'fps': info.fps,
+            'width': info.width,
+            'height': info.height,
+            'frame_count': info.frame_count
+        }
 
     @staticmethod
     def get_video_path_from_app(app_instance):
@@ -143,59 +148,28 @@ class VideoUtils:
 
     @staticmethod
     def get_file_info(file_path):
-        """파일 정보 가져오기 - new_tab/추출탭의 중간 프레임 부분"""
-        try:
-            cap = cv2.VideoCapture(file_path)
-            if not cap.isOpened():
-                return None, "비디오 파일을 열 수 없습니다."
+        """파일 정보 가져오기 - new_tab/추출탭의 중간 프레임 부분 (MediaProbe 캐시 사용)"""
+        from .extract.media_probe import MediaProbe
 
-            props = {
-                'fps': cap.get(cv2.CAP_PROP_FPS),
-                'frame_count': int(cap.get(cv2.CAP_PROP_FRAME_COUNT)),
-                'width': int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
-                'height': int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
-                'length': cap.get(cv2.CAP_PROP_FRAME_COUNT) / cap.get(cv2.CAP_PROP_FPS)
-            }
-
-            file_stats = os.stat(file_path)
-            file_info = {
-                'video_props': props,
-                'file_name': os.path.basename(file_path),
-                'file_path': file_path,
-                'file_size': f"{file_stats.st_size / (1024*1024):.1f} MB"
-            }
-
-            cap.release()
-            return file_info, None
-
-        except Exception as e:
-            return None, f"파일 정보 오류: {str(e)}"
-
-    @staticmethod
-    def get_file_info(file_path):
-        """파일 정보 가져오기 - new_tab/추출탭의 중간 프레임 부분"""
         try:
-            cap = cv2.VideoCapture(file_path)
-            if not cap.isOpened():
+            info = MediaProbe.probe(file_path, VideoUtils._ffmpeg_executable())
+            if info is None or info.width <= 0:
                 return None, "비디오 파일을 열 수 없습니다."
 
             props = {
-                'fps': cap.get(cv2.CAP_PROP_FPS),
-                'frame_count': int(cap.get(cv2.CAP_PROP_FRAME_COUNT)),
-                'width': int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
-                'height': int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
-                'length': cap.get(cv2.CAP_PROP_FRAME_COUNT) / cap.get(cv2.CAP_PROP_FPS)
+                'fps': info.fps,
+                'frame_count': info.frame_count,
+                'width': info.width,
+                'height': info.height,
+                'length': info.duration
             }
 
-            file_stats = os.stat(file_path)
             file_info = {
                 'video_props': props,
                 'file_name': os.path.basename(file_path),
                 'file_path': file_path,
-                'file_size': f"{file_stats.st_size / (1024*1024):.1f} MB"
+                'file_size': f"{info.file_size / (1024*1024):.1f} MB"
             }
-
-            cap.release()
             return file_info, None
 
         except Exception as e:
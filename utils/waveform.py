@@ -0,0 +1,198 @@
+import threading
+import subprocess
+import numpy as np
+from utils.media_cache import MediaCache
+
+
+class WaveformEnvelope:
+    """오디오 트랙의 파형 요약 (구간별 최소/최대/RMS)
+
+    ffmpeg 로 낮은 샘플레이트(모노 8kHz)로 한 번만 디코딩해 WINDOW_SECONDS 구간마다
+    최소/최대/RMS 를 NumPy 로 계산하고, 공용 캐시 폴더(MediaCache)에 작은 .npy 로 저장한다.
+    그리기용으로 2배씩 합친 단계(피라미드)를 메모리에 만들어 두므로, 어떤 확대 수준이든
+    픽셀 수에 비례하는 계산만으로 화면 폭에 맞는 값을 얻는다 (다시 디코딩하지 않음).
+    """
+
+    SAMPLE_RATE = 8000
+    WINDOW_SECONDS = 0.025
+    WINDOW = int(SAMPLE_RATE * WINDOW_SECONDS)
+    # 한 번에 읽을 구간 수 (약 10초 분량)
+    CHUNK_WINDOWS = 400
+    # 캐시 형식이 바뀌면 버전을 올려 이전 캐시를 무시
+    CACHE_SUFFIX = '.envelope.v1.npy'
+    DTYPE = np.dtype([('min', '<i2'), ('max', '<i2'), ('rms', '<i2')])
+
+    _loaded = {}
+    _lock = threading.Lock()
+
+    def __init__(self, windows):
+        self.windows = windows
+        self.rate = 1.0 / WaveformEnvelope.WINDOW_SECONDS
+        # 피라미드 단계 k: 기본 구간 2^k 개를 합친 (최소, 최대, 제곱 평균)
+        level = (windows['min'].astype(np.float32) / 32768.0,
+                 windows['max'].astype(np.float32) / 32768.0,
+                 np.square(windows['rms'].astype(np.float32) / 32768.0))
+        self.levels = [level]
+        while len(level[0]) > 1:
+            if len(level[0]) % 2:
+                # 홀수 개면 마지막 값을 한 번 더 써서 짝을 맞춤
+                level = tuple(np.append(values, values[-1]) for values in level)
+            mins, maxs, squares = (values.reshape(-1, 2) for values in level)
+            level = (mins.min(axis=1), maxs.max(axis=1), squares.mean(axis=1))
+            self.levels.append(level)
+
+    @property
+    def duration(self):
+        return len(self.windows) * WaveformEnvelope.WINDOW_SECONDS
+
+    @staticmethod
+    def cached(input_path):
+        """메모리/디스크 캐시에 있는 파형 요약 (없으면 디코딩하지 않고 None)"""
+        try:
+            fingerprint = MediaCache.fingerprint(input_path)
+        except OSError:
+            return None
+
+        with WaveformEnvelope._lock:
+            envelope = WaveformEnvelope._loaded.get(fingerprint)
+        if envelope is not None:
+            return envelope
+
+        try:
+            windows = np.load(MediaCache.path_for(input_path, WaveformEnvelope.CACHE_SUFFIX),
+                              allow_pickle=False)
+        except (OSError, ValueError):
+            return None
+        if windows.dtype != WaveformEnvelope.DTYPE:
+            return None
+        envelope = WaveformEnvelope(windows)
+        with WaveformEnvelope._lock:
+            WaveformEnvelope._loaded[fingerprint] = envelope
+        return envelope
+
+    @staticmethod
+    def load(input_path, ffmpeg_executable='ffmpeg', cancel_event=None):
+        """파일의 파형 요약 (메모리 → 디스크 캐시 → ffmpeg 디코딩 순)
+
+        오디오가 없거나 디코딩에 실패/취소되면 None.
+        """
+        envelope = WaveformEnvelope.cached(input_path)
+        if envelope is not None:
+            return envelope
+
+        try:
+            fingerprint = MediaCache.fingerprint(input_path)
+        except OSError:
+            return None
+        # 디코딩은 수 초 이상 걸릴 수 있으므로 잠금 밖에서
+        windows = WaveformEnvelope._decode(input_path, ffmpeg_executable, cancel_event)
+        if windows is None:
+            return None
+        try:
+            MediaCache.write_atomic(
+                MediaCache.path_for(input_path, WaveformEnvelope.CACHE_SUFFIX),
+                lambda f: np.save(f, windows, allow_pickle=False))
+        except OSError as e:
+            print(f"[WaveformEnvelope] 캐시 저장 실패: {e}")
+
+        envelope = WaveformEnvelope(windows)
+        with WaveformEnvelope._lock:
+            WaveformEnvelope._loaded[fingerprint] = envelope
+        return envelope
+
+    @staticmethod
+    def _decode(input_path, ffmpeg_executable='ffmpeg', cancel_event=None):
+        """첫 오디오 스트림 전체의 구간별 (최소, 최대, RMS) 배열 (없거나 취소되면 None)"""
+        print(f"[WaveformEnvelope] 파형 생성: {input_path}")
+        chunks = list(WaveformEnvelope.iter_windows(input_path, ffmpeg_executable, cancel_event))
+        if cancel_event and cancel_event.is_set():
+            return None
+        if not chunks:
+            print("[WaveformEnvelope] 오디오 스트림이 없거나 디코딩에 실패했습니다.")
+            return None
+        return np.concatenate(chunks)
+
+    @staticmethod
+    def iter_windows(input_path, ffmpeg_executable='ffmpeg', cancel_event=None):
+        """ffmpeg 파이프로 첫 오디오 스트림을 읽어 구간별 (최소, 최대, RMS) 묶음을 차례로 생성
+
+        고정 크기 버퍼 하나에 readinto 로 읽으므로 파일 길이와 상관없이 메모리 사용량이 일정하다.
+        묶음 하나는 최대 CHUNK_WINDOWS 구간 (DTYPE 구조화 배열).
+        """
+        command = [
+            ffmpeg_executable, '-v', 'error', '-nostdin',
+            '-i', input_path,
+            '-map', '0:a:0', '-vn', '-sn',
+            '-ac', '1', '-ar', str(WaveformEnvelope.SAMPLE_RATE),
+            '-f', 's16le', 'pipe:1'
+        ]
+        try:
+            process = subprocess.Popen(
+                command, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL)
+        except OSError as e:
+            print(f"[WaveformEnvelope] ffmpeg 실행 실패: {e}")
+            return
+
+        window = WaveformEnvelope.WINDOW
+        buffer = np.empty(WaveformEnvelope.CHUNK_WINDOWS * window, dtype='<i2')
+        view = memoryview(buffer).cast('B')
+        try:
+            while not (cancel_event and cancel_event.is_set()):
+                filled = 0
+                while filled < len(view):
+                    n = process.stdout.readinto(view[filled:])
+                    if not n:
+                        break
+                    filled += n
+                samples = buffer[:filled // 2]
+                if len(samples) >= window:
+                    # 끝의 한 구간보다 짧은 자투리는 버림 (25ms 미만)
+                    frames = samples[:len(samples) // window * window].reshape(-1, window)
+                    rms = np.sqrt(np.mean(np.square(frames, dtype=np.float32), axis=1))
+                    chunk = np.empty(len(frames), dtype=WaveformEnvelope.DTYPE)
+                    chunk['min'] = frames.min(axis=1)
+                    chunk['max'] = frames.max(axis=1)
+                    chunk['rms'] = np.minimum(rms, 32767)
+                    yield chunk
+                if filled < len(view):
+                    break
+        finally:
+            process.stdout.close()
+            if process.poll() is None:
+                process.kill()
+            process.wait()
+
+    def columns(self, width, start_time=0.0, end_time=None):
+        """[start_time, end_time] 를 width 개 열로 나눈 (최소, 최대, RMS) - 값 범위 -1~1
+
+        한 열이 기본 구간 여러 개를 덮으면 2~4개 값만 합치면 되는 피라미드 단계를 골라
+        계산량이 구간 길이와 상관없이 열 수에 비례한다.
+        """
+        width = int(width)
+        if width <= 0:
+            empty = np.zeros(0, np.float32)
+            return empty, empty, empty
+        if end_time is None:
+            end_time = self.duration
+        first = max(0.0, start_time * self.rate)
+        last = max(first, min(len(self.windows), end_time * self.rate))
+        per_column = (last - first) / width
+        level_index = 0
+        if per_column >= 2:
+            level_index = min(int(np.log2(per_column)), len(self.levels) - 1)
+        mins, maxs, squares = self.levels[level_index]
+        scale = 2 ** level_index
+
+        edges = np.linspace(first / scale, last / scale, width + 1)
+        starts = np.minimum(edges[:-1].astype(np.int64), len(mins) - 1)
+        # 확대해서 한 열이 구간 하나보다 좁으면 같은 값을 여러 열에 그림
+        ends = np.clip(np.ceil(edges[1:]).astype(np.int64), starts + 1, len(mins))
+        # [시작, 끝) 쌍을 번갈아 넣은 reduceat 의 짝수 번째 결과가 열별 합산값
+        # (끝이 배열 길이와 같아도 되도록 값 하나를 덧붙임)
+        bounds = np.column_stack([starts, ends]).ravel()
+        col_min = np.minimum.reduceat(np.append(mins, 0), bounds)[::2]
+        col_max = np.maximum.reduceat(np.append(maxs, 0), bounds)[::2]
+        col_sq = np.add.reduceat(np.append(squares, 0), bounds)[::2]
+        col_rms = np.sqrt(col_sq / (ends - starts))
+        return col_min, col_max, col_rms